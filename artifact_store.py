@@ -0,0 +1,202 @@
+import os
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# Total size of generated / translated resumes kept in memory per process
+ARTIFACT_MEMORY_BYTES = int(os.getenv('CARA_ARTIFACT_MEMORY_BYTES', str(64 * 1024 * 1024)))
+
+# Directory for artifacts pushed out of memory (set CARA_ARTIFACT_SPILL_DIR="" to drop them instead)
+ARTIFACT_SPILL_DIR = os.getenv(
+    'CARA_ARTIFACT_SPILL_DIR',
+    os.path.join(tempfile.gettempdir(), 'cara-artifacts')
+)
+
+# Disk space the spilled artifacts of one process may take before the least recently used are deleted
+ARTIFACT_SPILL_BYTES = int(os.getenv('CARA_ARTIFACT_SPILL_BYTES', str(512 * 1024 * 1024)))
+
+# Spilled files older than this (seconds) are left from earlier runs - deleted on the first spill
+ARTIFACT_SPILL_MAX_AGE = int(os.getenv('CARA_ARTIFACT_SPILL_MAX_AGE', str(24 * 3600)))
+
+
+class Artifact:
+    """An immutable generated document - its bytes are addressed by their sha256 hash"""
+    __slots__ = ("key", "filename", "media_type", "size")
+
+    def __init__(self, key, filename, media_type, size):
+        self.key = key
+        self.filename = filename
+        self.media_type = media_type
+        self.size = size
+
+    @property
+    def etag(self):
+        return f'"{self.key}"'
+
+
+class ArtifactStore:
+    """
+    Content-addressed store for generated resumes.
+
+    The bytes of each document are kept once, whatever the number of sessions
+    that produced the same content. When the stored bytes grow past
+    `max_bytes`, the least recently used documents are moved to `spill_dir`
+    (or dropped when spilling is disabled) and read back from there on the
+    next access.
+
+    Spill files are written by a background thread, outside the lock, and
+    the files of this process are kept within `max_spill_bytes` (least
+    recently used deleted first). Files older than `max_spill_age` - left by
+    earlier runs - are deleted on the first spill.
+    """
+    def __init__(self, max_bytes=ARTIFACT_MEMORY_BYTES, spill_dir=ARTIFACT_SPILL_DIR,
+                 max_spill_bytes=ARTIFACT_SPILL_BYTES, max_spill_age=ARTIFACT_SPILL_MAX_AGE):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self.max_spill_bytes = max_spill_bytes
+        self.max_spill_age = max_spill_age
+        self._memory = OrderedDict()  # key -> bytes
+        self._memory_bytes = 0
+        self._spilling = {}           # key -> bytes waiting to be written to the spill directory
+        self._spilled = OrderedDict() # key -> size of the spill files of this process
+        self._spilled_bytes = 0
+        self._lock = threading.Lock()
+        self._spill_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cara-artifact-spill")
+        self._cleaned_up = False
+        self.spills = 0
+        self.evictions = 0
+        self.spill_deletions = 0
+
+    def put(self, content, filename, media_type):
+        """Store a document (str or bytes) and return its Artifact handle"""
+        data = content.encode('utf-8') if isinstance(content, str) else bytes(content)
+        key = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+            else:
+                self._memory[key] = data
+                self._memory_bytes += len(data)
+                self._shrink()
+        return Artifact(key, filename, media_type, len(data))
+
+    def _spill_path(self, key):
+        return os.path.join(self.spill_dir, key)
+
+    def _shrink(self):
+        """Move the least recently used documents out of memory until the budget is met (lock held)"""
+        while self._memory_bytes > self.max_bytes and len(self._memory) > 1:
+            key, data = self._memory.popitem(last=False)
+            self._memory_bytes -= len(data)
+            if self.spill_dir:
+                # Readable from _spilling until the writer thread has written the file
+                self._spilling[key] = data
+                self._spill_writer.submit(self._spill, key, data)
+            else:
+                self.evictions += 1
+
+    def _spill(self, key, data):
+        """Write a document to the spill directory (writer thread, without the lock)"""
+        if not self._cleaned_up:
+            self._cleaned_up = True
+            self._remove_old_spill_files()
+        written = False
+        try:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            path = self._spill_path(key)
+            if not os.path.exists(path):
+                # Write to a temporary name first so readers never see a partial file
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as file:
+                    file.write(data)
+                os.replace(tmp_path, path)
+            written = True
+        except OSError:
+            pass
+
+        with self._lock:
+            self._spilling.pop(key, None)
+            if not written:
+                self.evictions += 1
+                return
+            self.spills += 1
+            if key not in self._spilled:
+                self._spilled[key] = len(data)
+                self._spilled_bytes += len(data)
+            self._spilled.move_to_end(key)
+            stale = []
+            while self._spilled_bytes > self.max_spill_bytes and len(self._spilled) > 1:
+                stale_key, size = self._spilled.popitem(last=False)
+                self._spilled_bytes -= size
+                stale.append(stale_key)
+            self.spill_deletions += len(stale)
+        for stale_key in stale:
+            try:
+                os.remove(self._spill_path(stale_key))
+            except OSError:
+                pass
+
+    def _remove_old_spill_files(self):
+        """Delete the spill files (and partial writes) of earlier runs"""
+        oldest = time.time() - self.max_spill_age
+        try:
+            entries = list(os.scandir(self.spill_dir))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < oldest:
+                    os.remove(entry.path)
+                    self.spill_deletions += 1
+            except OSError:
+                pass
+
+    def get_bytes(self, key):
+        """Return the bytes of a document, or None if it is no longer available"""
+        with self._lock:
+            data = self._memory.get(key)
+            if data is not None:
+                self._memory.move_to_end(key)
+                return data
+            data = self._spilling.get(key)
+            if data is not None:
+                return data
+            if key in self._spilled:
+                self._spilled.move_to_end(key)
+
+        if not self.spill_dir:
+            return None
+        try:
+            with open(self._spill_path(key), 'rb') as file:
+                data = file.read()
+        except OSError:
+            return None
+        if hashlib.sha256(data).hexdigest() != key:
+            return None
+        return data
+
+    def get_text(self, artifact):
+        data = self.get_bytes(artifact.key)
+        return data.decode('utf-8') if data is not None else None
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            return {
+                "entries": len(self._memory),
+                "bytes": self._memory_bytes,
+                "max_bytes": self.max_bytes,
+                "spill_dir": self.spill_dir or None,
+                "spills": self.spills,
+                "evictions": self.evictions,
+                "spilled_bytes": self._spilled_bytes,
+                "max_spill_bytes": self.max_spill_bytes,
+                "spill_deletions": self.spill_deletions,
+            }
+
+
+# Shared store used by the API
+artifact_store = ArtifactStore()
@@ -0,0 +1,137 @@
+"""
+Benchmark of the single-pass HTML post-processor against the previous
+implementation (whole-document str.replace passes with a temp file
+read / write between the stages and the stylesheet spliced in unminified,
+as EnhancedResumeBuilder used to do).
+
+    python benchmark_html_postprocessor.py --sections 50 100 400 --repeat 30
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+import statistics
+from html_postprocessor import (
+    postprocess_resume_html, wrap_html_document, EDITING_SCRIPT_MARKER, PRINT_BUTTON, EDITABLE_BLOCKS
+)
+from resume_assets import RESUME_CSS, EDITING_JS
+
+# The baseline built these strings on every request
+ENHANCED_STYLES = RESUME_CSS
+DEFAULT_STYLES = f"<style>{RESUME_CSS}</style>\n\n<head>"
+EDITING_SCRIPT = f"\n<script>{EDITING_JS}</script>\n"
+
+
+def legacy_postprocess(html_content, resume_style, full_name, job_role):
+    """The previous multi-pass pipeline, kept here as the benchmark baseline"""
+    path = os.path.join(tempfile.gettempdir(), f"cara_benchmark_{os.getpid()}.html")
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(html_content)
+
+    # _enhance_html_resume
+    with open(path, 'r', encoding='utf-8') as file:
+        html_content = file.read()
+    if '<!DOCTYPE html>' not in html_content:
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(wrap_html_document(html_content, full_name, job_role))
+
+    # _apply_additional_styles
+    with open(path, 'r', encoding='utf-8') as file:
+        html_content = file.read()
+    if '<style>' in html_content and '</style>' in html_content:
+        html_content = html_content.replace('</style>', ENHANCED_STYLES + '\n</style>')
+        if '<body' in html_content and resume_style:
+            if 'class=' in html_content:
+                html_content = html_content.replace('<body class="', f'<body class="{resume_style} ')
+            else:
+                html_content = html_content.replace('<body', f'<body class="{resume_style}"')
+            if '<div class="resume-container">' not in html_content:
+                end_body_tag = html_content.find('>', html_content.find('<body')) + 1
+                html_content = html_content[:end_body_tag] + '\n<div class="resume-container">\n' + html_content[end_body_tag:]
+                html_content = html_content.replace('</body>', '</div>\n</body>')
+            if EDITING_SCRIPT_MARKER not in html_content:
+                html_content = html_content.replace('</body>', f'{EDITING_SCRIPT}\n</body>')
+        for block in EDITABLE_BLOCKS:
+            tag = f'<div class="{block}">'
+            if tag in html_content:
+                html_content = html_content.replace(tag, f'<div class="{block}" contenteditable="true">')
+    else:
+        html_content = html_content.replace("<head>", DEFAULT_STYLES)
+        if '<body' in html_content and resume_style:
+            if 'class=' in html_content:
+                html_content = html_content.replace('<body class="', f'<body class="{resume_style} ')
+            else:
+                html_content = html_content.replace('<body', f'<body class="{resume_style}"')
+        end_body_tag = html_content.find('>', html_content.find('<body')) + 1
+        html_content = html_content[:end_body_tag] + '\n<div class="resume-container">\n' + html_content[end_body_tag:]
+        html_content = html_content.replace('</body>', f'</div>\n{PRINT_BUTTON}\n</body>')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(html_content)
+
+    # generate_resume read the file back once more
+    with open(path, 'r', encoding='utf-8') as file:
+        result = file.read()
+    os.remove(path)
+    return result
+
+
+def sample_resume(sections):
+    """A generated-looking resume with the given number of experience sections"""
+    items = []
+    for index in range(sections):
+        items.append(f"""
+    <div class="section">
+        <h2>Experience {index}</h2>
+        <div class="experience-item">
+            <div class="job-position">Senior Engineer</div>
+            <span class="job-date">2019 - 2023</span>
+            <ul>
+                <li>Led the migration of {index} services to a new platform, reducing costs by 30%</li>
+                <li>Mentored engineers and introduced code review practices</li>
+            </ul>
+        </div>
+    </div>""")
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Jane Doe - Engineer</title>
+    <style>
+    </style>
+</head>
+<body>
+    <div class="resume-header"><h1>Jane Doe</h1></div>
+    <div class="summary"><p>Engineer with a track record of shipping reliable systems.</p></div>
+    {''.join(items)}
+</body>
+</html>"""
+
+
+def measure(func, document, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(document, "modern", "Jane Doe", "Engineer")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the resume HTML post-processor")
+    parser.add_argument("--sections", type=int, nargs="+", default=[10, 100, 500, 2000],
+                        help="Resume sizes to test (number of experience sections)")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args(argv)
+
+    print(f"{'sections':>8} {'size':>10} {'legacy (ms)':>12} {'single pass (ms)':>17} {'speedup':>8}")
+    for sections in args.sections:
+        document = sample_resume(sections)
+        legacy = measure(legacy_postprocess, document, args.repeat)
+        single_pass = measure(postprocess_resume_html, document, args.repeat)
+        print(f"{sections:>8} {len(document):>10} {legacy * 1000:>12.3f} {single_pass * 1000:>17.3f} {legacy / single_pass:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+Benchmark of section-parallel resume generation against the single-call
+path. Both paths build the same prompts as the API and end with a
+validated ResumeDocument rendered through the HTML post-processor; the
+p50 / p95 wall-clock latency of each is reported.
+
+    python benchmark_section_generation.py --runs 10          # real API calls (OPENAI_API_KEY)
+    python benchmark_section_generation.py --simulate --runs 50
+
+--simulate runs without the API: every request takes a time-to-first-token
+plus a per-output-token delay (with random jitter), and returns a canned
+JSON reply of realistic size, so the two paths can be compared offline.
+"""
+import sys
+import json
+import time
+import types
+import random
+import asyncio
+import argparse
+import statistics
+import llm_gateway
+from llm_cache import response_cache
+from main import EnhancedResumeBuilder
+from resume_document import parse_resume_document
+from resume_renderer import render_resume
+from html_postprocessor import postprocess_resume_html
+from section_generation import generate_resume_document
+
+SAMPLE_ANSWERS = {
+    "full_name": "Jane Doe",
+    "email": "jane@example.com",
+    "phone": "+972-50-000-0000",
+    "location": "Tel Aviv, Israel",
+    "linkedin": "linkedin.com/in/janedoe",
+    "summary": "Backend engineer with 6 years of experience building payment and data platforms.",
+    "job_history": (
+        "Senior Backend Engineer at Paylane, 2021 - Present. Led the ledger service rewrite, "
+        "on-call lead for the payments team.\n\n"
+        "Backend Engineer at Datanest, 2018 - 2021. Built ingestion pipelines in Go and Kafka.\n\n"
+        "Junior Developer at Webworks, 2017 - 2018. Maintained Django sites for small businesses."
+    ),
+    "achievements": "Cut ledger reconciliation time from 6 hours to 20 minutes. Reduced cloud costs by 30%.",
+    "technical_impact": "Introduced contract tests across 40 services; mentored 5 engineers.",
+    "education": "BSc Computer Science, Tel Aviv University, 2013 - 2017.",
+    "certifications": "AWS Certified Solutions Architect - Associate (2022).",
+    "technical_skills": "Python, Go, PostgreSQL, Kafka, Kubernetes, AWS, Terraform.",
+    "soft_skills": "Mentoring, incident leadership, cross-team communication.",
+    "domain_knowledge": "Payments, double-entry ledgers, PCI DSS.",
+    "languages": "Hebrew - native, English - fluent.",
+    "projects": "Open source maintainer of a Postgres migration tool (2k stars).",
+}
+
+# Reply sizes in the simulation - a generated resume of the sample answers
+_SIMULATED_DOCUMENT = {
+    "header": {"full_name": "Jane Doe", "job_title": "Senior Backend Engineer", "email": "jane@example.com",
+               "phone": "+972-50-000-0000", "location": "Tel Aviv, Israel", "linkedin": "linkedin.com/in/janedoe"},
+    "summary": "Backend engineer with six years of experience designing payment and data platforms. " * 3,
+    "experience": [
+        {"position": f"Engineer {index}", "company": "Company", "location": "Tel Aviv", "dates": "2018 - 2021",
+         "achievements": ["Designed and shipped a service that improved reliability by 30% for all customers"] * 5}
+        for index in range(3)
+    ],
+    "education": [{"degree": "BSc Computer Science", "institution": "Tel Aviv University", "dates": "2013 - 2017",
+                   "details": ["Graduated with honors"]}],
+    "skills": ["Python", "Go", "PostgreSQL", "Kafka", "Kubernetes", "AWS", "Terraform", "Mentoring"],
+    "languages": [{"language": "Hebrew", "proficiency": "Native"}, {"language": "English", "proficiency": "Fluent"}],
+    "additional": "Maintainer of an open source Postgres migration tool with 2k stars. " * 2,
+}
+
+
+def sample_builder(job_role="Backend Engineer", resume_level="mid-level"):
+    """A builder with every interview question answered"""
+    builder = EnhancedResumeBuilder()
+    builder.job_role = job_role
+    builder.resume_level = resume_level
+    builder.user_data.update(SAMPLE_ANSWERS)
+    builder.questions = builder._initialize_questions()
+    return builder
+
+
+def install_simulation(ttft, per_token, jitter):
+    """Replace the LLM calls with delays that follow the reply length"""
+    async def simulated_completion(cache_site=None, **kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        if cache_site == "resume_section":
+            keys = [key for key in _SIMULATED_DOCUMENT if f'"{key}"' in prompt.split("\n\n", 1)[0]]
+            reply = {key: _SIMULATED_DOCUMENT[key] for key in keys}
+            if "experience" in reply:
+                reply["experience"] = reply["experience"][:1]
+            if '"job_title"' in prompt:
+                reply["job_title"] = _SIMULATED_DOCUMENT["header"]["job_title"]
+        else:
+            reply = _SIMULATED_DOCUMENT
+        content = json.dumps(reply)
+        tokens = len(content) / 4
+        await asyncio.sleep((ttft + tokens * per_token) * random.lognormvariate(0, jitter))
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=content))])
+
+    llm_gateway.achat_completion = simulated_completion
+
+
+async def single_call(builder, request, prepare):
+    """The /api/generate-resume path"""
+    _, system_message, user_message = prepare(builder, request)
+    response = await llm_gateway.achat_completion(
+        cache_site="resume_generation",
+        model="gpt-4-turbo-preview",
+        messages=[
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": user_message}
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.7,
+        max_tokens=4000,
+    )
+    return parse_resume_document(response.choices[0].message.content)
+
+
+async def section_parallel(builder, request, prepare):
+    """The generation_mode='sections' path"""
+    return await generate_resume_document(builder, request.style, request.confirmed_skills)
+
+
+def measure(path, builder, request, prepare, runs):
+    timings = []
+    for _ in range(runs):
+        response_cache.clear()
+        start = time.perf_counter()
+        document = asyncio.run(path(builder, request, prepare))
+        postprocess_resume_html(render_resume(document, "html", request.style), request.style)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def percentile(timings, fraction):
+    ordered = sorted(timings)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark section-parallel resume generation")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--simulate", action="store_true", help="Simulated LLM latency instead of API calls")
+    parser.add_argument("--ttft", type=float, default=0.5, help="Simulated time to first token (s)")
+    parser.add_argument("--per-token", type=float, default=0.02, help="Simulated time per output token (s)")
+    parser.add_argument("--jitter", type=float, default=0.15, help="Simulated latency jitter (lognormal sigma)")
+    args = parser.parse_args(argv)
+
+    # The API module builds the single-call prompts
+    from resume_builder_api import ResumeGenerationRequest, _prepare_resume_generation
+
+    if args.simulate:
+        install_simulation(args.ttft, args.per_token, args.jitter)
+    llm_gateway.disk_cache = None
+
+    builder = sample_builder()
+    request = ResumeGenerationRequest(format="html", style="modern", confirmed_skills={})
+
+    print(f"{'path':>16} {'runs':>5} {'p50 (s)':>8} {'p95 (s)':>8} {'mean (s)':>9}")
+    results = {}
+    for name, path in (("single call", single_call), ("section parallel", section_parallel)):
+        timings = measure(path, builder, request, _prepare_resume_generation, args.runs)
+        results[name] = timings
+        print(f"{name:>16} {len(timings):>5} {percentile(timings, 0.5):>8.2f} {percentile(timings, 0.95):>8.2f} "
+              f"{statistics.mean(timings):>9.2f}")
+
+    speedup = percentile(results["single call"], 0.5) / percentile(results["section parallel"], 0.5)
+    print(f"p50 speedup: {speedup:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+Benchmark of the RTL layout transformer against the previous implementation
+(substring match on a list of RTL language names, chained str.replace on
+<html, <body and </head> and a new CSS block appended on every call).
+
+    python benchmark_text_direction.py --sections 10 100 500 --repeat 50
+"""
+import sys
+import time
+import argparse
+import statistics
+from benchmark_html_postprocessor import sample_resume
+from html_postprocessor import postprocess_resume_html
+from text_direction import apply_direction
+from resume_assets import get_bundle
+
+LANGUAGES = ("Hebrew", "Arabic", "French", "Hebrew (beta)")
+
+
+def legacy_apply_direction(content, target_language, is_html=True, resume_style=None):
+    """The previous RTL handling of translate_resume, kept here as the benchmark baseline"""
+    rtl_languages = ['hebrew', 'עברית', 'arabic', 'ערבית', 'farsi', 'פרסית', 'urdu', 'אורדו']
+    if any(lang in target_language.lower() for lang in rtl_languages):
+        if is_html:
+            if '<html' in content:
+                content = content.replace('<html', '<html dir="rtl"', 1)
+            if '<body' in content:
+                content = content.replace('<body', '<body style="text-align: right; direction: rtl;"', 1)
+            if '<html' not in content:
+                content = f'<!DOCTYPE html>\n<html dir="rtl" lang="he">\n<head>\n</head>\n<body>\n{content}\n</body>\n</html>'
+            if '</head>' in content:
+                rtl_bundle = get_bundle(resume_style, rtl=True)
+                content = content.replace('</head>', f'{rtl_bundle.style_block}\n</head>', 1)
+        else:
+            content = f"<כיוון טקסט מימין לשמאל>\n\n{content}"
+    return content
+
+
+def measure(func, document, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for language in LANGUAGES:
+            func(document, language, True, "modern")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the RTL layout transformer")
+    parser.add_argument("--sections", type=int, nargs="+", default=[10, 100, 500, 2000],
+                        help="Resume sizes to test (number of experience sections)")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    print(f"{'sections':>8} {'size':>10} {'legacy (ms)':>12} {'single pass (ms)':>17} {'speedup':>8}")
+    for sections in args.sections:
+        document = postprocess_resume_html(sample_resume(sections), "modern", "Jane Doe", "Engineer")
+        legacy = measure(legacy_apply_direction, document, args.repeat)
+        single_pass = measure(apply_direction, document, args.repeat)
+        print(f"{sections:>8} {len(document):>10} {legacy * 1000:>12.3f} {single_pass * 1000:>17.3f} {legacy / single_pass:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
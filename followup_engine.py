@@ -0,0 +1,134 @@
+"""
+Follow-up questions of the interview.
+
+An answer can open a queue of follow-up prompts - one from the fixed rules
+(missing LinkedIn, work arrangement after the location, missing dates in
+the job history) or the context questions the model suggests. The engine
+keeps one queue per question, merges each follow-up answer into the
+original answer and hands out the next prompt with the same response, so
+the client never has to keep (and echo back) the rest of the queue.
+"""
+from collections import deque, namedtuple
+
+# How a follow-up answer is merged into user_data[original key] ({answer} is the
+# original answer, {followup} the follow-up answer) and the confirmation message
+FollowupType = namedtuple("FollowupType", ["default_key", "merge", "saved_message"])
+
+FOLLOWUP_TYPES = {
+    "linkedin_profiles": FollowupType("linkedin", "{answer}\nOther profiles: {followup}", "LinkedIn follow-up response saved"),
+    "work_arrangement": FollowupType("location", "Location: {answer}\nWork Arrangement: {followup}", "Work arrangement preference saved"),
+    "location": FollowupType("location", "Location: {answer}\nWork Arrangement: {followup}", "Work arrangement preference saved"),
+    "job_details": FollowupType("job_history", "{answer}\n{followup}", "Job details saved"),
+    "professional_context": FollowupType(None, "{answer}\n\nAdditional context: {followup}", "Additional context saved"),
+}
+
+_NO_LINKEDIN_ANSWERS = ['no', 'n', 'none', '', 'dont have one', "don't have one", 'dont have', "don't have", 'i dont have one', 'i dont', 'skip']
+_DATE_WORDS = ['2025','2024','2023', '2022', '2021', '2020', '2019', '2018', '2017', '2016', '2015', '2014', '2013', '2012', '2011', '2010', '2009', '2008', '2007', '2006', '2005', '2004', '2003', '2002', '2001', '2000', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec', 'january', 'february', 'march', 'april', 'june', 'july', 'august', 'september', 'october', 'november', 'december']
+
+# A follow-up prompt waiting in a queue
+Followup = namedtuple("Followup", ["type", "message"])
+
+
+def rule_based_followup(key, answer):
+    """Follow-up of the fixed interview rules (no LLM call), or None"""
+    # For LinkedIn follow-ups
+    if key == 'linkedin':
+        if answer.lower() in _NO_LINKEDIN_ANSWERS:
+            return Followup(
+                "linkedin_profiles",
+                "Do you have any other professional social media profiles you'd like to include? (e.g., GitHub, portfolio website)"
+            )
+
+    # For location follow-ups
+    elif key == 'location':
+        return Followup(
+            "work_arrangement",
+            "What is your preferred work arrangement? (Remote, Hybrid, On-site, or No preference)"
+        )
+
+    # For job history follow-ups (check for missing dates, etc.)
+    elif key == 'job_history':
+        if not any(word in answer.lower() for word in _DATE_WORDS):
+            return Followup(
+                "job_details",
+                "If you accidentally left out any of the details regarding the date range, job title, or company name, it's recommended to add them now for maximum clarity"
+            )
+    return None
+
+
+def context_followups(questions):
+    """Follow-up prompts from the context questions the model suggested"""
+    return [Followup("professional_context", question) for question in questions if question and question.strip()]
+
+
+class FollowupQueue:
+    """The pending follow-up prompts of one question"""
+    def __init__(self, key, prompts=()):
+        self.key = key
+        self.prompts = deque(prompts)
+
+    def prompt(self):
+        """The prompt the client shows now, as sent in API responses (None when the queue is empty)"""
+        if not self.prompts:
+            return None
+        head = self.prompts[0]
+        return {
+            "type": head.type,
+            "message": head.message,
+            "original_key": self.key,
+            "remaining": len(self.prompts) - 1,
+        }
+
+
+class FollowupEngine:
+    """Follow-up queues of one interview session, keyed by the original question key"""
+    def __init__(self):
+        self._queues = {}
+
+    def start(self, key, prompts=()):
+        """A new answer to `key` - replaces its pending follow-ups and returns the new queue"""
+        queue = FollowupQueue(key, prompts)
+        self._queues[key] = queue
+        return queue
+
+    def extend(self, queue, prompts):
+        """
+        Add prompts that arrived later (e.g. from the model) to a queue and return
+        the current prompt of its question. Ignored when the question was answered
+        again in the meantime
+        """
+        if self._queues.get(queue.key) is queue:
+            queue.prompts.extend(prompts)
+        return self.current(queue.key)
+
+    def current(self, key):
+        """The follow-up prompt of a question the client should show (or None)"""
+        queue = self._queues.get(key)
+        return queue.prompt() if queue is not None else None
+
+    def respond(self, user_data, followup_type, followup_answer, original_key=None, question_keys=()):
+        """
+        Merge a follow-up answer into the original answer and move the question's
+        queue forward. Returns (confirmation message, next prompt or None).
+        The typed follow-ups always go to their own question; only context
+        answers name theirs (original_key), which must be one of `question_keys`.
+        Raises KeyError for unknown follow-up types
+        """
+        followup_type_info = FOLLOWUP_TYPES[followup_type]
+        key = followup_type_info.default_key
+        if key is None and isinstance(original_key, str) and original_key in question_keys:
+            key = original_key
+        if not key:
+            return followup_type_info.saved_message, None
+
+        followup_answer = followup_answer.strip()
+        # Context answers are only added to questions that were answered
+        if followup_answer and (followup_type_info.default_key is not None or key in user_data):
+            user_data[key] = followup_type_info.merge.format(answer=user_data.get(key, ""), followup=followup_answer)
+            if followup_type == "linkedin_profiles":
+                user_data["linkedin_followup_asked"] = True
+
+        queue = self._queues.get(key)
+        if queue is not None and queue.prompts and queue.prompts[0].type == followup_type:
+            queue.prompts.popleft()
+        return followup_type_info.saved_message, self.current(key)
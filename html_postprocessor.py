@@ -0,0 +1,148 @@
+"""
+Standalone post-processing of generated HTML resumes.
+
+The document is scanned once: every tag the post-processor cares about
+(style end tags, head / body tags and the editable resume blocks) is found
+by a single regular expression, and the output is assembled from slices of
+the original string and the precompiled style / script bundles (see
+resume_assets) in one join.
+"""
+import re
+from resume_assets import get_bundle
+
+# Wrapper for documents the model returned without the basic HTML structure
+_WRAPPER_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{full_name} - {job_role} Resume</title>
+    <style>
+        /* Base styles */
+        body {{
+            font-family: 'Calibri', 'Helvetica Neue', Arial, sans-serif;
+            line-height: 1.5;
+            color: #333;
+            max-width: 8.5in;
+            margin: 0 auto;
+            padding: 0.5in;
+        }}
+        /* Add default styling if none was provided */
+    </style>
+</head>
+<body>
+"""
+_WRAPPER_TAIL = """
+</body>
+</html>"""
+
+EDITING_SCRIPT_MARKER = "document.addEventListener('DOMContentLoaded'"
+PRINT_BUTTON = '<button class="print-button" onclick="window.print()">Print Resume</button>'
+CONTAINER_OPEN = '\n<div class="resume-container">\n'
+
+# Resume blocks the user can edit in the browser
+EDITABLE_BLOCKS = ("resume-header", "summary", "experience-item", "education-item", "section")
+
+_TOKEN_PATTERN = re.compile(
+    r'</style>|<head>|</body>|<body|<div class="(?:' + "|".join(EDITABLE_BLOCKS) + r')">'
+)
+
+
+def wrap_html_document(html_content, full_name="Resume", job_role=""):
+    """Add the basic HTML structure around a bare fragment"""
+    return _WRAPPER_HEAD.format(full_name=full_name, job_role=job_role) + html_content + _WRAPPER_TAIL
+
+
+def postprocess_resume_html(html_content, resume_style=None, full_name="Resume", job_role=""):
+    """
+    Full post-processing of a generated resume: add the document wrapper
+    if the model left it out, then apply the styles and editing features
+    """
+    if '<!DOCTYPE html>' not in html_content:
+        html_content = wrap_html_document(html_content, full_name, job_role)
+    return apply_resume_styles(html_content, resume_style)
+
+
+def apply_resume_styles(html_content, resume_style=None):
+    """
+    Apply all style transforms in a single pass - CSS, body style class,
+    container div, editing script, contenteditable blocks and (for documents
+    without styles) the print button. The CSS and script come from the
+    precompiled bundle of the resume style (right-to-left documents get the
+    RTL bundle later, from text_direction.apply_direction)
+    """
+    bundle = get_bundle(resume_style)
+
+    # Document level decisions - made once, before the scan
+    has_styles = '<style>' in html_content and '</style>' in html_content
+    add_class = bool(resume_style) and '<body' in html_content
+    # Any class attribute in the document means only '<body class="' tags get the style class
+    extend_class = 'class=' in html_content
+    if has_styles:
+        add_container = add_class and '<div class="resume-container">' not in html_content
+        add_script = add_class and EDITING_SCRIPT_MARKER not in html_content
+        body_close = ('</div>\n' if add_container else '') + (bundle.script_block + '\n' if add_script else '') + '</body>'
+    else:
+        add_container = True
+        body_close = '</div>\n' + PRINT_BUTTON + '\n</body>'
+
+    parts = []
+    position = 0
+    # The container opens right after the first '>' following the first body tag
+    container_pending = False
+    container_placed = not add_container
+
+    def emit(piece):
+        nonlocal container_pending, container_placed
+        if container_pending:
+            tag_end = piece.find('>')
+            if tag_end != -1:
+                parts.append(piece[:tag_end + 1])
+                parts.append(CONTAINER_OPEN)
+                piece = piece[tag_end + 1:]
+                container_pending = False
+        parts.append(piece)
+
+    for match in _TOKEN_PATTERN.finditer(html_content):
+        token = match.group()
+        emit(html_content[position:match.start()])
+        position = match.end()
+
+        if token == '</style>':
+            emit(bundle.style_append if has_styles else token)
+        elif token == '<head>':
+            emit(token if has_styles else bundle.head_block)
+        elif token == '</body>':
+            if container_pending:
+                # The original implementation placed the container before rewriting </body>
+                parts.append(body_close)
+                parts.append(CONTAINER_OPEN)
+                container_pending = False
+            else:
+                emit(body_close)
+        elif token == '<body':
+            if add_class and not extend_class:
+                token = f'<body class="{resume_style}"'
+            elif add_class and html_content.startswith(' class="', position):
+                token = f'<body class="{resume_style} '
+                position += len(' class="')
+            emit(token)
+            if not container_placed:
+                container_pending = True
+                container_placed = True
+        elif has_styles:
+            # Editable resume block
+            emit(token[:-1] + ' contenteditable="true">')
+        else:
+            emit(token)
+
+    emit(html_content[position:])
+
+    if container_pending:
+        # No '>' after the body tag - the original str.find() based code put the container first
+        parts.insert(0, CONTAINER_OPEN)
+    elif not container_placed:
+        # No body tag at all - same placement as str.find('>', -1) in the original implementation
+        parts.insert(len(parts) if html_content.endswith('>') else 0, CONTAINER_OPEN)
+
+    return "".join(parts)
@@ -1,5 +1,7 @@
         // API Configuration
         const API_BASE_URL = 'https://cara-ai-resume-builder.onrender.com/api';
+        // How often a running background job (resume generation, translation) is polled
+        const JOB_POLL_INTERVAL_MS = 1000;
 
         // השלמה אוטומטית לשדה job-role
         const autocompleteStyle = `
@@ -203,27 +205,6 @@
         }
         });
 
-        // פונקציה שמדמה הקלדה של טקסט אות אחר אות
-        function typeText(element, text, speed = 30) {
-            return new Promise((resolve) => {
-                let i = 0;
-                element.textContent = '';
-                
-                function type() {
-                    if (i < text.length) {
-                        element.textContent += text.charAt(i);
-                        i++;
-                        setTimeout(type, speed);
-                    } else {
-                        resolve();
-                    }
-                }
-                
-                type();
-            });
-        }
-
-
         // Main application class
         class ResumeBuilder {
             constructor() {
@@ -247,6 +228,14 @@
                 };
                 this.resumeFilename = "";
                 this.translatedFilename = "";
+                this.sessionId = null; // מזהה הסשן שמוחזר מהשרת
+                // ערוץ WebSocket לראיון (null - בקשות HTTP רגילות)
+                this.interviewChannel = null;
+                this.channelReady = Promise.resolve(false);
+                this.channelRequestId = 0;
+                this.pendingChannelRequests = {};
+                this.pendingFeedback = {};
+                this.feedbackTokenHandlers = {};
                 
                 this.initEventListeners();
             }
@@ -274,6 +263,9 @@
                 // Results screen
                 document.getElementById('open-resume-btn').addEventListener('click', () => this.openResumeInBrowser());
                 document.getElementById('translate-resume-btn').addEventListener('click', () => this.openTranslateModal());
+                document.querySelectorAll('.style-option').forEach(button => {
+                    button.addEventListener('click', () => this.switchResumeStyle(button.dataset.style));
+                });
                 document.getElementById('email-resume-btn').addEventListener('click', () => this.openEmailModal());
                 
                 // Email modal
@@ -303,6 +295,11 @@
                         },
                     };
                     
+                    // Identify our session on the backend
+                    if (this.sessionId) {
+                        options.headers['X-Session-ID'] = this.sessionId;
+                    }
+                    
                     if (data && (method === 'POST' || method === 'PUT')) {
                         options.body = JSON.stringify(data);
                     }
@@ -322,6 +319,223 @@
                 }
             }
             
+            // Open the interview WebSocket - questions, answers and follow-ups go over one connection
+            openInterviewChannel() {
+                if (!('WebSocket' in window)) {
+                    return;
+                }
+                const url = `${API_BASE_URL.replace(/^http/, 'ws')}/interview/ws?session_id=${encodeURIComponent(this.sessionId)}`;
+                const channel = new WebSocket(url);
+                this.channelReady = new Promise(resolve => {
+                    channel.onopen = () => {
+                        this.interviewChannel = channel;
+                        resolve(true);
+                    };
+                    channel.onclose = () => {
+                        // בקשות שלא נענו - נכשלות, ומכאן והלאה חוזרים ל-HTTP
+                        this.interviewChannel = null;
+                        this.channelReady = Promise.resolve(false);
+                        Object.values(this.pendingChannelRequests).forEach(pending => pending.reject(new Error('Connection to the server was lost')));
+                        this.pendingChannelRequests = {};
+                        Object.values(this.pendingFeedback).forEach(resolve => resolve({ feedback: null, followup: null }));
+                        this.pendingFeedback = {};
+                        this.feedbackTokenHandlers = {};
+                        resolve(false);
+                    };
+                });
+                channel.onmessage = (event) => this.handleChannelMessage(JSON.parse(event.data));
+            }
+            
+            handleChannelMessage(message) {
+                if (message.type === 'result' || message.type === 'error') {
+                    const pending = this.pendingChannelRequests[message.request_id];
+                    if (!pending) {
+                        return;
+                    }
+                    delete this.pendingChannelRequests[message.request_id];
+                    if (message.type === 'result') {
+                        pending.resolve(message.data);
+                    } else {
+                        pending.reject(new Error(message.detail || 'API request failed'));
+                    }
+                } else if (message.type === 'feedback_token') {
+                    // טוקן של המשוב, ברגע שהמודל כתב אותו
+                    const onToken = this.feedbackTokenHandlers[message.index];
+                    if (onToken) {
+                        onToken(message.text);
+                    }
+                } else if (message.type === 'feedback') {
+                    // המשוב וההמשך של תשובה הגיעו
+                    delete this.feedbackTokenHandlers[message.index];
+                    const resolve = this.pendingFeedback[message.index];
+                    if (resolve) {
+                        delete this.pendingFeedback[message.index];
+                        resolve({ feedback: message.feedback, followup: message.followup });
+                    }
+                }
+            }
+            
+            // Send a request over the interview channel, or as an HTTP request when the channel isn't open
+            async interviewRequest(action, data, endpoint, method = 'GET') {
+                if (!(await this.channelReady) || !this.interviewChannel) {
+                    return this.apiRequest(endpoint, method, data);
+                }
+                const requestId = ++this.channelRequestId;
+                try {
+                    return await new Promise((resolve, reject) => {
+                        this.pendingChannelRequests[requestId] = { resolve, reject };
+                        this.interviewChannel.send(JSON.stringify({ ...(data || {}), type: action, request_id: requestId }));
+                    });
+                } catch (error) {
+                    console.error('API Request Error:', error);
+                    this.showNotification(error.message || 'Failed to connect to the server. Please try again.', 'error');
+                    throw error;
+                }
+            }
+            
+            // Save an answer and wait for its feedback and follow-up (same result as POST answer/{index}).
+            // The feedback is passed to onToken piece by piece while the model writes it
+            async saveAnswer(index, key, answer, onToken = null) {
+                if (!(await this.channelReady) || !this.interviewChannel) {
+                    return this.streamAnswer(index, key, answer, onToken);
+                }
+                // מחכים למשוב לפני שליחת התשובה, כדי לא לפספס אותו
+                const feedback = new Promise(resolve => { this.pendingFeedback[index] = resolve; });
+                if (onToken) {
+                    this.feedbackTokenHandlers[index] = onToken;
+                }
+                let saved;
+                try {
+                    saved = await this.interviewRequest('answer', { index: index, key: key, answer: answer });
+                } catch (error) {
+                    delete this.pendingFeedback[index];
+                    delete this.feedbackTokenHandlers[index];
+                    throw error;
+                }
+                if (!saved.feedback_pending) {
+                    delete this.pendingFeedback[index];
+                    delete this.feedbackTokenHandlers[index];
+                    return { ...saved, feedback: null };
+                }
+                const result = await feedback;
+                return { ...saved, feedback: result.feedback, followup: result.followup || saved.followup };
+            }
+            
+            // POST to a Server-Sent Events endpoint and pass each event to onEvent(event, data)
+            // until the stream ends - an error event rejects with its detail
+            async postEventStream(endpoint, data, onEvent) {
+                const response = await fetch(`${API_BASE_URL}/${endpoint}`, {
+                    method: 'POST',
+                    headers: {
+                        'Content-Type': 'application/json',
+                        'X-Session-ID': this.sessionId
+                    },
+                    body: JSON.stringify(data)
+                });
+                
+                if (!response.ok) {
+                    const errorData = await response.json();
+                    throw new Error(errorData.detail || 'API request failed');
+                }
+                
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                while (true) {
+                    const chunk = await reader.read();
+                    if (chunk.done) {
+                        return;
+                    }
+                    buffer += decoder.decode(chunk.value, { stream: true });
+                    
+                    // אירועים מופרדים בשורה ריקה
+                    let boundary;
+                    while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+                        const lines = buffer.slice(0, boundary).split('\n');
+                        buffer = buffer.slice(boundary + 2);
+                        const eventLine = lines.find(line => line.startsWith('event: '));
+                        const dataLine = lines.find(line => line.startsWith('data: '));
+                        if (!eventLine || !dataLine) {
+                            continue;
+                        }
+                        const event = eventLine.slice('event: '.length);
+                        const eventData = JSON.parse(dataLine.slice('data: '.length));
+                        if (event === 'error') {
+                            throw new Error(eventData.detail || 'API request failed');
+                        }
+                        onEvent(event, eventData);
+                    }
+                }
+            }
+            
+            // Save an answer over HTTP and read its feedback from the Server-Sent Events stream
+            async streamAnswer(index, key, answer, onToken = null) {
+                try {
+                    let saved = {};
+                    let done = null;
+                    await this.postEventStream(`answer/${index}/stream`, { key: key, answer: answer }, (event, data) => {
+                        if (event === 'saved') {
+                            saved = data;
+                        } else if (event === 'token' && onToken) {
+                            onToken(data.text);
+                        } else if (event === 'done') {
+                            done = data;
+                        }
+                    });
+                    
+                    return {
+                        ...saved,
+                        feedback: done ? done.feedback : null,
+                        followup: done ? done.followup : saved.followup
+                    };
+                } catch (error) {
+                    console.error('API Request Error:', error);
+                    this.showNotification(error.message || 'Failed to connect to the server. Please try again.', 'error');
+                    throw error;
+                }
+            }
+            
+            // Generate the resume over the Server-Sent Events stream - onSection(section) is called
+            // with each completed section (its preview is the resume written so far)
+            async streamResume(data, onSection = null) {
+                try {
+                    let done = null;
+                    await this.postEventStream('generate-resume/stream', data, (event, eventData) => {
+                        if (event === 'section' && onSection) {
+                            onSection(eventData);
+                        } else if (event === 'done') {
+                            done = eventData;
+                        }
+                    });
+                    if (!done) {
+                        throw new Error('Resume generation was interrupted');
+                    }
+                    return done;
+                } catch (error) {
+                    console.error('API Request Error:', error);
+                    this.showNotification(error.message || 'Failed to connect to the server. Please try again.', 'error');
+                    throw error;
+                }
+            }
+            
+            // Run a background job on the server and wait for its result
+            // (generation and translation answer 202 with a job id instead of holding the request open)
+            async runJob(endpoint, data) {
+                const accepted = await this.apiRequest(endpoint, 'POST', data);
+                while (true) {
+                    await new Promise(resolve => setTimeout(resolve, JOB_POLL_INTERVAL_MS));
+                    const job = await this.apiRequest(`jobs/${accepted.job_id}`);
+                    if (job.status === 'succeeded') {
+                        return job.result;
+                    }
+                    if (job.status === 'failed') {
+                        const error = new Error(job.error || 'Background job failed');
+                        this.showNotification(error.message, 'error');
+                        throw error;
+                    }
+                }
+            }
+            
             // Start the interview process
             async startInterview() {
                 // Get user information
@@ -343,11 +557,15 @@
                         resume_level: this.resumeLevel
                     });
                     
+                    // Keep the session id for all following requests
+                    this.sessionId = initResponse.session_id;
+                    this.openInterviewChannel();
+                    
                     // Save basic info to userData
                     this.userData['full_name'] = this.userName;
                     
                     // Get questions from the backend
-                    const questionsResponse = await this.apiRequest('questions');
+                    const questionsResponse = await this.interviewRequest('questions', null, 'questions');
                     this.questions = questionsResponse.questions;
                     
                     // Show interview screen
@@ -365,7 +583,7 @@
             async updateQuestionUI() {
                 try {
                     // Get the current question details from the API
-                    const questionResponse = await this.apiRequest(`question/${this.currentQuestionIndex}`);
+                    const questionResponse = await this.interviewRequest('question', { index: this.currentQuestionIndex }, `question/${this.currentQuestionIndex}`);
                     
                     // Update question number and text
                     document.getElementById('current-question').textContent = this.currentQuestionIndex + 1;
@@ -445,11 +663,24 @@
                     document.getElementById('feedback-content') && (document.getElementById('feedback-content').style.display = 'none');
                     document.getElementById('feedback-text').style.display = 'none';
                     
+                    // הפידבק מוצג מהטוקן הראשון ומתעדכן תוך כדי שהמודל כותב אותו
+                    const feedbackTextElement = document.getElementById('feedback-text');
+                    const showFeedback = (text) => {
+                        document.getElementById('feedback-loading').style.display = 'none';
+                        feedbackTextElement.style.display = 'inline-block';
+                        if (document.getElementById('feedback-content')) {
+                            document.getElementById('feedback-content').style.display = 'block';
+                        }
+                        feedbackTextElement.textContent = text;
+                    };
+                    let streamedFeedback = '';
+                    const onFeedbackToken = (token) => {
+                        streamedFeedback += token;
+                        showFeedback(`💡 ${streamedFeedback.trimStart()}`);
+                    };
+                    
                     // שלח את התשובה לבקאנד
-                    const saveResponse = await this.apiRequest(`answer/${this.currentQuestionIndex}`, 'POST', {
-                        key: currentQuestion.key,
-                        answer: answer
-                    });
+                    const saveResponse = await this.saveAnswer(this.currentQuestionIndex, currentQuestion.key, answer, onFeedbackToken);
                     
                     // שמור מקומית
                     this.userData[currentQuestion.key] = answer;
@@ -459,19 +690,12 @@
                     
                     // בדוק אם יש פידבק
                     if (saveResponse.feedback) {
-                        const feedbackTextElement = document.getElementById('feedback-text');
-                        feedbackTextElement.style.display = 'inline-block';
-                        
-                        if (document.getElementById('feedback-content')) {
-                            document.getElementById('feedback-content').style.display = 'block';
-                        }
-                        
-                        // הקלדת הטקסט של הפידבק בהדרגה
-                        await typeText(feedbackTextElement, saveResponse.feedback.message);
-                        
+                        // הנוסח הסופי של הפידבק (גם כשהגיע מהמטמון בחלק אחד)
+                        showFeedback(saveResponse.feedback.message);
+                    
                         // אם יש גם שאלת מעקב, נמתין רגע קל נוסף לפני שנציג אותה
                         if (saveResponse.followup) {
-                            // המתן 500 מילישניות נוספות אחרי סיום ההקלדה לפני הצגת שאלת המעקב
+                            // המתן 500 מילישניות נוספות אחרי סיום הפידבק לפני הצגת שאלת המעקב
                             setTimeout(() => {
                                 this.showFollowUpQuestion(saveResponse.followup, currentQuestion.key);
                                 // הפעל מחדש את כל הכפתורים אחרי הצגת שאלת המעקב
@@ -574,14 +798,16 @@
                 submitBtn.textContent = 'Submit';
                 submitBtn.addEventListener('click', async () => {
                     const followupAnswer = followupInput.value.trim();
+                    let nextFollowup = null;
                     if (followupAnswer) {
                         try {
-                            // Send follow-up answer based on type
-                            await this.apiRequest(`follow-up/${followup.type}`, 'POST', {
+                            // Send follow-up answer based on type - the server answers with the next follow-up, if any
+                            const followupResponse = await this.interviewRequest('followup', {
+                                followup_type: followup.type,
                                 answer: followupAnswer,
-                                original_key: originalKey,
-                                next_question: followup.additional_questions ? followup.additional_questions[0] : null
-                            });
+                                original_key: originalKey
+                            }, `follow-up/${followup.type}`, 'POST');
+                            nextFollowup = followupResponse.followup;
                             
                             this.showNotification('Additional information saved', 'success');
                         } catch (error) {
@@ -590,6 +816,10 @@
                     }
                     
                     document.body.removeChild(followupModal);
+                    if (nextFollowup) {
+                        this.showFollowUpQuestion(nextFollowup, originalKey);
+                        return;
+                    }
                     this.proceedAfterFollowUp();
                 });
                 
@@ -649,9 +879,11 @@
                 if (answer) {
                     try {
                         // Send answer to the backend
+                        // No feedback is shown for the last answer - don't wait for it
                         await this.apiRequest(`answer/${this.currentQuestionIndex}`, 'POST', {
                             key: currentQuestion.key,
-                            answer: answer
+                            answer: answer,
+                            deferred: true
                         });
                         
                         // Save locally as well
@@ -663,7 +895,7 @@
                 
                 try {
                     // Get all answers from the backend to ensure we have the latest data
-                    const answersResponse = await this.apiRequest('answers');
+                    const answersResponse = await this.interviewRequest('answers', null, 'answers');
                     this.userData = answersResponse.answers;
                     
                     // Generate review items
@@ -735,7 +967,7 @@
             async proceedToGenerate() {
                 try {
                     // Analyze implied skills via the backend
-                    const skillsResponse = await this.apiRequest('analyze-skills', 'POST');
+                    const skillsResponse = await this.interviewRequest('analyze_skills', null, 'analyze-skills', 'POST');
                     
                     if (skillsResponse.implied_skills) {
                         this.impliedSkills = skillsResponse.implied_skills;
@@ -836,6 +1068,8 @@
                 // Get resume format and style
                 const resumeFormat = document.getElementById('resume-format').value;
                 const resumeStyle = document.getElementById('resume-style').value;
+                // Writing the resume directly in the target language saves a separate translation
+                const resumeLanguage = document.getElementById('resume-language').value;
                 
                 // Update confirmed skills
                 this.updateConfirmedSkills();
@@ -844,23 +1078,40 @@
                 this.showScreen('results-screen');
                 document.getElementById('resume-loading').classList.remove('hidden');
                 document.getElementById('resume-success').classList.add('hidden');
+                document.querySelector('#resume-loading .loading-text').textContent = 'Creating your professional resume...';
+                const livePreview = document.getElementById('resume-live-preview');
+                livePreview.classList.add('hidden');
                 
                 try {
-                    // Call the API to generate the resume
-                    const generateResponse = await this.apiRequest('generate-resume', 'POST', {
+                    // Call the API to generate the resume - each section is shown as soon as it is written
+                    const generateResponse = await this.streamResume({
                         format: resumeFormat,
                         style: resumeStyle,
-                        confirmed_skills: this.confirmedSkills
+                        confirmed_skills: this.confirmedSkills,
+                        target_language: resumeLanguage || null
+                    }, section => {
+                        document.querySelector('#resume-loading .loading-text').textContent =
+                            `Writing your resume... (${section.name} done)`;
+                        if (resumeFormat === 'html') {
+                            livePreview.srcdoc = section.preview;
+                            livePreview.classList.remove('hidden');
+                        }
                     });
                     
                     // Save the filename for later use
                     this.resumeFilename = generateResponse.filename;
                     
                     // Update UI
+                    livePreview.classList.add('hidden');
                     document.getElementById('resume-loading').classList.add('hidden');
                     document.getElementById('resume-success').classList.remove('hidden');
                     document.getElementById('resume-filename').textContent = this.resumeFilename;
                     
+                    // תצוגה מקדימה עם אפשרות להחלפת סגנון
+                    if (resumeFormat === 'html') {
+                        this.showResumePreview(resumeStyle);
+                    }
+                    
                     // Add career tips if provided
                     if (generateResponse.career_tips) {
                         this.displayCareerTips(generateResponse.career_tips);
@@ -891,12 +1142,36 @@
                     this.showNotification('Failed to generate resume. Please try again.', 'error');
                     
                     // Show a basic success view anyway for demo purposes
+                    livePreview.classList.add('hidden');
                     document.getElementById('resume-loading').classList.add('hidden');
                     document.getElementById('resume-success').classList.remove('hidden');
                     document.getElementById('resume-filename').textContent = `${this.userName.replace(' ', '_').toLowerCase()}_resume.${resumeFormat}`;
                 }
             }
             
+            // Show the generated resume in the preview frame
+            showResumePreview(style) {
+                document.getElementById('resume-preview-container').classList.remove('hidden');
+                document.querySelectorAll('.style-option').forEach(button => {
+                    button.classList.toggle('active', button.dataset.style === style);
+                });
+                document.getElementById('resume-preview-frame').src =
+                    `${API_BASE_URL}/resume-preview?style=${encodeURIComponent(style)}&session_id=${encodeURIComponent(this.sessionId)}`;
+            }
+            
+            // Switch the resume to another style - rendered on the server without generating it again
+            async switchResumeStyle(style) {
+                try {
+                    const rerenderResponse = await this.apiRequest('rerender-resume', 'POST', { style: style });
+                    this.resumeFilename = rerenderResponse.filename;
+                    document.getElementById('resume-filename').textContent = this.resumeFilename;
+                    document.getElementById('resume-style').value = style;
+                    this.showResumePreview(style);
+                } catch (error) {
+                    console.error('Failed to switch resume style:', error);
+                }
+            }
+            
             // Display career tips
             displayCareerTips(tips) {
                 const tipsContainer = document.getElementById('career-tips-container');
@@ -957,7 +1232,7 @@
                 
                 try {
                     // Call API to translate
-                    const translateResponse = await this.apiRequest('translate-resume', 'POST', {
+                    const translateResponse = await this.runJob('translate-resume', {
                         filename: this.resumeFilename,
                         target_language: targetLanguage
                     });
@@ -1090,9 +1365,11 @@
                 
                 try {
                     // Send updated answer to the backend
+                    // Edited answers are saved without waiting for the coaching feedback
                     await this.apiRequest(`answer/${questionIndex}`, 'POST', {
                         key: questionKey,
-                        answer: newAnswer
+                        answer: newAnswer,
+                        deferred: true
                     });
                     
                     // Update user data locally
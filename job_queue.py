@@ -0,0 +1,238 @@
+"""
+In-process background jobs for long LLM work (resume generation and
+translation).
+
+Endpoints submit a job and answer 202 Accepted right away with its id; the
+client polls the job (or listens to its event stream) for status, progress
+and the final result. Jobs run on the event loop with a bounded number of
+concurrent jobs, highest priority first - work a user is waiting on
+interactively goes before generations, and bulk jobs (batch translations)
+can only take part of the slots, so they never fill the LLM concurrency
+that interactive requests need.
+
+Jobs and their state live in the process that runs them, like the
+interview sessions they belong to - with several uvicorn workers, clients
+reach the same worker through the session (sticky routing).
+"""
+import os
+import time
+import uuid
+import heapq
+import asyncio
+import threading
+import itertools
+
+# Number of jobs running at the same time per process
+JOB_WORKERS = int(os.getenv('CARA_JOB_WORKERS', '8'))
+
+# How many of them may be bulk jobs
+JOB_BULK_WORKERS = int(os.getenv('CARA_JOB_BULK_WORKERS', str(max(1, JOB_WORKERS // 4))))
+
+# Finished jobs are kept this long (seconds) for the client to fetch the result
+JOB_RETENTION_SECONDS = int(os.getenv('CARA_JOB_RETENTION_SECONDS', '3600'))
+
+# Lower runs first
+PRIORITY_INTERACTIVE = 0   # Feedback and other work the user is waiting on in the interview
+PRIORITY_GENERATION = 5    # Resume generation / translation of one resume
+PRIORITY_BULK = 10         # Batch work (several languages at once)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+FINISHED_STATES = (JOB_SUCCEEDED, JOB_FAILED)
+
+
+class Job:
+    """A unit of background work and its observable state"""
+    def __init__(self, kind, priority=PRIORITY_GENERATION, session_id=None):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.priority = priority
+        self.session_id = session_id
+        self.status = JOB_QUEUED
+        self.progress = 0.0
+        self.message = ""
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self._changed = asyncio.Event()
+        self._scheduler = None
+
+    def report(self, progress=None, message=None):
+        """Update the progress (0..1) and / or the status message of a running job"""
+        if progress is not None:
+            self.progress = max(0.0, min(1.0, progress))
+        if message is not None:
+            self.message = message
+        self._notify()
+
+    def _notify(self):
+        # Wake up the current waiters, later ones wait for the next change
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+        if self._scheduler is not None:
+            self._scheduler.backend.save(self.to_dict())
+
+    async def wait_for_change(self, timeout=None):
+        """Wait until the job state changes (or the timeout passes)"""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    @property
+    def finished(self):
+        return self.status in FINISHED_STATES
+
+    def to_dict(self):
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "priority": self.priority,
+            "session_id": self.session_id,
+            "status": self.status,
+            "progress": round(self.progress, 3),
+            "message": self.message,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+class MemoryJobBackend:
+    """Job state of this process only"""
+    def __init__(self):
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def save(self, state):
+        with self._lock:
+            self._jobs[state["job_id"]] = state
+
+    def load(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def purge(self, finished_before):
+        with self._lock:
+            expired = [
+                job_id for job_id, state in self._jobs.items()
+                if state["finished_at"] is not None and state["finished_at"] < finished_before
+            ]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+
+class JobScheduler:
+    """
+    Priority scheduler of background jobs on the running event loop.
+
+    At most `workers` jobs run at once, and at most `bulk_workers` of them
+    may be bulk jobs. Queued jobs start in priority order (then submission
+    order).
+    """
+    def __init__(self, workers=JOB_WORKERS, bulk_workers=JOB_BULK_WORKERS, backend=None,
+                 retention_seconds=JOB_RETENTION_SECONDS):
+        self.workers = max(1, workers)
+        self.bulk_workers = max(1, min(bulk_workers, self.workers))
+        self.backend = backend if backend is not None else MemoryJobBackend()
+        self.retention_seconds = retention_seconds
+        self._queue = []  # heap of (priority, sequence, job, func)
+        self._sequence = itertools.count()
+        self._jobs = {}   # job id -> Job, for the jobs of this process
+        self._running = 0
+        self._running_bulk = 0
+        self._tasks = set()
+
+    def submit(self, func, kind, priority=PRIORITY_GENERATION, session_id=None):
+        """
+        Queue `func(job)` (a coroutine function returning a JSON-serializable
+        result) and return its Job
+        """
+        self._purge()
+        job = Job(kind, priority, session_id)
+        job._scheduler = self
+        self._jobs[job.job_id] = job
+        self.backend.save(job.to_dict())
+        heapq.heappush(self._queue, (priority, next(self._sequence), job, func))
+        self._dispatch()
+        return job
+
+    def _dispatch(self):
+        """Start queued jobs while there are free slots"""
+        while self._queue and self._running < self.workers:
+            priority, sequence, job, func = self._queue[0]
+            if priority >= PRIORITY_BULK and self._running_bulk >= self.bulk_workers:
+                # Only bulk jobs are left in the queue - they wait for a bulk slot
+                break
+            heapq.heappop(self._queue)
+            self._running += 1
+            if priority >= PRIORITY_BULK:
+                self._running_bulk += 1
+            task = asyncio.ensure_future(self._run(job, func))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, job, func):
+        job.status = JOB_RUNNING
+        job.started_at = time.time()
+        job._notify()
+        try:
+            job.result = await func(job)
+            job.status = JOB_SUCCEEDED
+            job.progress = 1.0
+        except asyncio.CancelledError:
+            # E.g. the event loop shuts down - followers must not wait for a job that will never finish
+            job.status = JOB_FAILED
+            job.error = "Job was cancelled"
+            raise
+        except Exception as e:
+            job.status = JOB_FAILED
+            # HTTPException carries its message in detail
+            job.error = str(getattr(e, 'detail', None) or e)
+        finally:
+            job.finished_at = time.time()
+            self._running -= 1
+            if job.priority >= PRIORITY_BULK:
+                self._running_bulk -= 1
+            job._notify()
+            self._dispatch()
+
+    def _purge(self):
+        """Forget finished jobs older than the retention time"""
+        finished_before = time.time() - self.retention_seconds
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished and job.finished_at < finished_before]:
+            del self._jobs[job_id]
+        self.backend.purge(finished_before)
+
+    def get(self, job_id):
+        """The live Job of this process, or None"""
+        return self._jobs.get(job_id)
+
+    def state(self, job_id):
+        """Job state as a dict - of a live job or from the backend - or None"""
+        job = self._jobs.get(job_id)
+        if job is not None:
+            return job.to_dict()
+        return self.backend.load(job_id)
+
+    def stats(self):
+        """Counters for monitoring"""
+        return {
+            "queued": len(self._queue),
+            "running": self._running,
+            "running_bulk": self._running_bulk,
+            "workers": self.workers,
+            "bulk_workers": self.bulk_workers,
+            "jobs": len(self._jobs),
+            "backend": type(self.backend).__name__,
+        }
+
+
+# Shared scheduler used by the API
+job_scheduler = JobScheduler()
@@ -0,0 +1,125 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+
+# Maximum number of cached LLM responses kept in memory
+LLM_CACHE_SIZE = int(os.getenv('CARA_LLM_CACHE_SIZE', '2000'))
+
+# Time-to-live (seconds) for each call site - call sites not listed here are not cached.
+# Resume generation ("resume_generation", "resume_section") is sampled at temperature 0.7
+# and is not cached, so pressing "regenerate" writes a new resume
+CALL_SITE_TTLS = {
+    "answer_feedback": 6 * 3600,
+    "professional_context": 6 * 3600,
+    "follow_up_check": 6 * 3600,
+    "skills_analysis": 6 * 3600,
+    "resume_feedback": 3600,
+    "final_advice": 3600,
+    "translation": 24 * 3600,
+}
+
+# Deterministic call sites whose responses are also kept in the persistent on-disk store
+PERSISTENT_CALL_SITES = {"translation", "follow_up_check", "skills_analysis"}
+
+
+class _Message:
+    def __init__(self, content):
+        self.content = content
+
+
+class _Choice:
+    def __init__(self, content):
+        self.message = _Message(content)
+
+
+class CachedCompletion:
+    """Minimal stand-in for a ChatCompletion - exposes choices[0].message.content"""
+    def __init__(self, content):
+        self.choices = [_Choice(content)]
+
+
+def make_cache_key(params):
+    """Content-addressed key: hash of the model, messages and sampling parameters"""
+    params = {k: v for k, v in params.items() if k != 'stream'}
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    In-process LRU cache of LLM response texts with a per-entry TTL.
+
+    Entries are evicted least-recently-used first once `max_entries` is
+    reached, and lazily when their TTL expires. Hit/miss counters are kept
+    globally and per call site.
+    """
+    def __init__(self, max_entries=LLM_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, content)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.site_stats = {}
+
+    def _count(self, site, field):
+        stats = self.site_stats.setdefault(site, {"hits": 0, "misses": 0})
+        stats[field] += 1
+
+    def get(self, key, site=None):
+        """Return the cached text for the key, or None on a miss / expired entry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] < time.time():
+                # Expired
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                self._count(site, "misses")
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self._count(site, "hits")
+            return entry[1]
+
+    def set(self, key, content, ttl):
+        """Store a response text for `ttl` seconds"""
+        if content is None or ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "call_sites": {site: dict(counts) for site, counts in self.site_stats.items()},
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared cache used by llm_gateway
+response_cache = LLMResponseCache()
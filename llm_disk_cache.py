@@ -0,0 +1,230 @@
+import os
+import sys
+import time
+import sqlite3
+import argparse
+import threading
+from sqlite_store import thread_connection, HIT_FLUSH_BATCH
+
+# SQLite file shared by all uvicorn workers (set CARA_LLM_DISK_CACHE_PATH="" to disable)
+LLM_DISK_CACHE_PATH = os.getenv(
+    'CARA_LLM_DISK_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'llm_cache.sqlite3')
+)
+
+# Total size of stored responses before the oldest entries are compacted away
+LLM_DISK_CACHE_MAX_BYTES = int(os.getenv('CARA_LLM_DISK_CACHE_MAX_BYTES', str(200 * 1024 * 1024)))
+
+# Run a compaction every N writes
+COMPACT_EVERY_WRITES = 200
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key         TEXT PRIMARY KEY,
+    call_site   TEXT NOT NULL,
+    content     TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  REAL NOT NULL,
+    expires_at  REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses (last_access);
+CREATE INDEX IF NOT EXISTS idx_llm_responses_call_site ON llm_responses (call_site);
+"""
+
+
+class DiskResponseCache:
+    """
+    Durable LLM response store backed by SQLite in WAL mode.
+
+    Several processes (uvicorn workers) can read and write the same file at
+    once, and the entries survive restarts and deploys. When the stored
+    content grows past `max_bytes`, expired entries and then the least
+    recently used ones are deleted.
+
+    Reads never write: hits are collected in memory and written by the next
+    set() / flush_hits(), so a cache hit doesn't wait for the write lock.
+    """
+    def __init__(self, path=LLM_DISK_CACHE_PATH, max_bytes=LLM_DISK_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+        self._pending_hits = {}  # key -> (last access, hits) not written yet
+        self._hits_lock = threading.Lock()
+        self._connect()
+
+    def _connect(self):
+        return thread_connection(self._local, self.path, _SCHEMA)
+
+    def get(self, key):
+        """Return the stored text for the key, or None if missing / expired"""
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT content FROM llm_responses WHERE key = ? AND expires_at > ?", (key, now)
+        ).fetchone()
+        if row is None:
+            return None
+        with self._hits_lock:
+            hits = self._pending_hits.get(key, (now, 0))[1]
+            self._pending_hits[key] = (now, hits + 1)
+        return row[0]
+
+    @property
+    def pending_hits(self):
+        """Number of entries read since the last flush_hits()"""
+        return len(self._pending_hits)
+
+    def flush_hits(self):
+        """Write the collected hits (last access time and hit counters) in one batch"""
+        with self._hits_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        if pending:
+            self._connect().executemany(
+                "UPDATE llm_responses SET last_access = ?, hits = hits + ? WHERE key = ?",
+                [(last_access, hits, key) for key, (last_access, hits) in pending.items()]
+            )
+
+    def set(self, key, call_site, content, ttl):
+        """
+        Store a response text for `ttl` seconds. Every COMPACT_EVERY_WRITES
+        writes this also compacts the store - call it off the request path
+        (llm_gateway runs it on its cache writer thread)
+        """
+        if content is None or ttl <= 0:
+            return
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_responses (key, call_site, content, size, created_at, expires_at, last_access, hits) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+            (key, call_site, content, len(content.encode('utf-8')), now, now + ttl, now)
+        )
+        self.flush_hits()
+
+        with self._writes_lock:
+            self._writes += 1
+            should_compact = self._writes % COMPACT_EVERY_WRITES == 0
+        if should_compact:
+            self.compact()
+
+    def compact(self):
+        """Delete expired entries, then the least recently used ones until the store fits max_bytes"""
+        self.flush_hits()
+        conn = self._connect()
+        removed = conn.execute("DELETE FROM llm_responses WHERE expires_at <= ?", (time.time(),)).rowcount
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+        if total > self.max_bytes:
+            # Shrink to 90% of the budget so we don't compact on every write
+            target = int(self.max_bytes * 0.9)
+            freed = 0
+            stale_keys = []
+            for key, size in conn.execute("SELECT key, size FROM llm_responses ORDER BY last_access ASC"):
+                if total - freed <= target:
+                    break
+                stale_keys.append((key,))
+                freed += size
+            conn.executemany("DELETE FROM llm_responses WHERE key = ?", stale_keys)
+            removed += len(stale_keys)
+
+        if removed:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    def purge(self, call_site=None, expired_only=False):
+        """Delete entries (optionally only one call site / only expired ones), returns the number removed"""
+        conn = self._connect()
+        query = "DELETE FROM llm_responses WHERE 1 = 1"
+        params = []
+        if call_site:
+            query += " AND call_site = ?"
+            params.append(call_site)
+        if expired_only:
+            query += " AND expires_at <= ?"
+            params.append(time.time())
+        removed = conn.execute(query, params).rowcount
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    def entries(self, call_site=None, limit=50):
+        """Most recently used entries (without their content)"""
+        conn = self._connect()
+        query = "SELECT key, call_site, size, created_at, expires_at, last_access, hits FROM llm_responses"
+        params = []
+        if call_site:
+            query += " WHERE call_site = ?"
+            params.append(call_site)
+        query += " ORDER BY last_access DESC LIMIT ?"
+        params.append(limit)
+        columns = ["key", "call_site", "size", "created_at", "expires_at", "last_access", "hits"]
+        return [dict(zip(columns, row)) for row in conn.execute(query, params)]
+
+    def stats(self):
+        """Number of entries, bytes and hits per call site"""
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT call_site, COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM llm_responses GROUP BY call_site"
+        ).fetchall()
+        return {
+            "path": self.path,
+            "max_bytes": self.max_bytes,
+            "entries": sum(row[1] for row in rows),
+            "bytes": sum(row[2] for row in rows),
+            "call_sites": {row[0]: {"entries": row[1], "bytes": row[2], "hits": row[3]} for row in rows},
+        }
+
+
+def open_disk_cache():
+    """Open the configured disk cache, or return None if it is disabled or unavailable"""
+    if not LLM_DISK_CACHE_PATH:
+        return None
+    try:
+        return DiskResponseCache()
+    except sqlite3.Error:
+        return None
+
+
+def main(argv=None):
+    """Command line tool to inspect and purge the persistent LLM cache"""
+    parser = argparse.ArgumentParser(description="Inspect and purge the persistent CARA LLM response cache")
+    parser.add_argument("--path", default=LLM_DISK_CACHE_PATH, help="SQLite cache file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="Show entry counts and sizes per call site")
+
+    list_parser = subparsers.add_parser("list", help="List the most recently used entries")
+    list_parser.add_argument("--site", help="Only this call site")
+    list_parser.add_argument("--limit", type=int, default=50)
+
+    purge_parser = subparsers.add_parser("purge", help="Delete entries")
+    purge_parser.add_argument("--site", help="Only this call site")
+    purge_parser.add_argument("--expired", action="store_true", help="Only expired entries")
+
+    subparsers.add_parser("compact", help="Remove expired entries and shrink the store to its size budget")
+
+    args = parser.parse_args(argv)
+    cache = DiskResponseCache(path=args.path)
+
+    if args.command == "stats":
+        stats = cache.stats()
+        print(f"{stats['path']}: {stats['entries']} entries, {stats['bytes']} bytes (budget {stats['max_bytes']})")
+        for site, site_stats in sorted(stats["call_sites"].items()):
+            print(f"  {site}: {site_stats['entries']} entries, {site_stats['bytes']} bytes, {site_stats['hits']} hits")
+    elif args.command == "list":
+        now = time.time()
+        for entry in cache.entries(call_site=args.site, limit=args.limit):
+            ttl_left = max(0, int(entry["expires_at"] - now))
+            print(f"{entry['key'][:16]}  {entry['call_site']:<20} {entry['size']:>8} bytes  {entry['hits']:>5} hits  expires in {ttl_left}s")
+    elif args.command == "purge":
+        print(f"Removed {cache.purge(call_site=args.site, expired_only=args.expired)} entries")
+    elif args.command == "compact":
+        print(f"Removed {cache.compact()} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
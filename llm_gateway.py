@@ -0,0 +1,158 @@
+import os
+import asyncio
+import sqlite3
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import openai
+from llm_cache import response_cache, make_cache_key, CachedCompletion, CALL_SITE_TTLS, PERSISTENT_CALL_SITES
+from llm_disk_cache import open_disk_cache, HIT_FLUSH_BATCH
+
+# Maximum number of LLM requests in flight at once (per process)
+LLM_MAX_CONCURRENCY = int(os.getenv('CARA_LLM_MAX_CONCURRENCY', '64'))
+
+# Worker threads for blocking code (e.g. EnhancedResumeBuilder methods) called from async handlers
+LLM_EXECUTOR_WORKERS = int(os.getenv('CARA_LLM_EXECUTOR_WORKERS', '32'))
+
+_async_client = None
+_semaphore = None
+_executor = ThreadPoolExecutor(max_workers=LLM_EXECUTOR_WORKERS, thread_name_prefix="cara-llm")
+
+# Persistent store shared by all workers (None when disabled)
+disk_cache = open_disk_cache()
+
+# Disk cache I/O never runs on the event loop: reads go to a few reader threads,
+# writes (and the compactions they trigger) to one background writer thread that
+# nobody waits on
+_disk_reader = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cara-cache-read")
+_disk_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cara-cache-write")
+
+
+def _get_async_client():
+    """Create the shared AsyncOpenAI client on first use (after the API key was loaded)"""
+    global _async_client
+    if _async_client is None:
+        _async_client = openai.AsyncOpenAI(api_key=openai.api_key)
+    return _async_client
+
+
+def _get_semaphore():
+    """Semaphore bounding the number of concurrent async LLM calls"""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return _semaphore
+
+
+def _memory_lookup(cache_site, kwargs):
+    """Return (cache key, cached text, whether to try the disk cache) - (None, None, False) when the call site is not cached"""
+    if cache_site not in CALL_SITE_TTLS:
+        return None, None, False
+    key = make_cache_key(kwargs)
+    content = response_cache.get(key, cache_site)
+    # Fall back to the persistent store for deterministic call sites
+    use_disk = content is None and disk_cache is not None and cache_site in PERSISTENT_CALL_SITES
+    return key, content, use_disk
+
+
+def _disk_get(cache_site, key):
+    try:
+        content = disk_cache.get(key)
+    except sqlite3.Error:
+        # The disk cache is an optimization - call the model on errors
+        return None
+    if content is not None:
+        response_cache.set(key, content, CALL_SITE_TTLS[cache_site])
+        if disk_cache.pending_hits >= HIT_FLUSH_BATCH:
+            run_in_background(disk_cache.flush_hits)
+    return content
+
+
+def _cache_lookup(cache_site, kwargs):
+    """Return (cache key, cached text) for a call - (None, None) when the call site is not cached"""
+    key, content, use_disk = _memory_lookup(cache_site, kwargs)
+    if use_disk:
+        content = _disk_get(cache_site, key)
+    return key, content
+
+
+async def _acache_lookup(cache_site, kwargs):
+    """_cache_lookup for the async paths - the disk read runs on a reader thread"""
+    key, content, use_disk = _memory_lookup(cache_site, kwargs)
+    if use_disk:
+        loop = asyncio.get_running_loop()
+        content = await loop.run_in_executor(_disk_reader, _disk_get, cache_site, key)
+    return key, content
+
+
+def _cache_store(cache_site, key, content):
+    if key is None:
+        return
+    response_cache.set(key, content, CALL_SITE_TTLS[cache_site])
+    if disk_cache is not None and cache_site in PERSISTENT_CALL_SITES:
+        # Written in the background - the response doesn't wait for the disk
+        run_in_background(disk_cache.set, key, cache_site, content, CALL_SITE_TTLS[cache_site])
+
+
+def chat_completion(cache_site=None, **kwargs):
+    """
+    Blocking chat completion - used by the CLI and by code running in worker threads.
+    Takes the same arguments as openai.chat.completions.create, plus the
+    call site name used for response caching (see llm_cache.CALL_SITE_TTLS)
+    """
+    key, cached = _cache_lookup(cache_site, kwargs)
+    if cached is not None:
+        return CachedCompletion(cached)
+
+    response = openai.chat.completions.create(**kwargs)
+    _cache_store(cache_site, key, response.choices[0].message.content)
+    return response
+
+
+async def achat_completion(cache_site=None, **kwargs):
+    """
+    Non-blocking chat completion for the async API handlers.
+    Takes the same arguments as chat_completion
+    """
+    key, cached = await _acache_lookup(cache_site, kwargs)
+    if cached is not None:
+        return CachedCompletion(cached)
+
+    async with _get_semaphore():
+        response = await _get_async_client().chat.completions.create(**kwargs)
+    _cache_store(cache_site, key, response.choices[0].message.content)
+    return response
+
+
+async def astream_chat_completion(cache_site=None, **kwargs):
+    """
+    Streaming chat completion - yields the text deltas as the model produces them.
+    Takes the same arguments as chat_completion (without stream). A cached
+    response is yielded as a single chunk
+    """
+    key, cached = await _acache_lookup(cache_site, kwargs)
+    if cached is not None:
+        yield cached
+        return
+
+    chunks = []
+    async with _get_semaphore():
+        stream = await _get_async_client().chat.completions.create(stream=True, **kwargs)
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                chunks.append(chunk.choices[0].delta.content)
+                yield chunk.choices[0].delta.content
+    _cache_store(cache_site, key, "".join(chunks))
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Run a blocking store write (disk cache, translation memory) on the
+    background writer thread without waiting for it
+    """
+    return _disk_writer.submit(functools.partial(func, *args, **kwargs))
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking function (e.g. a builder method that calls the LLM) on the bounded executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(func, *args, **kwargs))
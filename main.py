@@ -6,7 +6,15 @@ import openai #For AI Model and abilities
 import sys
 import textwrap
 import re
+import asyncio
 from dotenv import load_dotenv #For API Secret Key *SECURE*
+import llm_gateway #Shared entry point for all LLM calls
+from question_bank import build_questions #Precomputed interview question lists
+from html_postprocessor import postprocess_resume_html, apply_resume_styles #HTML resume styling
+from resume_translation import translate_resume_content #Segment translation with translation memory
+from text_direction import apply_direction #Language direction (RTL) of resumes
+from resume_document import parse_resume_document, resume_json_instructions #Structured JSON resumes
+from resume_renderer import render_resume #Local HTML / text rendering of JSON resumes
 from fastapi import FastAPI
 
 # Load environment variables and Openai API Key
@@ -124,447 +132,8 @@ class EnhancedResumeBuilder:
 
     def _initialize_questions(self):
         """Create personalized questions based on user's profile"""
-        # 4 Basic questions everyone gets
-        basic_questions = [
-            {"section": "Personal", "key": "email", "question": f"What email address would you like to include on your resume?"},
-            {"section": "Personal", "key": "phone", "question": f"What's the best phone number for employers to reach you?"},
-            {"section": "Personal", "key": "location", "question": f"Where are you currently located? (City and Country)"},
-            {"section": "Personal", "key": "linkedin", "question": f"Do you have a LinkedIn profile you'd like to include? (If so, please share the URL)"},
-        ]
-        
-        # Professional summary approach varies by experience level
-        if self.resume_level == "executive":
-            summary_question = {"section": "Summary", "key": "summary", 
-                               "question": f"As an executive, what would you say are your most significant leadership achievements and management philosophy?"}
-        elif self.resume_level == "mid-level":
-            summary_question = {"section": "Summary", "key": "summary", 
-                               "question": f"What would you say are your key professional strengths and notable accomplishments in your career so far?"}
-        else:  # junior
-            summary_question = {"section": "Summary", "key": "summary", 
-                               "question": f"How would you describe your professional interests and strengths as they relate to {self.job_role}?"}
-        
-        # Work experience questions - tailored by level and role
-        if "developer" in self.job_role.lower() or "engineer" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your technical experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Key technical responsibilities\n- Technologies and tools used\n- Any specific projects or systems you worked on"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant technical achievements? Consider:\n- Projects you led or contributed to\n- Performance improvements you implemented\n- Technical challenges you solved\n- Code quality or architecture improvements\n- Any patents or technical innovations"},
-                {"section": "Experience", "key": "technical_impact", 
-                "question": f"How have you made a technical impact in your roles? For example:\n- Scalability improvements\n- Cost reductions through technical solutions\n- Security enhancements\n- System architecture improvements\n- Team productivity increases"}
-            ]
-        elif "manager" in self.job_role.lower() or "director" in self.job_role.lower() or "lead" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your management experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Team size and structure\n- Key responsibilities\n- Budget management (if applicable)"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant management achievements? Consider:\n- Team growth and development\n- Process improvements\n- Project successes\n- Budget management\n- Strategic initiatives"},
-                {"section": "Experience", "key": "leadership_impact", 
-                "question": f"How have you made an impact as a leader? For example:\n- Team performance improvements\n- Cultural changes\n- Strategic initiatives\n- Crisis management\n- Cross-functional collaboration"}
-            ]
-        elif "sales" in self.job_role.lower() or "marketing" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your sales/marketing experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Products/services sold\n- Target market\n- Key responsibilities"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant sales/marketing achievements? Consider:\n- Sales targets met/exceeded\n- Campaign successes\n- Market share growth\n- Customer acquisition\n- Revenue impact"},
-                {"section": "Experience", "key": "business_impact", 
-                "question": f"How have you made a business impact? For example:\n- Revenue growth\n- Market expansion\n- Customer satisfaction\n- Brand development\n- Sales process improvements"}
-            ]
-        elif ("data" in self.job_role.lower() or "analyst" in self.job_role.lower() or ("data" in self.job_role.lower() and "scientist" in self.job_role.lower())):  
-                experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your data analysis experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Types of data you analyzed\n- Tools and technologies used\n- Key projects and their scope"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant data analysis achievements? Consider:\n- Insights that drove business decisions\n- Models or algorithms you developed\n- Efficiency improvements in data processes\n- Cost savings from data-driven solutions\n- Visualization dashboards that improved understanding"},
-                {"section": "Experience", "key": "analytical_impact", 
-                "question": f"How have your analyses made an impact? For example:\n- Business strategy influenced by your findings\n- Revenue increase from predictive models\n- Process optimization through data insights\n- Risk mitigation through better analysis\n- Data democratization within the organization"}
-            ]
-        elif "hr" in self.job_role.lower() or "human resources" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your HR experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Size of organization and workforce\n- HR specialties (recruitment, L&D, compensation, etc.)\n- Key responsibilities and programs managed"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant HR achievements? Consider:\n- Recruitment improvements or talent acquisition wins\n- Employee programs you implemented successfully\n- HR metrics improvements (turnover reduction, engagement, etc.)\n- Policy developments or improvements\n- Training or development programs created"},
-                {"section": "Experience", "key": "people_impact", 
-                "question": f"How have you made an impact on people and culture? For example:\n- Cultural transformations\n- Employee satisfaction improvements\n- Diversity and inclusion initiatives\n- Organizational development successes\n- Change management during transitions"}
-            ]
-        elif "finance" in self.job_role.lower() or "accountant" in self.job_role.lower() or "financial" in self.job_role.lower() or "accounting" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your finance experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Financial scope (budget size, revenue, etc.)\n- Key financial responsibilities\n- Systems and tools used"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant financial achievements? Consider:\n- Cost savings initiatives\n- Financial process improvements\n- Audit outcomes\n- Budget management successes\n- Financial reporting enhancements"},
-                {"section": "Experience", "key": "financial_impact", 
-                "question": f"How have you made a financial impact? For example:\n- Improved profitability\n- Enhanced financial controls\n- Better financial decision-making processes\n- Risk mitigation strategies\n- Capital structure optimizations"}
-            ]
-        elif "product" in self.job_role.lower() and ("manager" in self.job_role.lower() or "owner" in self.job_role.lower()):
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your product management experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Products/services managed\n- Market size and customer base\n- Cross-functional teams you worked with"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant product achievements? Consider:\n- Product launches or major releases\n- User/customer growth metrics\n- Revenue impact of products you managed\n- Product improvements that solved user problems\n- Strategic product roadmaps you developed"},
-                {"section": "Experience", "key": "product_impact", 
-                "question": f"How have your product decisions made an impact? For example:\n- Market share growth\n- Customer satisfaction improvements\n- Platform innovations\n- Competitive advantages created\n- Business model transformations"}
-            ]
-        elif "ux" in self.job_role.lower() or "ui" in self.job_role.lower() or "designer" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your design experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Products or services you designed for\n- Design tools and methodologies used\n- Team structure and your role within it"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant design achievements? Consider:\n- User experience improvements with measurable impact\n- Design systems or patterns you created\n- Usability testing outcomes\n- Product redesigns and their results\n- Design processes you improved or established"},
-                {"section": "Experience", "key": "design_impact", 
-                "question": f"How have your designs made an impact? For example:\n- Conversion rate improvements\n- User satisfaction or NPS increases\n- Accessibility enhancements\n- Brand perception improvements\n- Efficiency gains through better interfaces"}
-            ]
-        elif "project" in self.job_role.lower() and "manager" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your project management experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Types and sizes of projects managed\n- Methodologies used (Agile, Waterfall, etc.)\n- Team sizes and budgets"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant project management achievements? Consider:\n- Projects delivered on time and under budget\n- Scope or resource challenges overcome\n- Process improvements implemented\n- Risk mitigation successes\n- Stakeholder management wins"},
-                {"section": "Experience", "key": "project_impact", 
-                "question": f"How have your projects made an impact? For example:\n- Business value delivered\n- Operational efficiency improvements\n- Cost savings or revenue generation\n- Quality improvements\n- Organizational capabilities enhanced"}
-            ]
-        elif "operations" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your operations experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Operational scope and scale\n- Key processes or systems managed\n- Team size and structure"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant operational achievements? Consider:\n- Efficiency improvements\n- Cost reductions\n- Quality enhancements\n- Process standardizations\n- Operational scaling successes"},
-                {"section": "Experience", "key": "operational_impact", 
-                "question": f"How have your operational improvements made an impact? For example:\n- Improved customer satisfaction\n- Reduced operational risks\n- Enhanced scalability\n- Better resource utilization\n- Increased operational resilience"}
-            ]
-        elif "customer" in self.job_role.lower() and ("service" in self.job_role.lower() or "success" in self.job_role.lower() or "support" in self.job_role.lower()):
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your customer service experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Customer base and industries served\n- Support channels managed\n- Team structure and escalation processes"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant customer service achievements? Consider:\n- Customer satisfaction or NPS improvements\n- Response time or resolution time enhancements\n- Customer retention increases\n- Support process optimizations\n- Training programs developed"},
-                {"section": "Experience", "key": "customer_impact", 
-                "question": f"How have you improved customer experiences? For example:\n- Customer journey improvements\n- Self-service initiatives\n- Customer feedback implementation\n- Support channel optimization\n- Customer education programs"}
-            ]
-        elif "content" in self.job_role.lower() or "writer" in self.job_role.lower() or "copywriter" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your content creation experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Content types and channels\n- Industries or subject areas\n- Audience size and engagement metrics"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant content achievements? Consider:\n- High-performing content you created\n- SEO improvements or traffic increases\n- Engagement metrics improvements\n- Brand voice developments\n- Editorial processes you improved"},
-                {"section": "Experience", "key": "content_impact", 
-                "question": f"How has your content made an impact? For example:\n- Conversion rate improvements\n- Audience growth\n- Brand awareness increases\n- Educational outcomes\n- Lead generation successes"}
-            ]
-        elif ("consultant" in self.job_role.lower() or "consulting" in self.job_role.lower()):
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your consulting experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Industries and client types\n- Typical project scope and duration\n- Methodologies or frameworks used"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant consulting achievements? Consider:\n- Client problems solved\n- Recommendations implemented successfully\n- ROI delivered to clients\n- Relationship expansions or renewals\n- Innovative solutions developed"},
-                {"section": "Experience", "key": "consulting_impact", 
-                "question": f"How have your consulting engagements made an impact? For example:\n- Client business outcomes improved\n- Transformational changes implemented\n- Efficiency or cost-saving measures\n- Strategic direction influenced\n- Client capabilities enhanced"}
-            ]
-        elif "cyber" in self.job_role.lower() or "security" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your cybersecurity experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Security domains (network, application, cloud, etc.)\n- Tools and technologies used\n- Size and complexity of environments secured"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant security achievements? Consider:\n- Security incidents prevented or mitigated\n- Compliance achievements\n- Security posture improvements\n- Security awareness programs\n- Risk reduction initiatives"},
-                {"section": "Experience", "key": "security_impact", 
-                "question": f"How have your security initiatives made an impact? For example:\n- Risk profile improvements\n- Breach prevention metrics\n- Security maturity advancements\n- Cost-effective security solutions\n- Integration of security into business processes"}
-            ]
-        elif "legal" in self.job_role.lower() or "attorney" in self.job_role.lower() or "lawyer" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your legal experience? For each role, please include:\n- Organization name and your title\n- Dates of employment\n- Areas of law practiced\n- Types of clients or matters handled\n- Team structure and your reporting relationships"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant legal achievements? Consider:\n- Cases or transactions successfully handled\n- Legal risk mitigations\n- Policy or compliance improvements\n- Contract or process optimizations\n- Negotiation outcomes"},
-                {"section": "Experience", "key": "legal_impact", 
-                "question": f"How have your legal contributions made an impact? For example:\n- Cost savings from legal solutions\n- Business strategy support\n- Dispute resolution successes\n- Improved legal processes\n- Enhanced compliance frameworks"}
-            ]
-        elif "healthcare" in self.job_role.lower() or "medical" in self.job_role.lower() or "clinical" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your healthcare experience? For each role, please include:\n- Organization name and your title\n- Dates of employment\n- Clinical or healthcare setting\n- Patient populations served\n- Key responsibilities and specializations"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant healthcare achievements? Consider:\n- Patient outcome improvements\n- Healthcare process enhancements\n- Quality of care initiatives\n- Healthcare technology implementations\n- Team development or training programs"},
-                {"section": "Experience", "key": "healthcare_impact", 
-                "question": f"How have your contributions made an impact on healthcare? For example:\n- Patient satisfaction improvements\n- Care efficiency enhancements\n- Health outcome advancements\n- Cost-effective care solutions\n- Interdisciplinary collaboration successes"}
-            ]
-        elif "research" in self.job_role.lower() or "scientist" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your research experience? For each role, please include:\n- Organization name and your title\n- Dates of employment\n- Research areas and topics\n- Methodologies and equipment used\n- Funding sources and project scales"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant research achievements? Consider:\n- Key findings or discoveries\n- Publications and citations\n- Grants or funding secured\n- Patents or intellectual property\n- Research collaborations established"},
-                {"section": "Experience", "key": "research_impact", 
-                "question": f"How has your research made an impact? For example:\n- Industry applications of findings\n- Influence on subsequent research\n- Policy or practice changes\n- Commercial potential realized\n- Public understanding advanced"}
-            ]
-        elif "teacher" in self.job_role.lower() or "educator" in self.job_role.lower() or "instructor" in self.job_role.lower():
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                "question": f"Could you walk me through your teaching experience? For each role, please include:\n- Institution name and your title\n- Dates of employment\n- Subjects and grade levels taught\n- Class sizes and demographics\n- Teaching methodologies used"},
-                {"section": "Experience", "key": "achievements", 
-                "question": f"What are your most significant teaching achievements? Consider:\n- Student performance improvements\n- Curriculum developments or enhancements\n- Teaching innovations implemented\n- Recognition or awards received\n- Extracurricular programs developed"},
-                {"section": "Experience", "key": "educational_impact", 
-                "question": f"How have your teaching methods made an impact? For example:\n- Student engagement improvements\n- Learning outcome advancements\n- Educational technology implementations\n- Parent or community involvement\n- Student success stories"}
-            ]
-        else:
-            experience_questions = [
-                {"section": "Experience", "key": "job_history", 
-                 "question": f"Could you tell me about your relevant work experience? For each position, please include:\n- Company name and your title\n- Dates of employment\n- Key responsibilities\n- Notable projects or initiatives"},
-                {"section": "Experience", "key": "achievements", 
-                 "question": f"What specific achievements or projects are you most proud of? Think about:\n- Times you solved problems\n- Process improvements\n- Team contributions\n- Customer impact\n- Business results"},
-                {"section": "Experience", "key": "professional_impact", 
-                 "question": f"How have you made an impact in your roles? For example:\n- Process improvements\n- Cost savings\n- Customer satisfaction\n- Team efficiency\n- Business growth"}
-            ]
-        
-        # Education questions - tailored by level
-        if self.resume_level == "executive":
-            education_questions = [
-                {"section": "Education", "key": "education", 
-                 "question": f"What's your educational background? Please include:\n- Degrees earned\n- Institutions attended\n- Graduation dates\n- Relevant coursework\n- Academic achievements\n- Leadership roles in academic organizations"},
-                {"section": "Education", "key": "certifications", 
-                 "question": f"What professional certifications or advanced training do you have? Include:\n- Industry certifications\n- Executive education programs\n- Leadership training\n- Technical certifications\n- Board certifications"}
-            ]
-        elif self.resume_level == "mid-level":
-            education_questions = [
-                {"section": "Education", "key": "education", 
-                 "question": f"What's your educational background? Please include:\n- Degrees earned\n- Institutions attended\n- Graduation dates\n- Relevant coursework\n- Academic achievements"},
-                {"section": "Education", "key": "certifications", 
-                 "question": f"What professional certifications or training do you have? Include:\n- Industry certifications\n- Professional development courses\n- Technical certifications\n- Management training"}
-            ]
-        else:  # junior
-            education_questions = [
-                {"section": "Education", "key": "education", 
-                 "question": f"What's your educational background? Please include:\n- Degrees earned\n- Institutions attended\n- Graduation dates\n- Relevant coursework\n- Academic achievements\n- GPA (if above 3.5)"},
-                {"section": "Education", "key": "certifications", 
-                 "question": f"Do you have any relevant certifications or training? Include:\n- Industry certifications\n- Online courses\n- Technical certifications\n- Internship programs"}
-            ]
-        
-        # Skills questions - tailored by role and level
-        if "developer" in self.job_role.lower() or "engineer" in self.job_role.lower() or "proggramer" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical skills do you have? Please include:\n- Programming languages\n- Frameworks and libraries\n- Databases and tools\n- Development methodologies\n- Cloud platforms\n- Version control systems\n- Testing frameworks"},
-                {"section": "Skills", "key": "soft_skills", 
-                "question": f"What professional skills do you have? Consider:\n- Problem-solving approaches\n- Team collaboration\n- Code review experience\n- Documentation skills\n- Agile methodologies\n- Technical communication"},
-                {"section": "Skills", "key": "domain_knowledge", 
-                "question": f"What domain knowledge do you have? Include:\n- Industry expertise\n- Domain-specific tools\n- Regulatory knowledge\n- Security practices\n- Performance optimization"}
-            ]
-        elif "manager" in self.job_role.lower() or "director" in self.job_role.lower() or "lead" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "leadership_skills", 
-                "question": f"What leadership and management skills do you have? Include:\n- Team management\n- Strategic planning\n- Budget management\n- Change management\n- Conflict resolution\n- Performance management"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical knowledge do you have? Include:\n- Industry expertise\n- Technical concepts\n- Tools and systems\n- Project management\n- Risk management"},
-                {"section": "Skills", "key": "business_skills", 
-                "question": f"What business skills do you have? Consider:\n- Strategic thinking\n- Business analysis\n- Financial management\n- Stakeholder management\n- Process improvement"}
-            ]
-        elif ("data" in self.job_role.lower() or "analyst" in self.job_role.lower() or ("data" in self.job_role.lower() and "scientist" in self.job_role.lower())):  
-            skills_questions = [
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical skills do you have? Please include:\n- Programming languages (Python, R, SQL, etc.)\n- Data visualization tools (Tableau, Power BI, etc.)\n- Statistical analysis methods\n- Machine learning libraries/frameworks\n- Database systems\n- Big data technologies\n- Data processing tools"},
-                {"section": "Skills", "key": "analytical_skills", 
-                "question": f"What analytical skills do you have? Consider:\n- Statistical analysis\n- Predictive modeling\n- Data mining techniques\n- A/B testing\n- Experiment design\n- Hypothesis testing\n- Pattern recognition"},
-                {"section": "Skills", "key": "domain_knowledge", 
-                "question": f"What domain knowledge do you have? Include:\n- Industry expertise\n- Business metrics understanding\n- Data governance knowledge\n- Privacy regulations\n- Ethics in data analysis\n- Industry-specific data challenges"}
-            ]
-        elif "marketing" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "marketing_skills", 
-                "question": f"What marketing skills do you have? Please include:\n- Digital marketing channels\n- Campaign management\n- Content creation\n- Marketing automation tools\n- SEO/SEM expertise\n- Social media platforms\n- Email marketing"},
-                {"section": "Skills", "key": "analytical_skills", 
-                "question": f"What analytical skills do you have? Consider:\n- Marketing metrics tracking\n- Campaign performance analysis\n- Conversion optimization\n- A/B testing\n- Customer segmentation\n- ROI calculation\n- Google Analytics expertise"},
-                {"section": "Skills", "key": "creative_skills", 
-                "question": f"What creative and strategic skills do you have? Include:\n- Brand development\n- Storytelling\n- Market research\n- Customer journey mapping\n- Positioning strategy\n- Competitive analysis\n- Customer insight development"}
-            ]
-        elif "sales" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "sales_skills", 
-                "question": f"What sales skills do you have? Please include:\n- Sales methodologies\n- Client relationship management\n- Negotiation techniques\n- Pipeline management\n- Sales tools (CRM, etc.)\n- Territory management\n- Closing strategies"},
-                {"section": "Skills", "key": "business_skills", 
-                "question": f"What business and analytical skills do you have? Consider:\n- Market analysis\n- Competitive intelligence\n- Sales forecasting\n- Performance metrics tracking\n- Strategic account planning\n- Pricing strategies\n- Value proposition development"},
-                {"section": "Skills", "key": "communication_skills", 
-                "question": f"What communication and interpersonal skills do you have? Include:\n- Presentation skills\n- Relationship building\n- Active listening\n- Objection handling\n- Customer needs assessment\n- Cross-functional collaboration\n- Team selling"}
-            ]
-        elif "hr" in self.job_role.lower() or "human resources" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "hr_skills", 
-                "question": f"What HR skills do you have? Please include:\n- Recruitment and selection\n- Employee relations\n- Performance management\n- Policy development\n- Compensation and benefits\n- Training and development\n- HRIS systems"},
-                {"section": "Skills", "key": "compliance_skills", 
-                "question": f"What compliance and regulatory knowledge do you have? Consider:\n- Labor laws\n- Employment legislation\n- Health and safety regulations\n- Equal opportunity requirements\n- Benefits compliance\n- Records management\n- Risk mitigation strategies"},
-                {"section": "Skills", "key": "people_skills", 
-                "question": f"What people management and strategic skills do you have? Include:\n- Conflict resolution\n- Organizational development\n- Change management\n- Employee engagement\n- Talent management\n- Succession planning\n- Culture development"}
-            ]
-        elif "finance" in self.job_role.lower() or "accountant" in self.job_role.lower() or "financial" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "finance_skills", 
-                "question": f"What finance and accounting skills do you have? Please include:\n- Financial reporting\n- Budgeting and forecasting\n- Financial analysis\n- Accounting principles\n- Taxation knowledge\n- Audit procedures\n- Financial software systems"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and regulatory knowledge do you have? Consider:\n- Accounting standards (GAAP, IFRS)\n- Regulatory compliance\n- Risk management\n- Internal controls\n- Financial modeling\n- ERP systems\n- Data analysis tools"},
-                {"section": "Skills", "key": "business_skills", 
-                "question": f"What business and strategic skills do you have? Include:\n- Business partnership\n- Strategic planning\n- Process improvement\n- Decision support\n- Performance metrics\n- Cost management\n- Investment analysis"}
-            ]
-        elif "product" in self.job_role.lower() and ("manager" in self.job_role.lower() or "owner" in self.job_role.lower()):
-            skills_questions = [
-                {"section": "Skills", "key": "product_skills", 
-                "question": f"What product management skills do you have? Please include:\n- Product lifecycle management\n- Market research\n- User story development\n- Roadmap planning\n- Requirements gathering\n- Product strategy\n- Competitive analysis"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and analytical skills do you have? Consider:\n- Product metrics\n- A/B testing\n- User analytics\n- Agile methodologies\n- Product development tools\n- Data analysis\n- Technical documentation"},
-                {"section": "Skills", "key": "business_skills", 
-                "question": f"What business and leadership skills do you have? Include:\n- Cross-functional team leadership\n- Stakeholder management\n- Go-to-market strategy\n- Pricing strategy\n- Value proposition development\n- Customer journey mapping\n- Business case development"}
-            ]
-        elif "ux" in self.job_role.lower() or "ui" in self.job_role.lower() or "designer" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "design_skills", 
-                "question": f"What design skills do you have? Please include:\n- UX/UI design tools\n- Design principles\n- Wireframing\n- Prototyping\n- Visual design\n- Information architecture\n- Interaction design"},
-                {"section": "Skills", "key": "research_skills", 
-                "question": f"What research and analytical skills do you have? Consider:\n- User research methods\n- Usability testing\n- Heuristic evaluation\n- Persona development\n- Journey mapping\n- A/B testing\n- Accessibility evaluation"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and collaboration skills do you have? Include:\n- Design systems\n- Developer collaboration\n- Front-end knowledge (HTML/CSS)\n- Design documentation\n- Stakeholder presentation\n- Design thinking\n- Product strategy"}
-            ]
-        elif "project" in self.job_role.lower() and "manager" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "pm_skills", 
-                "question": f"What project management skills do you have? Please include:\n- Project methodologies (Agile, Waterfall, etc.)\n- Project scheduling\n- Resource management\n- Risk management\n- Budget planning\n- Stakeholder management\n- Project documentation"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and tool-based skills do you have? Consider:\n- PM software (JIRA, MS Project, etc.)\n- Reporting tools\n- Documentation systems\n- Collaboration platforms\n- Process mapping\n- Technical understanding\n- Quality assurance methods"},
-                {"section": "Skills", "key": "leadership_skills", 
-                "question": f"What leadership and communication skills do you have? Include:\n- Team leadership\n- Conflict resolution\n- Executive communication\n- Client management\n- Change management\n- Decision-making\n- Meeting facilitation"}
-            ]
-        elif "operations" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "operations_skills", 
-                "question": f"What operations management skills do you have? Please include:\n- Process optimization\n- Quality management\n- Supply chain knowledge\n- Resource allocation\n- Logistics management\n- Inventory control\n- Operational metrics"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and analytical skills do you have? Consider:\n- Operations software\n- Data analysis\n- KPI development\n- ERP systems\n- Forecasting\n- Capacity planning\n- Cost analysis"},
-                {"section": "Skills", "key": "leadership_skills", 
-                "question": f"What leadership and strategic skills do you have? Include:\n- Cross-functional collaboration\n- Vendor management\n- Continuous improvement\n- Strategic planning\n- Team development\n- Crisis management\n- Change implementation"}
-            ]
-        elif "customer" in self.job_role.lower() and ("service" in self.job_role.lower() or "success" in self.job_role.lower() or "support" in self.job_role.lower()):
-            skills_questions = [
-                {"section": "Skills", "key": "customer_skills", 
-                "question": f"What customer service skills do you have? Please include:\n- Client communication\n- Problem resolution\n- Customer needs assessment\n- Service recovery\n- Account management\n- Product knowledge\n- Customer experience enhancement"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and systems skills do you have? Consider:\n- CRM systems\n- Ticketing systems\n- Knowledge bases\n- Communication tools\n- Analysis and reporting\n- Service metrics tracking\n- Process documentation"},
-                {"section": "Skills", "key": "business_skills", 
-                "question": f"What business and strategic skills do you have? Include:\n- Customer retention strategies\n- Upselling/cross-selling\n- Voice of customer programs\n- Service level management\n- Quality assurance\n- Team collaboration\n- Process improvement"}
-            ]
-        elif "content" in self.job_role.lower() or "writer" in self.job_role.lower() or "copywriter" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "writing_skills", 
-                "question": f"What writing and content creation skills do you have? Please include:\n- Content types (blogs, whitepapers, etc.)\n- Copywriting\n- Editing and proofreading\n- SEO writing\n- Storytelling\n- Research methods\n- Style guide adaptation"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and tool-based skills do you have? Consider:\n- CMS platforms\n- SEO tools\n- Content planning software\n- Analytics tools\n- Design software\n- Collaboration platforms\n- Social media management"},
-                {"section": "Skills", "key": "strategic_skills", 
-                "question": f"What strategic and planning skills do you have? Include:\n- Content strategy\n- Editorial calendar management\n- Audience analysis\n- Brand voice development\n- Content performance analysis\n- Stakeholder management\n- Project management"}
-            ]
-        elif ("consultant" in self.job_role.lower() or "consulting" in self.job_role.lower()):
-            skills_questions = [
-                {"section": "Skills", "key": "consulting_skills", 
-                "question": f"What consulting and advisory skills do you have? Please include:\n- Problem identification\n- Solution development\n- Client management\n- Project methodology\n- Industry expertise\n- Workshop facilitation\n- Change management"},
-                {"section": "Skills", "key": "analytical_skills", 
-                "question": f"What analytical and research skills do you have? Consider:\n- Business analysis\n- Market research\n- Data analysis\n- Needs assessment\n- ROI calculation\n- Process mapping\n- Competitive analysis"},
-                {"section": "Skills", "key": "communication_skills", 
-                "question": f"What communication and presentation skills do you have? Include:\n- Executive presentations\n- Report writing\n- Proposal development\n- Stakeholder management\n- Negotiation\n- Complex concept explanation\n- Client relationship building"}
-            ]
-        elif "cyber" in self.job_role.lower() or "security" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "security_skills", 
-                "question": f"What cybersecurity skills do you have? Please include:\n- Security frameworks\n- Threat detection\n- Vulnerability assessment\n- Security tools\n- Incident response\n- Penetration testing\n- Security architecture"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical skills do you have? Consider:\n- Network security\n- Cloud security\n- Security coding practices\n- Operating systems\n- Security automation\n- Forensic analysis\n- Cryptography"},
-                {"section": "Skills", "key": "compliance_skills", 
-                "question": f"What governance and compliance skills do you have? Include:\n- Security policies\n- Regulatory compliance\n- Risk assessment\n- Security awareness training\n- Audit management\n- Documentation\n- Security operations"}
-            ]
-        elif "legal" in self.job_role.lower() or "attorney" in self.job_role.lower() or "lawyer" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "legal_skills", 
-                "question": f"What legal skills do you have? Please include:\n- Practice areas\n- Case management\n- Legal research\n- Document drafting\n- Negotiation\n- Client counseling\n- Regulatory knowledge"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and analytical skills do you have? Consider:\n- Legal software\n- eDiscovery tools\n- Legal databases\n- Compliance management\n- Contract analysis\n- Risk assessment\n- Legal writing"},
-                {"section": "Skills", "key": "business_skills", 
-                "question": f"What business and professional skills do you have? Include:\n- Client development\n- Case strategy\n- Project management\n- Cross-functional collaboration\n- Business acumen\n- Ethics compliance\n- Professional networking"}
-            ]
-        elif "healthcare" in self.job_role.lower() or "medical" in self.job_role.lower() or "clinical" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "clinical_skills", 
-                "question": f"What clinical or healthcare skills do you have? Please include:\n- Clinical procedures\n- Patient care\n- Medical specialties\n- Health assessments\n- Treatment planning\n- Medical technology\n- Clinical documentation"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and administrative skills do you have? Consider:\n- Healthcare systems\n- Electronic health records\n- Medical coding\n- Regulatory compliance\n- Quality assurance\n- Healthcare analytics\n- Privacy protocols"},
-                {"section": "Skills", "key": "professional_skills", 
-                "question": f"What professional and interpersonal skills do you have? Include:\n- Patient communication\n- Interdisciplinary collaboration\n- Healthcare education\n- Ethical decision-making\n- Crisis management\n- Continuous learning\n- Compassionate care"}
-            ]
-        elif "research" in self.job_role.lower() or "scientist" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "research_skills", 
-                "question": f"What research skills do you have? Please include:\n- Research methodologies\n- Experimental design\n- Data collection\n- Statistical analysis\n- Literature review\n- Research tools\n- Publication experience"},
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What technical and analytical skills do you have? Consider:\n- Laboratory techniques\n- Specialized equipment\n- Data analysis software\n- Programming languages\n- Visualization tools\n- Documentation systems\n- Research protocols"},
-                {"section": "Skills", "key": "professional_skills", 
-                "question": f"What professional and collaboration skills do you have? Include:\n- Grant writing\n- Research presentation\n- Peer review\n- Team collaboration\n- Project management\n- Ethical research practices\n- Interdisciplinary communication"}
-            ]
-        elif "teacher" in self.job_role.lower() or "educator" in self.job_role.lower() or "instructor" in self.job_role.lower():
-            skills_questions = [
-                {"section": "Skills", "key": "teaching_skills", 
-                "question": f"What teaching and instructional skills do you have? Please include:\n- Teaching methodologies\n- Curriculum development\n- Lesson planning\n- Student assessment\n- Classroom management\n- Educational technology\n- Differentiated instruction"},
-                {"section": "Skills", "key": "subject_skills", 
-                "question": f"What subject matter expertise do you have? Consider:\n- Subject areas\n- Specialized knowledge\n- Curriculum standards\n- Resource development\n- Interdisciplinary connections\n- Current research\n- Industry applications"},
-                {"section": "Skills", "key": "professional_skills", 
-                "question": f"What professional and interpersonal skills do you have? Include:\n- Student engagement\n- Parent communication\n- Collaborative teaching\n- Professional development\n- Educational leadership\n- Cultural competence\n- Special needs accommodation"}
-            ]
-        else:
-            skills_questions = [
-                {"section": "Skills", "key": "technical_skills", 
-                "question": f"What specific skills do you have that are relevant to {self.job_role}? Include:\n- Technical skills\n- Industry knowledge\n- Tools and systems\n- Methodologies\n- Best practices"},
-                {"section": "Skills", "key": "soft_skills", 
-                "question": f"What professional skills do you have? Consider:\n- Communication\n- Problem-solving\n- Teamwork\n- Organization\n- Adaptability\n- Customer service"}
-            ]
-
-            
-        # Languages skills - tailored by role
-        if "international" in self.job_role.lower() or "global" in self.job_role.lower():
-            languages_question = {"section": "Skills", "key": "languages", 
-                                "question": f"What languages do you speak? For each language, please include:\n- Language name\n- Proficiency level (Native, Fluent, Advanced, Intermediate, Basic)\n- Any relevant certifications\n- Experience using the language in a professional context"}
-        else:
-            languages_question = {"section": "Skills", "key": "languages", 
-                                "question": f"What languages do you speak, and at what proficiency level?"}
-        
-        # Additional questions - tailored by level and role
-        if self.resume_level == "executive":
-            additional_questions = [
-                {"section": "Additional", "key": "board_positions", 
-                 "question": f"Have you served on any boards or in advisory roles? Include:\n- Organization name\n- Role and duration\n- Key contributions\n- Strategic initiatives\n- Industry impact"},
-                {"section": "Additional", "key": "speaking", 
-                 "question": f"Have you done any speaking engagements or published work? Include:\n- Conferences and events\n- Publications\n- Media appearances\n- Industry panels\n- Thought leadership content"},
-                {"section": "Additional", "key": "industry_leadership", 
-                 "question": f"How have you demonstrated industry leadership? Consider:\n- Industry associations\n- Professional organizations\n- Mentoring programs\n- Industry initiatives\n- Thought leadership"}
-            ]
-        elif self.resume_level == "mid-level":
-            additional_questions = [
-                {"section": "Additional", "key": "projects", 
-                 "question": f"Have you worked on any noteworthy projects? Include:\n- Project scope\n- Your role\n- Key achievements\n- Technical challenges\n- Business impact"},
-                {"section": "Additional", "key": "professional_activities", 
-                 "question": f"Have you participated in any professional activities? Include:\n- Professional organizations\n- Industry events\n- Training programs\n- Mentoring\n- Community involvement"},
-                {"section": "Additional", "key": "industry_contributions", 
-                 "question": f"How have you contributed to your industry? Consider:\n- Knowledge sharing\n- Process improvements\n- Best practices\n- Team development\n- Industry initiatives"}
-            ]
-        else:  # junior
-            additional_questions = [
-                {"section": "Additional", "key": "projects", 
-                 "question": f"Have you worked on any academic or personal projects? Include:\n- Project description\n- Your role\n- Technologies used\n- Key achievements\n- Learning outcomes"},
-                {"section": "Additional", "key": "activities", 
-                 "question": f"What extracurricular activities have you participated in? Include:\n- Student organizations\n- Volunteer work\n- Internships\n- Academic clubs\n- Community involvement"},
-                {"section": "Additional", "key": "achievements", 
-                 "question": f"What other achievements would you like to highlight? Consider:\n- Academic awards\n- Competition wins\n- Personal projects\n- Community service\n- Leadership roles"}
-            ]
-            
-        # Final catch-all question
-        final_question = {"section": "Additional", "key": "additional_info", 
-                         "question": f"Is there anything else you'd like to include on your resume that we haven't covered yet? Consider:\n- Unique experiences\n- Special achievements\n- Relevant hobbies\n- Industry-specific certifications\n- Notable accomplishments"}
-        
-        # Combine all questions in a logical order
-        combined_questions = basic_questions + [summary_question] + experience_questions + education_questions + skills_questions + [languages_question] + additional_questions + [final_question]
-        
-        return combined_questions
+        # Role classification and the question lists are precomputed and shared between sessions
+        return build_questions(self.job_role, self.resume_level)
 
     def welcome(self):
         """Display a welcome message and start the conversation"""
@@ -843,7 +412,8 @@ class EnhancedResumeBuilder:
     
         try:
         # Get analysis from GPT
-            response = openai.chat.completions.create(
+            response = llm_gateway.chat_completion(
+                cache_site="skills_analysis",
                 model="gpt-4-turbo-preview",
                 messages=[
                     {"role": "system", "content": "You are an expert at identifying relevant professional skills from job descriptions and experiences."},
@@ -959,7 +529,8 @@ class EnhancedResumeBuilder:
                 return  # Skip feedback for other fields
             
             # Use the new OpenAI API format
-            response = openai.chat.completions.create(
+            response = llm_gateway.chat_completion(
+                cache_site="answer_feedback",
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a helpful resume coach giving brief, friendly, specific advice."},
@@ -1022,94 +593,21 @@ class EnhancedResumeBuilder:
             language_suffix = target_language.lower().replace(' ', '')
             translated_filename = f"{base_filename}_{language_suffix}{file_extension}"
             
-            # יצירת הנחיות לתרגום
-            instructions = f"""
-            Translate the following resume content to {target_language}.
-            
-            IMPORTANT TRANSLATION RULES:
-            1. Maintain the exact same formatting and structure as the original
-            2. Preserve all HTML tags exactly as they are (if present)
-            3. DO NOT translate the following elements (keep them in their original form):
-            - Email addresses and phone numbers
-            - Website URLs and social media handles
-            - Company names and product names
-            - Programming languages, tools, and technical terms
-            - Academic degrees (like BSc, BA, MBA, PhD) - only translate their descriptions
-            - Personal names
-            
-            For technical terms in {target_language}, use the standard industry terminology.
-            """
-            
-            # קריאה ל-OpenAI API לתרגום
-            response = openai.chat.completions.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": instructions},
-                    {"role": "user", "content": original_content}
-                ],
-                temperature=0.3,
-                max_tokens=4000,
+            # תרגום במקטעים - מקטעים שכבר תורגמו בעבר מגיעים מזיכרון התרגומים
+            translated_content = asyncio.run(translate_resume_content(
+                original_content,
+                target_language,
+                is_html=file_extension.lower() == '.html'
+            ))
+            
+            # כיוון ושפת המסמך (RTL לעברית, ערבית וכו') - משותף ל-API
+            translated_content = apply_direction(
+                translated_content,
+                target_language,
+                is_html=file_extension.lower() == '.html',
+                resume_style=getattr(self, 'resume_style', None)
             )
             
-            # קבלת התוכן המתורגם
-            translated_content = response.choices[0].message.content
-            
-            # הוספת תמיכה בכיווניות RTL אם השפה היא עברית, ערבית או אחרת שכותבים מימין לשמאל
-            rtl_languages = ['hebrew', 'עברית', 'arabic', 'ערבית', 'farsi', 'פרסית', 'urdu', 'אורדו']
-            if any(lang in target_language.lower() for lang in rtl_languages):
-                if file_extension.lower() == '.html':
-                    # אם זה קובץ HTML, צריך להוסיף תכונות RTL לתגי HTML
-                    if '<html' in translated_content:
-                        # הוספת תכונות dir="rtl" ו-lang לתג HTML
-                        translated_content = translated_content.replace('<html', '<html dir="rtl"', 1)
-                    
-                    if '<body' in translated_content:
-                        # הוספת class לתג body
-                        translated_content = translated_content.replace('<body', '<body style="text-align: right; direction: rtl;"', 1)
-                    
-                    # אם יש רק טקסט HTML בלי תגי בסיס, נעטוף אותו בתגים מתאימים
-                    if '<html' not in translated_content:
-                        translated_content = f"""<!DOCTYPE html>
-    <html dir="rtl" lang="he">
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            body {{
-                direction: rtl;
-                text-align: right;
-                font-family: 'Arial', 'David', sans-serif;
-            }}
-            p, div, table, ul, ol {{
-                direction: rtl;
-                text-align: right;
-            }}
-        </style>
-    </head>
-    <body>
-    {translated_content}
-    </body>
-    </html>"""
-                    
-                    # הוספת CSS מיוחד לפורמט העברי
-                    if '</head>' in translated_content:
-                        rtl_css = """
-        <style>
-            /* RTL specific styles */
-            body, p, div, table, ul, ol {
-                direction: rtl;
-                text-align: right;
-            }
-            /* Hebrew optimized fonts */
-            body {
-                font-family: 'Arial', 'David', 'Times New Roman', sans-serif;
-            }
-        </style>"""
-                        translated_content = translated_content.replace('</head>', f'{rtl_css}\n</head>', 1)
-                
-                else:
-                    # אם זה קובץ טקסט, נוסיף הערה בראש הקובץ
-                    translated_content = f"<כיוון טקסט מימין לשמאל>\n\n{translated_content}"
-            
             # שמירת הקובץ המתורגם על שולחן העבודה
             full_translated_path = os.path.join(desktop_path, translated_filename)
             
@@ -1244,131 +742,9 @@ class EnhancedResumeBuilder:
             if key in self.user_data and self.user_data[key] and key != 'full_name':
                 user_message += f"{question['section'].upper()} - {question['question']}\n{self.user_data[key]}\n\n"
         
-        # Output format instructions
-        if use_html:
-            user_message += f"""
-            Please create the resume in HTML format that reflects a {resume_style} style and suitable for a {self.resume_level} level position.
-            Do not include any CSS in the HTML style tags, Keep the empty style tags, the CSS it will be added by other enhancement function.
-
-            fill in the following HTML template with the candidate's information.
-            DO NOT modify the structure or class names, only fill in the content based on the information provided:
-
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>[CANDIDATE_NAME] - Resume</title>
-                <style>
-                    /* CSS will be added by enhancement function */
-                </style>
-            </head>
-            <body class="[RESUME_STYLE]">
-                <div class="resume-container">
-                    <!-- Header Section -->
-                    <div class="resume-header">
-                        <h1>[CANDIDATE_NAME]</h1>
-                        <p class="job-title">[JOB_ROLE]</p>
-                    </div>
-                    
-                    <!-- Contact Information -->
-                    <div class="contact-info">
-                        <p>[EMAIL] [PHONE] [LOCATION] - Use appropriate separators like | between items if multiple exist</p>
-                        <p>[LINKEDIN] [PORTFOLIO] - Include only if provided</p>
-                    </div>
-                    
-                    <!-- Summary Section - Include only if professional summary is provided -->
-                    <div class="section" id="summary">
-                        <h2>Professional Summary</h2>
-                        <div class="summary">
-                            <p>[PROFESSIONAL_SUMMARY]</p>
-                        </div>
-                    </div>
-                    
-                    <!-- Experience Section - Include only if work experience is provided -->
-                    <div class="section" id="experience">
-                        <h2>Professional Experience</h2>
-                        
-                        <!-- For each job position, create a separate experience-item div -->
-                        <div class="experience-item">
-                            <h3 class="job-position">[POSITION_TITLE] <span class="job-date">[EMPLOYMENT_DATES]</span></h3>
-                            <p class="job-company">[COMPANY_NAME], <span class="job-location">[JOB_LOCATION]</span></p>
-                            <ul>
-                                <li>[RESPONSIBILITY/ACHIEVEMENT 1]</li>
-                                <li>[RESPONSIBILITY/ACHIEVEMENT 2]</li>
-                                <!-- Add more list items as needed based on the information provided -->
-                            </ul>
-                        </div>
-                        <!-- Repeat experience-item div for each additional job -->
-                    </div>
-                    
-                    <!-- Education Section - Include only if education information is provided -->
-                    <div class="section" id="education">
-                        <h2>Education</h2>
-                        
-                        <!-- For each educational qualification, create a separate education-item div -->
-                        <div class="education-item">
-                            <h3 class="education-degree">[DEGREE_NAME] <span class="education-date">[EDUCATION_DATES]</span></h3>
-                            <p class="education-institution">[INSTITUTION_NAME], <span class="education-location">[EDUCATION_LOCATION]</span></p>
-                            <!-- Include the following ul only if there are specific education details to mention -->
-                            <ul>
-                                <li>[EDUCATION_DETAIL_1]</li>
-                                <li>[EDUCATION_DETAIL_2]</li>
-                            </ul>
-                        </div>
-                        <!-- Repeat education-item div for each additional education entry -->
-                    </div>
-                    
-                    <!-- Skills Section - Include only if skills are provided -->
-                    <div class="section" id="skills">
-                        <h2>Skills</h2>
-                        <ul class="skills-list">
-                            <li>[SKILL_1]</li>
-                            <li>[SKILL_2]</li>
-                            <!-- Add more skills as provided -->
-                        </ul>
-                    </div>
-                    
-                    <!-- Languages Section - Include only if language information is provided -->
-                    <div class="section" id="languages">
-                        <h2>Languages</h2>
-                        <ul>
-                            <li>[LANGUAGE_1] - [PROFICIENCY_LEVEL_1]</li>
-                            <li>[LANGUAGE_2] - [PROFICIENCY_LEVEL_2]</li>
-                            <!-- Add more languages as provided -->
-                        </ul>
-                    </div>
-                    
-                    <!-- Additional Information - Include only if additional information is provided -->
-                    <div class="section" id="additional">
-                        <h2>Additional Information</h2>
-                        <p>[ADDITIONAL_INFO]</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-
-            ...
-            IMPORTANT INSTRUCTIONS:
-            1. Replace all placeholder text in [SQUARE_BRACKETS] with actual content from the candidate's information.
-            2. COMPLETELY REMOVE any section (including its heading) if no information is provided for that section.
-            3. COMPLETELY REMOVE any list items or paragraphs where no information is available.
-            4. Do not include placeholder text or section headings for missing information.
-            5. Ensure the HTML structure remains valid and properly nested after removing empty sections.
-            6. Replace [RESUME_STYLE] with the actual style name: "traditional", "modern", or "creative".
-            ...
-
-
-            
-            DO NOT include any placeholders or lorem ipsum text - use only the information provided.
-            """
-        
-        else:
-            user_message += f"""
-            Please create the resume in plain text format, formatted to be easily readable. 
-            Use markdown-style formatting where helpful (bold, italics, etc.).
-            Organize the content with clear section headings and consistent structure.
-            """
+        # Output format instructions - the model returns the content as JSON,
+        # the HTML / text resume is rendered locally from it
+        user_message += resume_json_instructions()
         
         try:
             # Create a loading animation
@@ -1380,18 +756,22 @@ class EnhancedResumeBuilder:
             print("\n")
             
             # Use the new OpenAI API format
-            response = openai.chat.completions.create(
+            response = llm_gateway.chat_completion(
+                cache_site="resume_generation",
                 model="gpt-4-turbo-preview",
                 messages=[
                     {"role": "system", "content": system_message},
                     {"role": "user", "content": user_message}
                 ],
+                response_format={"type": "json_object"},
                 temperature=0.7,
                 max_tokens=4000,
             )
             
-            # Get the resume text from the new response format
-            resume_text = response.choices[0].message.content
+            # Validate the structured resume and render it in the chosen format
+            self.resume_document = parse_resume_document(response.choices[0].message.content)
+            self.resume_style = resume_style
+            resume_text = render_resume(self.resume_document, "html" if use_html else "text", resume_style)
             
             # Generate filename with user name and job role
             name_part = self.user_data.get('full_name', 'resume').replace(' ', '_').lower()
@@ -1485,886 +865,47 @@ class EnhancedResumeBuilder:
             with open(filename, 'r', encoding='utf-8') as file:
                 html_content = file.read()
                 
-# Check if the HTML has basic structure elements
-            if '<!DOCTYPE html>' not in html_content:
-                # If basic structure is missing, add a proper HTML wrapper
-                improved_html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{self.user_data.get('full_name', 'Resume')} - {self.job_role} Resume</title>
-    <style>
-        /* Base styles */
-        body {{
-            font-family: 'Calibri', 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.5;
-            color: #333;
-            max-width: 8.5in;
-            margin: 0 auto;
-            padding: 0.5in;
-        }}
-        /* Add default styling if none was provided */
-    </style>
-</head>
-<body>
-{html_content}
-</body>
-</html>"""
-                
-                with open(filename, 'w', encoding='utf-8') as file:
-                    file.write(improved_html)
-                    
-            # Check for common styling issues and possibly enhance
-            self._apply_additional_styles(filename)
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write(self._enhance_html_content(html_content))
                 
         except Exception as e:
             # Silently fail - the original HTML should still be functional
             pass
     
+    def _enhance_html_content(self, html_content):
+        """In-memory version of _enhance_html_resume - returns the enhanced HTML"""
+        try:
+            return postprocess_resume_html(
+                html_content,
+                resume_style=getattr(self, 'resume_style', None),
+                full_name=self.user_data.get('full_name', 'Resume'),
+                job_role=self.job_role
+            )
+        except Exception as e:
+            # Silently fail - the original HTML should still be functional
+            return html_content
+    
     def _apply_additional_styles(self, filename):
         """Apply additional styles to ensure professional appearance"""
         try:
             with open(filename, 'r', encoding='utf-8') as file:
                 html_content = file.read()
-                    
-            # Check if there's a style section
-            if '<style>' in html_content and '</style>' in html_content:
-                # Add improved styling that maintains the original layout but enhances appearance
-                #עיצוב תוצר סופי      
-                enhanced_styles = """
-            /* Enhanced base styles */
-            body {
-                font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                background-color: #f9f9f9;
-                margin: 0;
-                padding: 0;
-            }
-            
-            .resume-container {
-                max-width: 8.5in;
-                margin: 30px auto;
-                padding: 40px;
-                background-color: #fff;
-                box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-                border-radius: 4px;
-            }
-            
-            /* Improved typography */
-            h1 {
-                font-size: 28px;
-                color: #2c3e50;
-                margin-bottom: 5px;
-                font-weight: bold !important;
-            }
-            
-            h2 {
-                font-size: 22px;
-                color: #2c3e50;
-                margin-top: 25px;
-                margin-bottom: 15px;
-                border-bottom: 2px solid #eaeaea;
-                padding-bottom: 8px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-            
-            h3 {
-                font-size: 18px;
-                color: #34495e;
-                margin-bottom: 8px;
-                margin-top: 15px;
-            }
-            
-            p {
-                margin-bottom: 10px;
-            }
-            
-            /* Enhanced header */
-            .resume-header {
-                text-align: center;
-                margin-bottom: 30px;
-            }
-            
-            .job-title {
-                font-size: 18px;
-                color: #7f8c8d;
-                margin-bottom: 15px;
-            }
-            
-            /* Improved contact info */
-            .contact-info {
-            font-size: 15px;
-            margin-bottom: 15px;
-            text-align: center;
-            padding-bottom: 20px;
-            border-bottom: 1px solid #eaeaea;  /* הוסף שורה זו */
-            }
-            
-            .contact-info p {
-                margin: 5px 0;
-            }
-            
-            /* Enhanced sections */
-            .section {
-                margin-bottom: 25px;
-            }
-            
-            /* Experience and education items */
-            .experience-item, .education-item {
-                margin-bottom: 20px;
-                position: relative;
-            }
-            
-            .job-position, .education-degree {
-                font-weight: bold;
-                color: #2c3e50;
-                margin-bottom: 3px;
-            }
-            
-            .job-date, .education-date, .date-range {
-                float: right;
-                font-style: italic;
-                color: #7f8c8d;
-            }
-            
-            .job-company, .education-institution, .company-name, .institution-name {
-                font-weight: 500;
-                color: #34495e;
-            }
-            
-            .job-location, .education-location {
-                color: #7f8c8d;
-                font-style: italic;
-            }
-            
-            /* List styling */
-            ul {
-                margin-top: 10px;
-                margin-bottom: 15px;
-                padding-left: 20px;
-            }
-            
-            ul li {
-                margin-bottom: 8px;
-                position: relative;
-            }
-            
-            /* Skills columns */
-            .skills-list {
-                columns: 2;
-                column-gap: 30px;
-                list-style-type: none;
-                padding-left: 0;
-            }
-            
-            .skills-list li {
-                margin-bottom: 8px;
-                break-inside: avoid;
-                position: relative;
-                padding-left: 15px;
-            }
-            
-            .skills-list li:before {
-                content: "•";
-                position: absolute;
-                left: 0;
-            }
-            
-            /* Summary section */
-            .summary {
-                background-color: #f8f9fa;
-                padding: 15px;
-                border-left: 3px solid #3498db;
-                margin-bottom: 25px;
-                line-height: 1.6;
-            }
-            
-            /* Style variations - Enhanced with fonts, borders, spacing, etc. */
-            /* Traditional style */
-            .traditional {
-                font-family: 'Georgia', 'Times New Roman', serif;
-            }
-            
-            .traditional h1 {
-                color: #1a3c5a;
-                font-weight: 600;
-            }
-            
-            .traditional h2 {
-                color: #1a3c5a;
-                border-bottom: 2px solid #c4d3df;
-                letter-spacing: 0.5px;
-            }
-            
-            .traditional .job-position, .traditional .education-degree {
-                color: #1a3c5a;
-            }
-            
-            .traditional .summary {
-                border-left: 3px solid #1a3c5a;
-                background-color: #f5f8fa;
-                border-radius: 0;
-            }
-            
-            .traditional .skills-list li:before {
-                content: "■";
-                font-size: 8px;
-                color: #1a3c5a;
-            }
-            
-            .traditional p {
-                line-height: 1.5;
-                margin-bottom: 8px;
-            }
-            
-            /* Modern style */
-            .modern {
-                font-family: 'Helvetica Neue', Arial, sans-serif;
-            }
-            
-            .modern h1 {
-                color: #3a4750;
-                font-weight: 400;
-            }
-            
-            .modern h2 {
-                color: #3a4750;
-                border-bottom: 1px solid #dfe4e8;
-                letter-spacing: 1px;
-            }
-            
-            .modern .job-position, .modern .education-degree {
-                color: #3a4750;
-            }
-            
-            .modern .summary {
-                border-left: 4px solid #3a4750;
-                background-color: #f7f7f7;
-                border-radius: 2px;
-            }
-            
-            .modern .skills-list li:before {
-                content: "•";
-                font-size: 14px;
-                color: #3a4750;
-            }
-            
-            .modern p {
-                line-height: 1.7;
-                margin-bottom: 12px;
-            }
-            
-            /* Creative style */
-            .creative {
-                font-family: 'Segoe UI', 'Roboto', sans-serif;
-            }
-            
-            .creative h1 {
-                color: #654ea3;
-                font-weight: 500;
-            }
-            
-            .creative h2 {
-                color: #654ea3;
-                border-bottom: 2px dotted #e1d9f2;
-                letter-spacing: 1.2px;
-            }
-            
-            .creative .job-position, .creative .education-degree {
-                color: #654ea3;
-            }
-            
-            .creative .summary {
-                border-left: 4px solid #654ea3;
-                background-color: #f9f7fd;
-                border-radius: 4px;
-                box-shadow: 0 2px 5px rgba(101, 78, 163, 0.1);
-            }
-            
-            .creative .skills-list li:before {
-                content: none !important;
-                font-size: 10px;
-            }
-            /* עיצוב "טאב" מסביב לכל סקיל */
-            .creative .skills-list li {
-                display: inline-block;           /* מסדר את הפריטים זה לצד זה */
-                background-color: rgba(101, 78, 163, 0.08); 
-                border: 1px solid #654ea3;      /* ניתן לשנות את עובי וצבע המסגרת לפי הצורך */
-                border-radius: 20px;            /* יוצר את הפינות העגולות (טאב) */
-                padding: 8px 14px;              /* רווח פנימי */
-                margin: 4px;                    /* רווח בין סקילים */
-                cursor: default;                /* לא חובה, רק כדי לבטל סמן של טקסט */
-            }
-            .creative p {
-                line-height: 1.8;
-                margin-bottom: 14px;
-            }
-            
-            /* Experience items styling per theme */
-            .traditional .experience-item, .traditional .education-item {
-                border-left: 0;
-                padding-left: 0;
-            }
-            
-            .modern .experience-item, .modern .education-item {
-                border-left: 0;
-                padding-left: 0;
-                margin-bottom: 25px;
-            }
-            
-            .creative .experience-item, .creative .education-item {
-                border-left: 2px solid #f0e9ff;
-                padding-left: 15px;
-                border-radius: 0 4px 4px 0;
-                margin-bottom: 30px;
-            }
-            /* Editable content styling */
-            [contenteditable=true] {
-                position: relative;
-            }
-            
-            [contenteditable=true]:hover {
-                background-color: rgba(135, 206, 250, 0.3);
-                cursor: default;
-            }
-            
-            [contenteditable=true]:hover::after {
-                content: "✏️";
-                position: absolute;
-                bottom: 4px;
-                right: 4px;
-                font-size: 12px;
-                opacity: 0.6;
-                pointer-events: none;
-            }
-            
-            [contenteditable=true]:focus {
-                outline: 1px solid #4682B4;
-                background-color: rgba(135, 206, 250, 0.2);
-            }
-            
-            .save-button {
-                position: fixed;
-                bottom: 20px;
-                right: 20px;
-                background-color: #4682B4;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                cursor: pointer;
-                font-weight: bold;
-                z-index: 1000;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            
-            .save-button:hover {
-                background-color: #36648B;
-            }
-            
-            .save-notification {
-                position: fixed;
-                bottom: 80px;
-                right: 20px;
-                background-color: #2E8B57;
-                color: white;
-                padding: 10px 20px;
-                border-radius: 5px;
-                display: none;
-                z-index: 1000;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            .print-button {
-                position: fixed;
-                bottom: 20px;
-                left: 20px;
-                background-color: #607D8B;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                cursor: pointer;
-                font-weight: bold;
-                z-index: 1000;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            
-            .print-button:hover {
-                background-color: #455A64;
-            }
-            """
-                
-                # Insert the enhanced styles into existing style section
-                html_content = html_content.replace('</style>', enhanced_styles + '\n</style>')
-                
-                # Add style class to body based on resume_style
-                resume_style_class = ""
-                if hasattr(self, 'resume_style'):
-                    resume_style_class = self.resume_style
-                
-                # Add class to body tag for styling variations
-                if '<body' in html_content and resume_style_class:
-                    if 'class=' in html_content:
-                        # If body already has class attribute
-                        html_content = html_content.replace('<body class="', f'<body class="{resume_style_class} ')
-                    else:
-                        # If body doesn't have class attribute
-                        html_content = html_content.replace('<body', f'<body class="{resume_style_class}"')
-                
-                
-                    # Add container div if not already present
-                    if '<div class="resume-container">' not in html_content:
-                        start_content = html_content.find('<body')
-                        end_body_tag = html_content.find('>', start_content) + 1
-                        
-                        html_content = html_content[:end_body_tag] + '\n<div class="resume-container">\n' + html_content[end_body_tag:]
-                        
-                        # Close the container div before the closing body tag
-                        html_content = html_content.replace('</body>', '</div>\n</body>')
-
-                    # Add the editing script if not already there
-                    if 'document.addEventListener(\'DOMContentLoaded\'' not in html_content:
-                        editing_script = """
-                    <script>
-                        // Make all elements with contenteditable=true actually editable
-                        document.addEventListener('DOMContentLoaded', function() {
-                            // Keep track of original content for change detection
-                            const originalContents = {};
-                            const editableElements = document.querySelectorAll('[contenteditable=true]');
-                            
-                            editableElements.forEach(function(element, index) {
-                                // Store original content
-                                originalContents[index] = element.innerHTML;
-                                
-                                // Add event listener to track edits
-                                element.addEventListener('input', function() {
-                                    window.resumeHasUnsavedChanges = true;
-                                });
-                            });
-                            
-                    </script>
-                    """
-                        html_content = html_content.replace('</body>', f'{editing_script}\n</body>')
-                
-                # הוסף קוד פשוט להוספת contenteditable לאלמנטים
-                if '<div class="resume-header">' in html_content:
-                    html_content = html_content.replace('<div class="resume-header">', '<div class="resume-header" contenteditable="true">')
-                if '<div class="summary">' in html_content:
-                    html_content = html_content.replace('<div class="summary">', '<div class="summary" contenteditable="true">')
-                if '<div class="experience-item">' in html_content:
-                    html_content = html_content.replace('<div class="experience-item">', '<div class="experience-item" contenteditable="true">')
-                if '<div class="education-item">' in html_content:
-                    html_content = html_content.replace('<div class="education-item">', '<div class="education-item" contenteditable="true">')
-                if '<div class="section">' in html_content:
-                    html_content = html_content.replace('<div class="section">', '<div class="section" contenteditable="true">')
-
-                # Write the enhanced HTML back to the file
-                with open(filename, 'w', encoding='utf-8') as file:
-                    file.write(html_content)
-
-              #עיצוב ברירת מחדל      
-            else:
-                # If no style section exists, create one with all styling
-                default_styles = """<style>
-            /* Enhanced base styles */
-            body {
-                font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                background-color: #f9f9f9;
-                margin: 0;
-                padding: 0;
-            }
-            
-            .resume-container {
-                max-width: 8.5in;
-                margin: 30px auto;
-                padding: 40px;
-                background-color: #fff;
-                box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
-                border-radius: 4px;
-            }
-            
-            /* Improved typography */
-            h1 {
-                font-size: 28px;
-                color: #2c3e50;
-                margin-bottom: 5px;
-                font-weight: bold !important;
-            }
-            
-            h2 {
-                font-size: 22px;
-                color: #2c3e50;
-                margin-top: 25px;
-                margin-bottom: 15px;
-                border-bottom: 2px solid #eaeaea;
-                padding-bottom: 8px;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-            }
-            
-            h3 {
-                font-size: 18px;
-                color: #34495e;
-                margin-bottom: 8px;
-                margin-top: 15px;
-            }
-            
-            p {
-                margin-bottom: 10px;
-            }
-            
-            /* Enhanced header */
-            .resume-header {
-                text-align: center;
-                margin-bottom: 30px;
-            }
-            
-            .job-title {
-                font-size: 18px;
-                color: #7f8c8d;
-                margin-bottom: 15px;
-            }
-            
-            /* Improved contact info */
-            .contact-info {
-            font-size: 15px;
-            margin-bottom: 15px;
-            text-align: center;
-            padding-bottom: 20px;
-            border-bottom: 1px solid #eaeaea;  /* הוסף שורה זו */
-            }
-            
-            .contact-info p {
-                margin: 5px 0;
-            }
-            
-            /* Enhanced sections */
-            .section {
-                margin-bottom: 25px;
-            }
-            
-            /* Experience and education items */
-            .experience-item, .education-item {
-                margin-bottom: 20px;
-                position: relative;
-            }
-            
-            .job-position, .education-degree {
-                font-weight: bold;
-                color: #2c3e50;
-                margin-bottom: 3px;
-            }
-            
-            .job-date, .education-date, .date-range {
-                float: right;
-                font-style: italic;
-                color: #7f8c8d;
-            }
-            
-            .job-company, .education-institution, .company-name, .institution-name {
-                font-weight: 500;
-                color: #34495e;
-            }
-            
-            .job-location, .education-location {
-                color: #7f8c8d;
-                font-style: italic;
-            }
-            
-            /* List styling */
-            ul {
-                margin-top: 10px;
-                margin-bottom: 15px;
-                padding-left: 20px;
-            }
-            
-            ul li {
-                margin-bottom: 8px;
-                position: relative;
-            }
-            
-            /* Skills columns */
-            .skills-list {
-                columns: 2;
-                column-gap: 30px;
-                list-style-type: none;
-                padding-left: 0;
-            }
-            
-            .skills-list li {
-                margin-bottom: 8px;
-                break-inside: avoid;
-                position: relative;
-                padding-left: 15px;
-            }
-            
-            .skills-list li:before {
-                content: "•";
-                position: absolute;
-                left: 0;
-            }
-            
-            /* Summary section */
-            .summary {
-                background-color: #f8f9fa;
-                padding: 15px;
-                border-left: 3px solid #3498db;
-                margin-bottom: 25px;
-                line-height: 1.6;
-            }
-            
-            /* Style variations - Enhanced with fonts, borders, spacing, etc. */
-            /* Traditional style */
-            .traditional {
-                font-family: 'Georgia', 'Times New Roman', serif;
-            }
-            
-            .traditional h1 {
-                color: #1a3c5a;
-                font-weight: 600;
-            }
-            
-            .traditional h2 {
-                color: #1a3c5a;
-                border-bottom: 2px solid #c4d3df;
-                letter-spacing: 0.5px;
-            }
-            
-            .traditional .job-position, .traditional .education-degree {
-                color: #1a3c5a;
-            }
-            
-            .traditional .summary {
-                border-left: 3px solid #1a3c5a;
-                background-color: #f5f8fa;
-                border-radius: 0;
-            }
-            
-            .traditional .skills-list li:before {
-                content: "■";
-                font-size: 8px;
-                color: #1a3c5a;
-            }
-            
-            .traditional p {
-                line-height: 1.5;
-                margin-bottom: 8px;
-            }
-            
-            /* Modern style */
-            .modern {
-                font-family: 'Helvetica Neue', Arial, sans-serif;
-            }
-            
-            .modern h1 {
-                color: #3a4750;
-                font-weight: 400;
-            }
-            
-            .modern h2 {
-                color: #3a4750;
-                border-bottom: 1px solid #dfe4e8;
-                letter-spacing: 1px;
-            }
-            
-            .modern .job-position, .modern .education-degree {
-                color: #3a4750;
-            }
-            
-            .modern .summary {
-                border-left: 4px solid #3a4750;
-                background-color: #f7f7f7;
-                border-radius: 2px;
-            }
-            
-            .modern .skills-list li:before {
-                content: "•";
-                font-size: 14px;
-                color: #3a4750;
-            }
-            
-            .modern p {
-                line-height: 1.7;
-                margin-bottom: 12px;
-            }
-            
-            /* Creative style */
-            .creative {
-                font-family: 'Segoe UI', 'Roboto', sans-serif;
-            }
-            
-            .creative h1 {
-                color: #654ea3;
-                font-weight: 500;
-            }
-            
-            .creative h2 {
-                color: #654ea3;
-                border-bottom: 2px dotted #e1d9f2;
-                letter-spacing: 1.2px;
-            }
-            
-            .creative .job-position, .creative .education-degree {
-                color: #654ea3;
-            }
-            
-            .creative .summary {
-                border-left: 4px solid #654ea3;
-                background-color: #f9f7fd;
-                border-radius: 4px;
-                box-shadow: 0 2px 5px rgba(101, 78, 163, 0.1);
-            }
-            
-            .creative .skills-list li:before {
-                content: none !important;
-                font-size: 10px;
-            }
-            /* עיצוב "טאב" מסביב לכל סקיל */
-            .creative .skills-list li {
-                display: inline-block;           /* מסדר את הפריטים זה לצד זה */
-                background-color: rgba(101, 78, 163, 0.08); 
-                border: 1px solid #654ea3;      /* ניתן לשנות את עובי וצבע המסגרת לפי הצורך */
-                border-radius: 20px;            /* יוצר את הפינות העגולות (טאב) */
-                padding: 8px 14px;              /* רווח פנימי */
-                margin: 4px;                    /* רווח בין סקילים */
-                cursor: default;                /* לא חובה, רק כדי לבטל סמן של טקסט */
-            }
-            
-            .creative p {
-                line-height: 1.8;
-                margin-bottom: 14px;
-            }
-            
-            /* Experience items styling per theme */
-            .traditional .experience-item, .traditional .education-item {
-                border-left: 0;
-                padding-left: 0;
-            }
-            
-            .modern .experience-item, .modern .education-item {
-                border-left: 0;
-                padding-left: 0;
-                margin-bottom: 25px;
-            }
-            
-            .creative .experience-item, .creative .education-item {
-                border-left: 2px solid #f0e9ff;
-                padding-left: 15px;
-                border-radius: 0 4px 4px 0;
-                margin-bottom: 30px;
-            }
-            /* Editable content styling */
-            [contenteditable=true] {
-                position: relative;
-            }
-            
-            [contenteditable=true]:hover {
-                background-color: rgba(135, 206, 250, 0.3);
-                cursor: default;
-            }
-            
-            [contenteditable=true]:hover::after {
-                content: "✏️";
-                position: absolute;
-                bottom: 4px;
-                right: 4px;
-                font-size: 12px;
-                opacity: 0.6;
-                pointer-events: none;
-            }
-            
-            [contenteditable=true]:focus {
-                outline: 1px solid #4682B4;
-                background-color: rgba(135, 206, 250, 0.2);
-            }
-            
-            .save-button {
-                position: fixed;
-                bottom: 20px;
-                right: 20px;
-                background-color: #4682B4;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                cursor: pointer;
-                font-weight: bold;
-                z-index: 1000;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            
-            .save-button:hover {
-                background-color: #36648B;
-            }
-            
-            .save-notification {
-                position: fixed;
-                bottom: 80px;
-                right: 20px;
-                background-color: #2E8B57;
-                color: white;
-                padding: 10px 20px;
-                border-radius: 5px;
-                display: none;
-                z-index: 1000;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            .print-button {
-                position: fixed;
-                bottom: 20px;
-                left: 20px;
-                background-color: #607D8B;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                cursor: pointer;
-                font-weight: bold;
-                z-index: 1000;
-                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
-            }
-            
-            .print-button:hover {
-                background-color: #455A64;
-            }
-        </style>
-
-        <head>"""
-                html_content = html_content.replace("<head>", default_styles)
                 
-                # Add a body class for style variations
-                resume_style_class = ""
-                if hasattr(self, 'resume_style'):
-                    resume_style_class = self.resume_style
-                    
-                # Add wrapper div
-                if '<body' in html_content and resume_style_class:
-                    if 'class=' in html_content:
-                        html_content = html_content.replace('<body class="', f'<body class="{resume_style_class} ')
-                    else:
-                        html_content = html_content.replace('<body', f'<body class="{resume_style_class}"')
-                
-                # Add container
-                start_content = html_content.find('<body')
-                end_body_tag = html_content.find('>', start_content) + 1
-                
-                html_content = html_content[:end_body_tag] + '\n<div class="resume-container">\n' + html_content[end_body_tag:]
-                
-                # Close the container
-                html_content = html_content.replace('</body>', '</div>\n<button class="print-button" onclick="window.print()">Print Resume</button>\n</body>')
+            with open(filename, 'w', encoding='utf-8') as file:
+                file.write(self._apply_additional_styles_to_content(html_content))
                 
-                # Write the enhanced HTML back to the file
-                with open(filename, 'w', encoding='utf-8') as file:
-                    file.write(html_content)
         except Exception as e:
             # Silently fail - the original HTML should still be functional
             pass
     
+    def _apply_additional_styles_to_content(self, html_content):
+        """In-memory version of _apply_additional_styles - returns the styled HTML"""
+        try:
+            return apply_resume_styles(html_content, resume_style=getattr(self, 'resume_style', None))
+        except Exception as e:
+            # Silently fail - the original HTML should still be functional
+            return html_content
+    
     def _get_resume_feedback(self):
         """Get AI analysis of the resume strengths and areas for improvement"""
         try:
@@ -2383,7 +924,8 @@ class EnhancedResumeBuilder:
                 user_profile += f"{key}: {value}\n\n"
             
             # Use the new OpenAI API format
-            response = openai.chat.completions.create(
+            response = llm_gateway.chat_completion(
+                cache_site="resume_feedback",
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a professional resume analyst providing brief, specific feedback."},
@@ -2467,7 +1009,8 @@ class EnhancedResumeBuilder:
             """
             
             # Get personalized advice from GPT
-            response = openai.chat.completions.create(
+            response = llm_gateway.chat_completion(
+                cache_site="final_advice",
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are an expert career coach providing brief, actionable tips based on the candidate's profile."},
@@ -2538,7 +1081,8 @@ class EnhancedResumeBuilder:
                 """
                 
                 # Get analysis from GPT
-                response = openai.chat.completions.create(
+                response = llm_gateway.chat_completion(
+                    cache_site="follow_up_check",
                     model="gpt-3.5-turbo",
                     messages=[
                         {"role": "system", "content": "You are a resume expert checking for missing essential work experience details. Be strict in checking for missing information."},
@@ -2591,7 +1135,8 @@ class EnhancedResumeBuilder:
             """
             
             # Get analysis from GPT
-            response = openai.chat.completions.create(
+            response = llm_gateway.chat_completion(
+                cache_site="follow_up_check",
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a resume expert analyzing if a follow-up question would add valuable information."},
@@ -2775,7 +1320,8 @@ class EnhancedResumeBuilder:
             """
             
             # Get analysis from GPT
-            response = openai.chat.completions.create(
+            response = llm_gateway.chat_completion(
+                cache_site="professional_context",
                 model="gpt-3.5-turbo",
                 messages=[
                     {"role": "system", "content": "You are a professional resume expert analyzing experience and generating targeted followup questions."},
@@ -0,0 +1,555 @@
+"""
+Interview question bank for EnhancedResumeBuilder.
+
+All question texts live here as immutable, module level tables. The job role
+is classified once into a role family (a keyword index with typo tolerance),
+and the full question list for each (role family, level) combination is built
+once and shared by every session with the same profile.
+"""
+import re
+import difflib
+from functools import lru_cache
+from types import MappingProxyType
+
+# Placeholder substituted with the user's job role
+JOB_ROLE_PLACEHOLDER = "{job_role}"
+
+
+def _q(section, key, question):
+    """A single read-only question entry"""
+    return MappingProxyType({"section": section, "key": key, "question": question})
+
+
+# 4 Basic questions everyone gets
+BASIC_QUESTIONS = (
+    _q("Personal", "email",
+        "What email address would you like to include on your resume?"),
+    _q("Personal", "phone",
+        "What's the best phone number for employers to reach you?"),
+    _q("Personal", "location",
+        "Where are you currently located? (City and Country)"),
+    _q("Personal", "linkedin",
+        "Do you have a LinkedIn profile you'd like to include? (If so, please share the URL)"),
+)
+
+# Professional summary approach varies by experience level
+SUMMARY_QUESTIONS = MappingProxyType({
+    "executive": _q("Summary", "summary",
+        "As an executive, what would you say are your most significant leadership achievements and management philosophy?"),
+    "mid-level": _q("Summary", "summary",
+        "What would you say are your key professional strengths and notable accomplishments in your career so far?"),
+    "junior": _q("Summary", "summary",
+        "How would you describe your professional interests and strengths as they relate to {job_role}?"),
+})
+
+# Work experience questions per role family
+EXPERIENCE_QUESTIONS = MappingProxyType({
+    "engineering": (
+        _q("Experience", "job_history",
+           "Could you walk me through your technical experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Key technical responsibilities\n- Technologies and tools used\n- Any specific projects or systems you worked on"),
+        _q("Experience", "achievements",
+           "What are your most significant technical achievements? Consider:\n- Projects you led or contributed to\n- Performance improvements you implemented\n- Technical challenges you solved\n- Code quality or architecture improvements\n- Any patents or technical innovations"),
+        _q("Experience", "technical_impact",
+           "How have you made a technical impact in your roles? For example:\n- Scalability improvements\n- Cost reductions through technical solutions\n- Security enhancements\n- System architecture improvements\n- Team productivity increases"),
+    ),
+    "management": (
+        _q("Experience", "job_history",
+           "Could you walk me through your management experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Team size and structure\n- Key responsibilities\n- Budget management (if applicable)"),
+        _q("Experience", "achievements",
+           "What are your most significant management achievements? Consider:\n- Team growth and development\n- Process improvements\n- Project successes\n- Budget management\n- Strategic initiatives"),
+        _q("Experience", "leadership_impact",
+           "How have you made an impact as a leader? For example:\n- Team performance improvements\n- Cultural changes\n- Strategic initiatives\n- Crisis management\n- Cross-functional collaboration"),
+    ),
+    "sales_marketing": (
+        _q("Experience", "job_history",
+           "Could you walk me through your sales/marketing experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Products/services sold\n- Target market\n- Key responsibilities"),
+        _q("Experience", "achievements",
+           "What are your most significant sales/marketing achievements? Consider:\n- Sales targets met/exceeded\n- Campaign successes\n- Market share growth\n- Customer acquisition\n- Revenue impact"),
+        _q("Experience", "business_impact",
+           "How have you made a business impact? For example:\n- Revenue growth\n- Market expansion\n- Customer satisfaction\n- Brand development\n- Sales process improvements"),
+    ),
+    "data": (
+        _q("Experience", "job_history",
+           "Could you walk me through your data analysis experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Types of data you analyzed\n- Tools and technologies used\n- Key projects and their scope"),
+        _q("Experience", "achievements",
+           "What are your most significant data analysis achievements? Consider:\n- Insights that drove business decisions\n- Models or algorithms you developed\n- Efficiency improvements in data processes\n- Cost savings from data-driven solutions\n- Visualization dashboards that improved understanding"),
+        _q("Experience", "analytical_impact",
+           "How have your analyses made an impact? For example:\n- Business strategy influenced by your findings\n- Revenue increase from predictive models\n- Process optimization through data insights\n- Risk mitigation through better analysis\n- Data democratization within the organization"),
+    ),
+    "hr": (
+        _q("Experience", "job_history",
+           "Could you walk me through your HR experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Size of organization and workforce\n- HR specialties (recruitment, L&D, compensation, etc.)\n- Key responsibilities and programs managed"),
+        _q("Experience", "achievements",
+           "What are your most significant HR achievements? Consider:\n- Recruitment improvements or talent acquisition wins\n- Employee programs you implemented successfully\n- HR metrics improvements (turnover reduction, engagement, etc.)\n- Policy developments or improvements\n- Training or development programs created"),
+        _q("Experience", "people_impact",
+           "How have you made an impact on people and culture? For example:\n- Cultural transformations\n- Employee satisfaction improvements\n- Diversity and inclusion initiatives\n- Organizational development successes\n- Change management during transitions"),
+    ),
+    "finance": (
+        _q("Experience", "job_history",
+           "Could you walk me through your finance experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Financial scope (budget size, revenue, etc.)\n- Key financial responsibilities\n- Systems and tools used"),
+        _q("Experience", "achievements",
+           "What are your most significant financial achievements? Consider:\n- Cost savings initiatives\n- Financial process improvements\n- Audit outcomes\n- Budget management successes\n- Financial reporting enhancements"),
+        _q("Experience", "financial_impact",
+           "How have you made a financial impact? For example:\n- Improved profitability\n- Enhanced financial controls\n- Better financial decision-making processes\n- Risk mitigation strategies\n- Capital structure optimizations"),
+    ),
+    "product": (
+        _q("Experience", "job_history",
+           "Could you walk me through your product management experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Products/services managed\n- Market size and customer base\n- Cross-functional teams you worked with"),
+        _q("Experience", "achievements",
+           "What are your most significant product achievements? Consider:\n- Product launches or major releases\n- User/customer growth metrics\n- Revenue impact of products you managed\n- Product improvements that solved user problems\n- Strategic product roadmaps you developed"),
+        _q("Experience", "product_impact",
+           "How have your product decisions made an impact? For example:\n- Market share growth\n- Customer satisfaction improvements\n- Platform innovations\n- Competitive advantages created\n- Business model transformations"),
+    ),
+    "design": (
+        _q("Experience", "job_history",
+           "Could you walk me through your design experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Products or services you designed for\n- Design tools and methodologies used\n- Team structure and your role within it"),
+        _q("Experience", "achievements",
+           "What are your most significant design achievements? Consider:\n- User experience improvements with measurable impact\n- Design systems or patterns you created\n- Usability testing outcomes\n- Product redesigns and their results\n- Design processes you improved or established"),
+        _q("Experience", "design_impact",
+           "How have your designs made an impact? For example:\n- Conversion rate improvements\n- User satisfaction or NPS increases\n- Accessibility enhancements\n- Brand perception improvements\n- Efficiency gains through better interfaces"),
+    ),
+    "project_management": (
+        _q("Experience", "job_history",
+           "Could you walk me through your project management experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Types and sizes of projects managed\n- Methodologies used (Agile, Waterfall, etc.)\n- Team sizes and budgets"),
+        _q("Experience", "achievements",
+           "What are your most significant project management achievements? Consider:\n- Projects delivered on time and under budget\n- Scope or resource challenges overcome\n- Process improvements implemented\n- Risk mitigation successes\n- Stakeholder management wins"),
+        _q("Experience", "project_impact",
+           "How have your projects made an impact? For example:\n- Business value delivered\n- Operational efficiency improvements\n- Cost savings or revenue generation\n- Quality improvements\n- Organizational capabilities enhanced"),
+    ),
+    "operations": (
+        _q("Experience", "job_history",
+           "Could you walk me through your operations experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Operational scope and scale\n- Key processes or systems managed\n- Team size and structure"),
+        _q("Experience", "achievements",
+           "What are your most significant operational achievements? Consider:\n- Efficiency improvements\n- Cost reductions\n- Quality enhancements\n- Process standardizations\n- Operational scaling successes"),
+        _q("Experience", "operational_impact",
+           "How have your operational improvements made an impact? For example:\n- Improved customer satisfaction\n- Reduced operational risks\n- Enhanced scalability\n- Better resource utilization\n- Increased operational resilience"),
+    ),
+    "customer": (
+        _q("Experience", "job_history",
+           "Could you walk me through your customer service experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Customer base and industries served\n- Support channels managed\n- Team structure and escalation processes"),
+        _q("Experience", "achievements",
+           "What are your most significant customer service achievements? Consider:\n- Customer satisfaction or NPS improvements\n- Response time or resolution time enhancements\n- Customer retention increases\n- Support process optimizations\n- Training programs developed"),
+        _q("Experience", "customer_impact",
+           "How have you improved customer experiences? For example:\n- Customer journey improvements\n- Self-service initiatives\n- Customer feedback implementation\n- Support channel optimization\n- Customer education programs"),
+    ),
+    "content": (
+        _q("Experience", "job_history",
+           "Could you walk me through your content creation experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Content types and channels\n- Industries or subject areas\n- Audience size and engagement metrics"),
+        _q("Experience", "achievements",
+           "What are your most significant content achievements? Consider:\n- High-performing content you created\n- SEO improvements or traffic increases\n- Engagement metrics improvements\n- Brand voice developments\n- Editorial processes you improved"),
+        _q("Experience", "content_impact",
+           "How has your content made an impact? For example:\n- Conversion rate improvements\n- Audience growth\n- Brand awareness increases\n- Educational outcomes\n- Lead generation successes"),
+    ),
+    "consulting": (
+        _q("Experience", "job_history",
+           "Could you walk me through your consulting experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Industries and client types\n- Typical project scope and duration\n- Methodologies or frameworks used"),
+        _q("Experience", "achievements",
+           "What are your most significant consulting achievements? Consider:\n- Client problems solved\n- Recommendations implemented successfully\n- ROI delivered to clients\n- Relationship expansions or renewals\n- Innovative solutions developed"),
+        _q("Experience", "consulting_impact",
+           "How have your consulting engagements made an impact? For example:\n- Client business outcomes improved\n- Transformational changes implemented\n- Efficiency or cost-saving measures\n- Strategic direction influenced\n- Client capabilities enhanced"),
+    ),
+    "security": (
+        _q("Experience", "job_history",
+           "Could you walk me through your cybersecurity experience? For each role, please include:\n- Company name and your title\n- Dates of employment\n- Security domains (network, application, cloud, etc.)\n- Tools and technologies used\n- Size and complexity of environments secured"),
+        _q("Experience", "achievements",
+           "What are your most significant security achievements? Consider:\n- Security incidents prevented or mitigated\n- Compliance achievements\n- Security posture improvements\n- Security awareness programs\n- Risk reduction initiatives"),
+        _q("Experience", "security_impact",
+           "How have your security initiatives made an impact? For example:\n- Risk profile improvements\n- Breach prevention metrics\n- Security maturity advancements\n- Cost-effective security solutions\n- Integration of security into business processes"),
+    ),
+    "legal": (
+        _q("Experience", "job_history",
+           "Could you walk me through your legal experience? For each role, please include:\n- Organization name and your title\n- Dates of employment\n- Areas of law practiced\n- Types of clients or matters handled\n- Team structure and your reporting relationships"),
+        _q("Experience", "achievements",
+           "What are your most significant legal achievements? Consider:\n- Cases or transactions successfully handled\n- Legal risk mitigations\n- Policy or compliance improvements\n- Contract or process optimizations\n- Negotiation outcomes"),
+        _q("Experience", "legal_impact",
+           "How have your legal contributions made an impact? For example:\n- Cost savings from legal solutions\n- Business strategy support\n- Dispute resolution successes\n- Improved legal processes\n- Enhanced compliance frameworks"),
+    ),
+    "healthcare": (
+        _q("Experience", "job_history",
+           "Could you walk me through your healthcare experience? For each role, please include:\n- Organization name and your title\n- Dates of employment\n- Clinical or healthcare setting\n- Patient populations served\n- Key responsibilities and specializations"),
+        _q("Experience", "achievements",
+           "What are your most significant healthcare achievements? Consider:\n- Patient outcome improvements\n- Healthcare process enhancements\n- Quality of care initiatives\n- Healthcare technology implementations\n- Team development or training programs"),
+        _q("Experience", "healthcare_impact",
+           "How have your contributions made an impact on healthcare? For example:\n- Patient satisfaction improvements\n- Care efficiency enhancements\n- Health outcome advancements\n- Cost-effective care solutions\n- Interdisciplinary collaboration successes"),
+    ),
+    "research": (
+        _q("Experience", "job_history",
+           "Could you walk me through your research experience? For each role, please include:\n- Organization name and your title\n- Dates of employment\n- Research areas and topics\n- Methodologies and equipment used\n- Funding sources and project scales"),
+        _q("Experience", "achievements",
+           "What are your most significant research achievements? Consider:\n- Key findings or discoveries\n- Publications and citations\n- Grants or funding secured\n- Patents or intellectual property\n- Research collaborations established"),
+        _q("Experience", "research_impact",
+           "How has your research made an impact? For example:\n- Industry applications of findings\n- Influence on subsequent research\n- Policy or practice changes\n- Commercial potential realized\n- Public understanding advanced"),
+    ),
+    "education": (
+        _q("Experience", "job_history",
+           "Could you walk me through your teaching experience? For each role, please include:\n- Institution name and your title\n- Dates of employment\n- Subjects and grade levels taught\n- Class sizes and demographics\n- Teaching methodologies used"),
+        _q("Experience", "achievements",
+           "What are your most significant teaching achievements? Consider:\n- Student performance improvements\n- Curriculum developments or enhancements\n- Teaching innovations implemented\n- Recognition or awards received\n- Extracurricular programs developed"),
+        _q("Experience", "educational_impact",
+           "How have your teaching methods made an impact? For example:\n- Student engagement improvements\n- Learning outcome advancements\n- Educational technology implementations\n- Parent or community involvement\n- Student success stories"),
+    ),
+    "general": (
+        _q("Experience", "job_history",
+           "Could you tell me about your relevant work experience? For each position, please include:\n- Company name and your title\n- Dates of employment\n- Key responsibilities\n- Notable projects or initiatives"),
+        _q("Experience", "achievements",
+           "What specific achievements or projects are you most proud of? Think about:\n- Times you solved problems\n- Process improvements\n- Team contributions\n- Customer impact\n- Business results"),
+        _q("Experience", "professional_impact",
+           "How have you made an impact in your roles? For example:\n- Process improvements\n- Cost savings\n- Customer satisfaction\n- Team efficiency\n- Business growth"),
+    ),
+})
+
+# Education questions per experience level
+EDUCATION_QUESTIONS = MappingProxyType({
+    "executive": (
+        _q("Education", "education",
+           "What's your educational background? Please include:\n- Degrees earned\n- Institutions attended\n- Graduation dates\n- Relevant coursework\n- Academic achievements\n- Leadership roles in academic organizations"),
+        _q("Education", "certifications",
+           "What professional certifications or advanced training do you have? Include:\n- Industry certifications\n- Executive education programs\n- Leadership training\n- Technical certifications\n- Board certifications"),
+    ),
+    "mid-level": (
+        _q("Education", "education",
+           "What's your educational background? Please include:\n- Degrees earned\n- Institutions attended\n- Graduation dates\n- Relevant coursework\n- Academic achievements"),
+        _q("Education", "certifications",
+           "What professional certifications or training do you have? Include:\n- Industry certifications\n- Professional development courses\n- Technical certifications\n- Management training"),
+    ),
+    "junior": (
+        _q("Education", "education",
+           "What's your educational background? Please include:\n- Degrees earned\n- Institutions attended\n- Graduation dates\n- Relevant coursework\n- Academic achievements\n- GPA (if above 3.5)"),
+        _q("Education", "certifications",
+           "Do you have any relevant certifications or training? Include:\n- Industry certifications\n- Online courses\n- Technical certifications\n- Internship programs"),
+    ),
+})
+
+# Skills questions per role family
+SKILLS_QUESTIONS = MappingProxyType({
+    "engineering": (
+        _q("Skills", "technical_skills",
+           "What technical skills do you have? Please include:\n- Programming languages\n- Frameworks and libraries\n- Databases and tools\n- Development methodologies\n- Cloud platforms\n- Version control systems\n- Testing frameworks"),
+        _q("Skills", "soft_skills",
+           "What professional skills do you have? Consider:\n- Problem-solving approaches\n- Team collaboration\n- Code review experience\n- Documentation skills\n- Agile methodologies\n- Technical communication"),
+        _q("Skills", "domain_knowledge",
+           "What domain knowledge do you have? Include:\n- Industry expertise\n- Domain-specific tools\n- Regulatory knowledge\n- Security practices\n- Performance optimization"),
+    ),
+    "management": (
+        _q("Skills", "leadership_skills",
+           "What leadership and management skills do you have? Include:\n- Team management\n- Strategic planning\n- Budget management\n- Change management\n- Conflict resolution\n- Performance management"),
+        _q("Skills", "technical_skills",
+           "What technical knowledge do you have? Include:\n- Industry expertise\n- Technical concepts\n- Tools and systems\n- Project management\n- Risk management"),
+        _q("Skills", "business_skills",
+           "What business skills do you have? Consider:\n- Strategic thinking\n- Business analysis\n- Financial management\n- Stakeholder management\n- Process improvement"),
+    ),
+    "data": (
+        _q("Skills", "technical_skills",
+           "What technical skills do you have? Please include:\n- Programming languages (Python, R, SQL, etc.)\n- Data visualization tools (Tableau, Power BI, etc.)\n- Statistical analysis methods\n- Machine learning libraries/frameworks\n- Database systems\n- Big data technologies\n- Data processing tools"),
+        _q("Skills", "analytical_skills",
+           "What analytical skills do you have? Consider:\n- Statistical analysis\n- Predictive modeling\n- Data mining techniques\n- A/B testing\n- Experiment design\n- Hypothesis testing\n- Pattern recognition"),
+        _q("Skills", "domain_knowledge",
+           "What domain knowledge do you have? Include:\n- Industry expertise\n- Business metrics understanding\n- Data governance knowledge\n- Privacy regulations\n- Ethics in data analysis\n- Industry-specific data challenges"),
+    ),
+    "marketing": (
+        _q("Skills", "marketing_skills",
+           "What marketing skills do you have? Please include:\n- Digital marketing channels\n- Campaign management\n- Content creation\n- Marketing automation tools\n- SEO/SEM expertise\n- Social media platforms\n- Email marketing"),
+        _q("Skills", "analytical_skills",
+           "What analytical skills do you have? Consider:\n- Marketing metrics tracking\n- Campaign performance analysis\n- Conversion optimization\n- A/B testing\n- Customer segmentation\n- ROI calculation\n- Google Analytics expertise"),
+        _q("Skills", "creative_skills",
+           "What creative and strategic skills do you have? Include:\n- Brand development\n- Storytelling\n- Market research\n- Customer journey mapping\n- Positioning strategy\n- Competitive analysis\n- Customer insight development"),
+    ),
+    "sales": (
+        _q("Skills", "sales_skills",
+           "What sales skills do you have? Please include:\n- Sales methodologies\n- Client relationship management\n- Negotiation techniques\n- Pipeline management\n- Sales tools (CRM, etc.)\n- Territory management\n- Closing strategies"),
+        _q("Skills", "business_skills",
+           "What business and analytical skills do you have? Consider:\n- Market analysis\n- Competitive intelligence\n- Sales forecasting\n- Performance metrics tracking\n- Strategic account planning\n- Pricing strategies\n- Value proposition development"),
+        _q("Skills", "communication_skills",
+           "What communication and interpersonal skills do you have? Include:\n- Presentation skills\n- Relationship building\n- Active listening\n- Objection handling\n- Customer needs assessment\n- Cross-functional collaboration\n- Team selling"),
+    ),
+    "hr": (
+        _q("Skills", "hr_skills",
+           "What HR skills do you have? Please include:\n- Recruitment and selection\n- Employee relations\n- Performance management\n- Policy development\n- Compensation and benefits\n- Training and development\n- HRIS systems"),
+        _q("Skills", "compliance_skills",
+           "What compliance and regulatory knowledge do you have? Consider:\n- Labor laws\n- Employment legislation\n- Health and safety regulations\n- Equal opportunity requirements\n- Benefits compliance\n- Records management\n- Risk mitigation strategies"),
+        _q("Skills", "people_skills",
+           "What people management and strategic skills do you have? Include:\n- Conflict resolution\n- Organizational development\n- Change management\n- Employee engagement\n- Talent management\n- Succession planning\n- Culture development"),
+    ),
+    "finance": (
+        _q("Skills", "finance_skills",
+           "What finance and accounting skills do you have? Please include:\n- Financial reporting\n- Budgeting and forecasting\n- Financial analysis\n- Accounting principles\n- Taxation knowledge\n- Audit procedures\n- Financial software systems"),
+        _q("Skills", "technical_skills",
+           "What technical and regulatory knowledge do you have? Consider:\n- Accounting standards (GAAP, IFRS)\n- Regulatory compliance\n- Risk management\n- Internal controls\n- Financial modeling\n- ERP systems\n- Data analysis tools"),
+        _q("Skills", "business_skills",
+           "What business and strategic skills do you have? Include:\n- Business partnership\n- Strategic planning\n- Process improvement\n- Decision support\n- Performance metrics\n- Cost management\n- Investment analysis"),
+    ),
+    "product": (
+        _q("Skills", "product_skills",
+           "What product management skills do you have? Please include:\n- Product lifecycle management\n- Market research\n- User story development\n- Roadmap planning\n- Requirements gathering\n- Product strategy\n- Competitive analysis"),
+        _q("Skills", "technical_skills",
+           "What technical and analytical skills do you have? Consider:\n- Product metrics\n- A/B testing\n- User analytics\n- Agile methodologies\n- Product development tools\n- Data analysis\n- Technical documentation"),
+        _q("Skills", "business_skills",
+           "What business and leadership skills do you have? Include:\n- Cross-functional team leadership\n- Stakeholder management\n- Go-to-market strategy\n- Pricing strategy\n- Value proposition development\n- Customer journey mapping\n- Business case development"),
+    ),
+    "design": (
+        _q("Skills", "design_skills",
+           "What design skills do you have? Please include:\n- UX/UI design tools\n- Design principles\n- Wireframing\n- Prototyping\n- Visual design\n- Information architecture\n- Interaction design"),
+        _q("Skills", "research_skills",
+           "What research and analytical skills do you have? Consider:\n- User research methods\n- Usability testing\n- Heuristic evaluation\n- Persona development\n- Journey mapping\n- A/B testing\n- Accessibility evaluation"),
+        _q("Skills", "technical_skills",
+           "What technical and collaboration skills do you have? Include:\n- Design systems\n- Developer collaboration\n- Front-end knowledge (HTML/CSS)\n- Design documentation\n- Stakeholder presentation\n- Design thinking\n- Product strategy"),
+    ),
+    "project_management": (
+        _q("Skills", "pm_skills",
+           "What project management skills do you have? Please include:\n- Project methodologies (Agile, Waterfall, etc.)\n- Project scheduling\n- Resource management\n- Risk management\n- Budget planning\n- Stakeholder management\n- Project documentation"),
+        _q("Skills", "technical_skills",
+           "What technical and tool-based skills do you have? Consider:\n- PM software (JIRA, MS Project, etc.)\n- Reporting tools\n- Documentation systems\n- Collaboration platforms\n- Process mapping\n- Technical understanding\n- Quality assurance methods"),
+        _q("Skills", "leadership_skills",
+           "What leadership and communication skills do you have? Include:\n- Team leadership\n- Conflict resolution\n- Executive communication\n- Client management\n- Change management\n- Decision-making\n- Meeting facilitation"),
+    ),
+    "operations": (
+        _q("Skills", "operations_skills",
+           "What operations management skills do you have? Please include:\n- Process optimization\n- Quality management\n- Supply chain knowledge\n- Resource allocation\n- Logistics management\n- Inventory control\n- Operational metrics"),
+        _q("Skills", "technical_skills",
+           "What technical and analytical skills do you have? Consider:\n- Operations software\n- Data analysis\n- KPI development\n- ERP systems\n- Forecasting\n- Capacity planning\n- Cost analysis"),
+        _q("Skills", "leadership_skills",
+           "What leadership and strategic skills do you have? Include:\n- Cross-functional collaboration\n- Vendor management\n- Continuous improvement\n- Strategic planning\n- Team development\n- Crisis management\n- Change implementation"),
+    ),
+    "customer": (
+        _q("Skills", "customer_skills",
+           "What customer service skills do you have? Please include:\n- Client communication\n- Problem resolution\n- Customer needs assessment\n- Service recovery\n- Account management\n- Product knowledge\n- Customer experience enhancement"),
+        _q("Skills", "technical_skills",
+           "What technical and systems skills do you have? Consider:\n- CRM systems\n- Ticketing systems\n- Knowledge bases\n- Communication tools\n- Analysis and reporting\n- Service metrics tracking\n- Process documentation"),
+        _q("Skills", "business_skills",
+           "What business and strategic skills do you have? Include:\n- Customer retention strategies\n- Upselling/cross-selling\n- Voice of customer programs\n- Service level management\n- Quality assurance\n- Team collaboration\n- Process improvement"),
+    ),
+    "content": (
+        _q("Skills", "writing_skills",
+           "What writing and content creation skills do you have? Please include:\n- Content types (blogs, whitepapers, etc.)\n- Copywriting\n- Editing and proofreading\n- SEO writing\n- Storytelling\n- Research methods\n- Style guide adaptation"),
+        _q("Skills", "technical_skills",
+           "What technical and tool-based skills do you have? Consider:\n- CMS platforms\n- SEO tools\n- Content planning software\n- Analytics tools\n- Design software\n- Collaboration platforms\n- Social media management"),
+        _q("Skills", "strategic_skills",
+           "What strategic and planning skills do you have? Include:\n- Content strategy\n- Editorial calendar management\n- Audience analysis\n- Brand voice development\n- Content performance analysis\n- Stakeholder management\n- Project management"),
+    ),
+    "consulting": (
+        _q("Skills", "consulting_skills",
+           "What consulting and advisory skills do you have? Please include:\n- Problem identification\n- Solution development\n- Client management\n- Project methodology\n- Industry expertise\n- Workshop facilitation\n- Change management"),
+        _q("Skills", "analytical_skills",
+           "What analytical and research skills do you have? Consider:\n- Business analysis\n- Market research\n- Data analysis\n- Needs assessment\n- ROI calculation\n- Process mapping\n- Competitive analysis"),
+        _q("Skills", "communication_skills",
+           "What communication and presentation skills do you have? Include:\n- Executive presentations\n- Report writing\n- Proposal development\n- Stakeholder management\n- Negotiation\n- Complex concept explanation\n- Client relationship building"),
+    ),
+    "security": (
+        _q("Skills", "security_skills",
+           "What cybersecurity skills do you have? Please include:\n- Security frameworks\n- Threat detection\n- Vulnerability assessment\n- Security tools\n- Incident response\n- Penetration testing\n- Security architecture"),
+        _q("Skills", "technical_skills",
+           "What technical skills do you have? Consider:\n- Network security\n- Cloud security\n- Security coding practices\n- Operating systems\n- Security automation\n- Forensic analysis\n- Cryptography"),
+        _q("Skills", "compliance_skills",
+           "What governance and compliance skills do you have? Include:\n- Security policies\n- Regulatory compliance\n- Risk assessment\n- Security awareness training\n- Audit management\n- Documentation\n- Security operations"),
+    ),
+    "legal": (
+        _q("Skills", "legal_skills",
+           "What legal skills do you have? Please include:\n- Practice areas\n- Case management\n- Legal research\n- Document drafting\n- Negotiation\n- Client counseling\n- Regulatory knowledge"),
+        _q("Skills", "technical_skills",
+           "What technical and analytical skills do you have? Consider:\n- Legal software\n- eDiscovery tools\n- Legal databases\n- Compliance management\n- Contract analysis\n- Risk assessment\n- Legal writing"),
+        _q("Skills", "business_skills",
+           "What business and professional skills do you have? Include:\n- Client development\n- Case strategy\n- Project management\n- Cross-functional collaboration\n- Business acumen\n- Ethics compliance\n- Professional networking"),
+    ),
+    "healthcare": (
+        _q("Skills", "clinical_skills",
+           "What clinical or healthcare skills do you have? Please include:\n- Clinical procedures\n- Patient care\n- Medical specialties\n- Health assessments\n- Treatment planning\n- Medical technology\n- Clinical documentation"),
+        _q("Skills", "technical_skills",
+           "What technical and administrative skills do you have? Consider:\n- Healthcare systems\n- Electronic health records\n- Medical coding\n- Regulatory compliance\n- Quality assurance\n- Healthcare analytics\n- Privacy protocols"),
+        _q("Skills", "professional_skills",
+           "What professional and interpersonal skills do you have? Include:\n- Patient communication\n- Interdisciplinary collaboration\n- Healthcare education\n- Ethical decision-making\n- Crisis management\n- Continuous learning\n- Compassionate care"),
+    ),
+    "research": (
+        _q("Skills", "research_skills",
+           "What research skills do you have? Please include:\n- Research methodologies\n- Experimental design\n- Data collection\n- Statistical analysis\n- Literature review\n- Research tools\n- Publication experience"),
+        _q("Skills", "technical_skills",
+           "What technical and analytical skills do you have? Consider:\n- Laboratory techniques\n- Specialized equipment\n- Data analysis software\n- Programming languages\n- Visualization tools\n- Documentation systems\n- Research protocols"),
+        _q("Skills", "professional_skills",
+           "What professional and collaboration skills do you have? Include:\n- Grant writing\n- Research presentation\n- Peer review\n- Team collaboration\n- Project management\n- Ethical research practices\n- Interdisciplinary communication"),
+    ),
+    "education": (
+        _q("Skills", "teaching_skills",
+           "What teaching and instructional skills do you have? Please include:\n- Teaching methodologies\n- Curriculum development\n- Lesson planning\n- Student assessment\n- Classroom management\n- Educational technology\n- Differentiated instruction"),
+        _q("Skills", "subject_skills",
+           "What subject matter expertise do you have? Consider:\n- Subject areas\n- Specialized knowledge\n- Curriculum standards\n- Resource development\n- Interdisciplinary connections\n- Current research\n- Industry applications"),
+        _q("Skills", "professional_skills",
+           "What professional and interpersonal skills do you have? Include:\n- Student engagement\n- Parent communication\n- Collaborative teaching\n- Professional development\n- Educational leadership\n- Cultural competence\n- Special needs accommodation"),
+    ),
+    "general": (
+        _q("Skills", "technical_skills",
+           "What specific skills do you have that are relevant to {job_role}? Include:\n- Technical skills\n- Industry knowledge\n- Tools and systems\n- Methodologies\n- Best practices"),
+        _q("Skills", "soft_skills",
+           "What professional skills do you have? Consider:\n- Communication\n- Problem-solving\n- Teamwork\n- Organization\n- Adaptability\n- Customer service"),
+    ),
+})
+
+# Language question - detailed for international / global roles
+LANGUAGES_QUESTIONS = MappingProxyType({
+    True: _q("Skills", "languages",
+        "What languages do you speak? For each language, please include:\n- Language name\n- Proficiency level (Native, Fluent, Advanced, Intermediate, Basic)\n- Any relevant certifications\n- Experience using the language in a professional context"),
+    False: _q("Skills", "languages",
+        "What languages do you speak, and at what proficiency level?"),
+})
+
+# Additional questions per experience level
+ADDITIONAL_QUESTIONS = MappingProxyType({
+    "executive": (
+        _q("Additional", "board_positions",
+           "Have you served on any boards or in advisory roles? Include:\n- Organization name\n- Role and duration\n- Key contributions\n- Strategic initiatives\n- Industry impact"),
+        _q("Additional", "speaking",
+           "Have you done any speaking engagements or published work? Include:\n- Conferences and events\n- Publications\n- Media appearances\n- Industry panels\n- Thought leadership content"),
+        _q("Additional", "industry_leadership",
+           "How have you demonstrated industry leadership? Consider:\n- Industry associations\n- Professional organizations\n- Mentoring programs\n- Industry initiatives\n- Thought leadership"),
+    ),
+    "mid-level": (
+        _q("Additional", "projects",
+           "Have you worked on any noteworthy projects? Include:\n- Project scope\n- Your role\n- Key achievements\n- Technical challenges\n- Business impact"),
+        _q("Additional", "professional_activities",
+           "Have you participated in any professional activities? Include:\n- Professional organizations\n- Industry events\n- Training programs\n- Mentoring\n- Community involvement"),
+        _q("Additional", "industry_contributions",
+           "How have you contributed to your industry? Consider:\n- Knowledge sharing\n- Process improvements\n- Best practices\n- Team development\n- Industry initiatives"),
+    ),
+    "junior": (
+        _q("Additional", "projects",
+           "Have you worked on any academic or personal projects? Include:\n- Project description\n- Your role\n- Technologies used\n- Key achievements\n- Learning outcomes"),
+        _q("Additional", "activities",
+           "What extracurricular activities have you participated in? Include:\n- Student organizations\n- Volunteer work\n- Internships\n- Academic clubs\n- Community involvement"),
+        _q("Additional", "achievements",
+           "What other achievements would you like to highlight? Consider:\n- Academic awards\n- Competition wins\n- Personal projects\n- Community service\n- Leadership roles"),
+    ),
+})
+
+# Final catch-all question
+FINAL_QUESTION = _q("Additional", "additional_info",
+                    "Is there anything else you'd like to include on your resume that we haven't covered yet? Consider:\n- Unique experiences\n- Special achievements\n- Relevant hobbies\n- Industry-specific certifications\n- Notable accomplishments")
+
+
+# Role classification rules in priority order - the first family whose keyword
+# groups all match the job role wins. Each group matches if any of its words
+# appears in the (lowercased) job role.
+EXPERIENCE_RULES = (
+    ("engineering", (("developer", "engineer", "programmer"),)),
+    ("management", (("manager", "director", "lead"),)),
+    ("sales_marketing", (("sales", "marketing"),)),
+    ("data", (("data", "analyst"),)),
+    ("hr", (("hr", "human resources"),)),
+    ("finance", (("finance", "accountant", "financial", "accounting"),)),
+    ("product", (("product",), ("manager", "owner"))),
+    ("design", (("ux", "ui", "designer"),)),
+    ("project_management", (("project",), ("manager",))),
+    ("operations", (("operations",),)),
+    ("customer", (("customer",), ("service", "success", "support"))),
+    ("content", (("content", "writer", "copywriter"),)),
+    ("consulting", (("consultant", "consulting"),)),
+    ("security", (("cyber", "security"),)),
+    ("legal", (("legal", "attorney", "lawyer"),)),
+    ("healthcare", (("healthcare", "medical", "clinical"),)),
+    ("research", (("research", "scientist"),)),
+    ("education", (("teacher", "educator", "instructor"),)),
+)
+
+SKILLS_RULES = (
+    ("engineering", (("developer", "engineer", "programmer"),)),
+    ("management", (("manager", "director", "lead"),)),
+    ("data", (("data", "analyst"),)),
+    ("marketing", (("marketing",),)),
+    ("sales", (("sales",),)),
+    ("hr", (("hr", "human resources"),)),
+    ("finance", (("finance", "accountant", "financial"),)),
+    ("product", (("product",), ("manager", "owner"))),
+    ("design", (("ux", "ui", "designer"),)),
+    ("project_management", (("project",), ("manager",))),
+    ("operations", (("operations",),)),
+    ("customer", (("customer",), ("service", "success", "support"))),
+    ("content", (("content", "writer", "copywriter"),)),
+    ("consulting", (("consultant", "consulting"),)),
+    ("security", (("cyber", "security"),)),
+    ("legal", (("legal", "attorney", "lawyer"),)),
+    ("healthcare", (("healthcare", "medical", "clinical"),)),
+    ("research", (("research", "scientist"),)),
+    ("education", (("teacher", "educator", "instructor"),)),
+)
+
+DEFAULT_FAMILY = "general"
+
+INTERNATIONAL_KEYWORDS = ("international", "global")
+
+# Words long enough to be corrected when misspelled (e.g. "proggramer" -> "programmer").
+# Short keywords like "ux" or "hr" are only matched exactly.
+_TYPO_VOCABULARY = sorted({
+    word
+    for rules in (EXPERIENCE_RULES, SKILLS_RULES)
+    for _, groups in rules
+    for group in groups
+    for keyword in group
+    for word in keyword.split()
+    if len(word) >= 5
+} | set(INTERNATIONAL_KEYWORDS))
+
+_WORD_PATTERN = re.compile(r"[a-z]+")
+
+
+def _normalize_role(job_role):
+    """Lowercase the role and append the corrected spelling of misspelled keywords"""
+    role = (job_role or "").lower()
+    corrections = []
+    for word in _WORD_PATTERN.findall(role):
+        if len(word) < 5 or any(keyword in word for keyword in _TYPO_VOCABULARY):
+            continue
+        corrections.extend(difflib.get_close_matches(word, _TYPO_VOCABULARY, n=1, cutoff=0.8))
+    if corrections:
+        role = role + " " + " ".join(corrections)
+    return role
+
+
+def _match_family(role, rules):
+    for family, groups in rules:
+        if all(any(keyword in role for keyword in group) for group in groups):
+            return family
+    return DEFAULT_FAMILY
+
+
+@lru_cache(maxsize=4096)
+def classify_role(job_role):
+    """Return (experience family, skills family, is international) for a job role"""
+    role = _normalize_role(job_role)
+    return (
+        _match_family(role, EXPERIENCE_RULES),
+        _match_family(role, SKILLS_RULES),
+        any(keyword in role for keyword in INTERNATIONAL_KEYWORDS),
+    )
+
+
+def _normalize_level(resume_level):
+    return resume_level if resume_level in ("executive", "mid-level") else "junior"
+
+
+@lru_cache(maxsize=None)
+def _question_template(experience_family, skills_family, level, international):
+    """The shared, immutable question list for one profile combination"""
+    return (
+        BASIC_QUESTIONS
+        + (SUMMARY_QUESTIONS[level],)
+        + EXPERIENCE_QUESTIONS[experience_family]
+        + EDUCATION_QUESTIONS[level]
+        + SKILLS_QUESTIONS[skills_family]
+        + (LANGUAGES_QUESTIONS[international],)
+        + ADDITIONAL_QUESTIONS[level]
+        + (FINAL_QUESTION,)
+    )
+
+
+def build_questions(job_role, resume_level):
+    """
+    Question list for a user's profile.
+
+    The returned list is new (sessions may reorder or extend it), but the
+    question entries are the shared read-only ones - only the few entries
+    that mention the job role are formatted for this user.
+    """
+    experience_family, skills_family, international = classify_role(job_role)
+    template = _question_template(experience_family, skills_family, _normalize_level(resume_level), international)
+    return [
+        _q(q["section"], q["key"], q["question"].replace(JOB_ROLE_PLACEHOLDER, job_role))
+        if JOB_ROLE_PLACEHOLDER in q["question"] else q
+        for q in template
+    ]
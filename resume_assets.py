@@ -0,0 +1,519 @@
+"""
+Precompiled stylesheet and script bundles for generated resumes.
+
+The resume CSS is minified once at import time into one bundle per resume
+style (traditional / modern / creative, plus a bundle with all of them for
+unknown styles) and text direction. Rules for the other styles are left out
+of each bundle and the RTL bundles mirror every left / right property. Each
+bundle is tagged with the hash of its content, so the same style always
+produces byte-identical documents.
+"""
+import re
+import hashlib
+from collections import namedtuple
+
+RESUME_STYLES = ("traditional", "modern", "creative")
+
+# Source stylesheet for all resume styles
+RESUME_CSS = """
+            /* Enhanced base styles */
+            body {
+                font-family: 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+                line-height: 1.6;
+                color: #333;
+                background-color: #f9f9f9;
+                margin: 0;
+                padding: 0;
+            }
+            
+            .resume-container {
+                max-width: 8.5in;
+                margin: 30px auto;
+                padding: 40px;
+                background-color: #fff;
+                box-shadow: 0 4px 15px rgba(0, 0, 0, 0.1);
+                border-radius: 4px;
+            }
+            
+            /* Improved typography */
+            h1 {
+                font-size: 28px;
+                color: #2c3e50;
+                margin-bottom: 5px;
+                font-weight: bold !important;
+            }
+            
+            h2 {
+                font-size: 22px;
+                color: #2c3e50;
+                margin-top: 25px;
+                margin-bottom: 15px;
+                border-bottom: 2px solid #eaeaea;
+                padding-bottom: 8px;
+                text-transform: uppercase;
+                letter-spacing: 0.5px;
+            }
+            
+            h3 {
+                font-size: 18px;
+                color: #34495e;
+                margin-bottom: 8px;
+                margin-top: 15px;
+            }
+            
+            p {
+                margin-bottom: 10px;
+            }
+            
+            /* Enhanced header */
+            .resume-header {
+                text-align: center;
+                margin-bottom: 30px;
+            }
+            
+            .job-title {
+                font-size: 18px;
+                color: #7f8c8d;
+                margin-bottom: 15px;
+            }
+            
+            /* Improved contact info */
+            .contact-info {
+            font-size: 15px;
+            margin-bottom: 15px;
+            text-align: center;
+            padding-bottom: 20px;
+            border-bottom: 1px solid #eaeaea;  /* הוסף שורה זו */
+            }
+            
+            .contact-info p {
+                margin: 5px 0;
+            }
+            
+            /* Enhanced sections */
+            .section {
+                margin-bottom: 25px;
+            }
+            
+            /* Experience and education items */
+            .experience-item, .education-item {
+                margin-bottom: 20px;
+                position: relative;
+            }
+            
+            .job-position, .education-degree {
+                font-weight: bold;
+                color: #2c3e50;
+                margin-bottom: 3px;
+            }
+            
+            .job-date, .education-date, .date-range {
+                float: right;
+                font-style: italic;
+                color: #7f8c8d;
+            }
+            
+            .job-company, .education-institution, .company-name, .institution-name {
+                font-weight: 500;
+                color: #34495e;
+            }
+            
+            .job-location, .education-location {
+                color: #7f8c8d;
+                font-style: italic;
+            }
+            
+            /* List styling */
+            ul {
+                margin-top: 10px;
+                margin-bottom: 15px;
+                padding-left: 20px;
+            }
+            
+            ul li {
+                margin-bottom: 8px;
+                position: relative;
+            }
+            
+            /* Skills columns */
+            .skills-list {
+                columns: 2;
+                column-gap: 30px;
+                list-style-type: none;
+                padding-left: 0;
+            }
+            
+            .skills-list li {
+                margin-bottom: 8px;
+                break-inside: avoid;
+                position: relative;
+                padding-left: 15px;
+            }
+            
+            .skills-list li:before {
+                content: "•";
+                position: absolute;
+                left: 0;
+            }
+            
+            /* Summary section */
+            .summary {
+                background-color: #f8f9fa;
+                padding: 15px;
+                border-left: 3px solid #3498db;
+                margin-bottom: 25px;
+                line-height: 1.6;
+            }
+            
+            /* Style variations - Enhanced with fonts, borders, spacing, etc. */
+            /* Traditional style */
+            .traditional {
+                font-family: 'Georgia', 'Times New Roman', serif;
+            }
+            
+            .traditional h1 {
+                color: #1a3c5a;
+                font-weight: 600;
+            }
+            
+            .traditional h2 {
+                color: #1a3c5a;
+                border-bottom: 2px solid #c4d3df;
+                letter-spacing: 0.5px;
+            }
+            
+            .traditional .job-position, .traditional .education-degree {
+                color: #1a3c5a;
+            }
+            
+            .traditional .summary {
+                border-left: 3px solid #1a3c5a;
+                background-color: #f5f8fa;
+                border-radius: 0;
+            }
+            
+            .traditional .skills-list li:before {
+                content: "■";
+                font-size: 8px;
+                color: #1a3c5a;
+            }
+            
+            .traditional p {
+                line-height: 1.5;
+                margin-bottom: 8px;
+            }
+            
+            /* Modern style */
+            .modern {
+                font-family: 'Helvetica Neue', Arial, sans-serif;
+            }
+            
+            .modern h1 {
+                color: #3a4750;
+                font-weight: 400;
+            }
+            
+            .modern h2 {
+                color: #3a4750;
+                border-bottom: 1px solid #dfe4e8;
+                letter-spacing: 1px;
+            }
+            
+            .modern .job-position, .modern .education-degree {
+                color: #3a4750;
+            }
+            
+            .modern .summary {
+                border-left: 4px solid #3a4750;
+                background-color: #f7f7f7;
+                border-radius: 2px;
+            }
+            
+            .modern .skills-list li:before {
+                content: "•";
+                font-size: 14px;
+                color: #3a4750;
+            }
+            
+            .modern p {
+                line-height: 1.7;
+                margin-bottom: 12px;
+            }
+            
+            /* Creative style */
+            .creative {
+                font-family: 'Segoe UI', 'Roboto', sans-serif;
+            }
+            
+            .creative h1 {
+                color: #654ea3;
+                font-weight: 500;
+            }
+            
+            .creative h2 {
+                color: #654ea3;
+                border-bottom: 2px dotted #e1d9f2;
+                letter-spacing: 1.2px;
+            }
+            
+            .creative .job-position, .creative .education-degree {
+                color: #654ea3;
+            }
+            
+            .creative .summary {
+                border-left: 4px solid #654ea3;
+                background-color: #f9f7fd;
+                border-radius: 4px;
+                box-shadow: 0 2px 5px rgba(101, 78, 163, 0.1);
+            }
+            
+            .creative .skills-list li:before {
+                content: none !important;
+                font-size: 10px;
+            }
+            /* עיצוב "טאב" מסביב לכל סקיל */
+            .creative .skills-list li {
+                display: inline-block;           /* מסדר את הפריטים זה לצד זה */
+                background-color: rgba(101, 78, 163, 0.08); 
+                border: 1px solid #654ea3;      /* ניתן לשנות את עובי וצבע המסגרת לפי הצורך */
+                border-radius: 20px;            /* יוצר את הפינות העגולות (טאב) */
+                padding: 8px 14px;              /* רווח פנימי */
+                margin: 4px;                    /* רווח בין סקילים */
+                cursor: default;                /* לא חובה, רק כדי לבטל סמן של טקסט */
+            }
+            .creative p {
+                line-height: 1.8;
+                margin-bottom: 14px;
+            }
+            
+            /* Experience items styling per theme */
+            .traditional .experience-item, .traditional .education-item {
+                border-left: 0;
+                padding-left: 0;
+            }
+            
+            .modern .experience-item, .modern .education-item {
+                border-left: 0;
+                padding-left: 0;
+                margin-bottom: 25px;
+            }
+            
+            .creative .experience-item, .creative .education-item {
+                border-left: 2px solid #f0e9ff;
+                padding-left: 15px;
+                border-radius: 0 4px 4px 0;
+                margin-bottom: 30px;
+            }
+            /* Editable content styling */
+            [contenteditable=true] {
+                position: relative;
+            }
+            
+            [contenteditable=true]:hover {
+                background-color: rgba(135, 206, 250, 0.3);
+                cursor: default;
+            }
+            
+            [contenteditable=true]:hover::after {
+                content: "✏️";
+                position: absolute;
+                bottom: 4px;
+                right: 4px;
+                font-size: 12px;
+                opacity: 0.6;
+                pointer-events: none;
+            }
+            
+            [contenteditable=true]:focus {
+                outline: 1px solid #4682B4;
+                background-color: rgba(135, 206, 250, 0.2);
+            }
+            
+            .save-button {
+                position: fixed;
+                bottom: 20px;
+                right: 20px;
+                background-color: #4682B4;
+                color: white;
+                border: none;
+                padding: 10px 20px;
+                border-radius: 5px;
+                cursor: pointer;
+                font-weight: bold;
+                z-index: 1000;
+                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
+            }
+            
+            .save-button:hover {
+                background-color: #36648B;
+            }
+            
+            .save-notification {
+                position: fixed;
+                bottom: 80px;
+                right: 20px;
+                background-color: #2E8B57;
+                color: white;
+                padding: 10px 20px;
+                border-radius: 5px;
+                display: none;
+                z-index: 1000;
+                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
+            }
+            .print-button {
+                position: fixed;
+                bottom: 20px;
+                left: 20px;
+                background-color: #607D8B;
+                color: white;
+                border: none;
+                padding: 10px 20px;
+                border-radius: 5px;
+                cursor: pointer;
+                font-weight: bold;
+                z-index: 1000;
+                box-shadow: 0 2px 5px rgba(0,0,0,0.2);
+            }
+            
+            .print-button:hover {
+                background-color: #455A64;
+            }
+            """
+
+# Extra rules for right-to-left documents (Hebrew, Arabic, ...)
+RTL_CSS = """
+            body, p, div, table, ul, ol {
+                direction: rtl;
+                text-align: right;
+            }
+            /* Hebrew optimized fonts (resume style fonts still take precedence) */
+            body {
+                font-family: 'Arial', 'David', 'Times New Roman', sans-serif;
+            }
+            """
+
+# Script tracking in-browser edits of the contenteditable blocks
+EDITING_JS = """
+// Make all elements with contenteditable=true actually editable
+document.addEventListener('DOMContentLoaded', function() {
+    // Keep track of original content for change detection
+    const originalContents = {};
+    const editableElements = document.querySelectorAll('[contenteditable=true]');
+
+    editableElements.forEach(function(element, index) {
+        // Store original content
+        originalContents[index] = element.innerHTML;
+
+        // Add event listener to track edits
+        element.addEventListener('input', function() {
+            window.resumeHasUnsavedChanges = true;
+        });
+    });
+});
+"""
+
+AssetBundle = namedtuple("AssetBundle", [
+    "name",          # e.g. "modern-ltr"
+    "css_hash",      # Short sha256 of the minified CSS
+    "css",           # Minified stylesheet
+    "style_block",   # <style> element with the stylesheet
+    "head_block",    # <head> tag followed by the style element (documents without styles)
+    "style_append",  # Stylesheet appended to an existing <style> section (ends with </style>)
+    "script_block",  # <script> element with the editing script
+])
+
+_SIDES = {"left": "right", "right": "left"}
+_SIDE_PATTERN = re.compile(r"\b(left|right)\b")
+# Properties whose value (not name) is a side
+_SIDE_VALUE_PROPERTIES = ("float", "clear", "text-align")
+# Reset of the original side when a flipped rule overrides an LTR stylesheet
+_SIDE_RESETS = {"left": "auto", "right": "auto"}
+
+
+def minify_css(css):
+    """Remove comments and insignificant whitespace"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js):
+    """Drop comment-only and blank lines and the indentation (line breaks are kept)"""
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _css_rules(css):
+    """(selector, declarations) pairs of a minified stylesheet"""
+    return [(selector, declarations.split(";")) for selector, declarations in re.findall(r"([^{}]+)\{([^{}]*)\}", css)]
+
+
+def _join_rules(rules):
+    return "".join(f"{selector}{{{';'.join(declarations)}}}" for selector, declarations in rules)
+
+
+def _keep_rule(selector, resume_style):
+    """Drop rules that only target one of the other resume styles"""
+    if resume_style not in RESUME_STYLES:
+        return True
+    for part in selector.split(","):
+        first_class = re.match(r"\.([\w-]+)", part)
+        if not first_class or first_class.group(1) not in RESUME_STYLES or first_class.group(1) == resume_style:
+            return True
+    return False
+
+
+def _mirror(name):
+    return _SIDE_PATTERN.sub(lambda match: _SIDES[match.group(1)], name)
+
+
+def _flip_declarations(declarations):
+    """Mirror the left / right properties of one rule for RTL layouts"""
+    properties = {declaration.partition(":")[0] for declaration in declarations}
+    flipped = []
+    for declaration in declarations:
+        name, _, value = declaration.partition(":")
+        if name in _SIDE_VALUE_PROPERTIES:
+            flipped.append(f"{name}:{_SIDES.get(value, value)}")
+            continue
+        mirrored = _mirror(name)
+        flipped.append(f"{mirrored}:{value}")
+        if mirrored != name and mirrored not in properties:
+            # Undo the original side, so the bundle can also override an LTR stylesheet
+            flipped.append(f"{name}:{_SIDE_RESETS.get(name, '0')}")
+    return flipped
+
+
+def _build_bundle(resume_style, rtl):
+    rules = [(selector, declarations) for selector, declarations in _css_rules(minify_css(RESUME_CSS))
+             if _keep_rule(selector, resume_style)]
+    if rtl:
+        rules = [(selector, _flip_declarations(declarations)) for selector, declarations in rules] + _css_rules(minify_css(RTL_CSS))
+    css = _join_rules(rules)
+    css_hash = hashlib.sha256(css.encode("utf-8")).hexdigest()[:12]
+    name = f"{resume_style or 'all'}-{'rtl' if rtl else 'ltr'}"
+    style_block = f'<style data-bundle="{name}-{css_hash}">{css}</style>'
+    return AssetBundle(
+        name=name,
+        css_hash=css_hash,
+        css=css,
+        style_block=style_block,
+        head_block=f"<head>\n{style_block}",
+        style_append=f"\n/* bundle {name}-{css_hash} */\n{css}\n</style>",
+        script_block=f"<script>\n{minify_js(EDITING_JS)}\n</script>",
+    )
+
+
+# All bundles, built once at import time
+BUNDLES = {
+    (resume_style, rtl): _build_bundle(resume_style, rtl)
+    for resume_style in RESUME_STYLES + (None,)
+    for rtl in (False, True)
+}
+
+
+def get_bundle(resume_style=None, rtl=False):
+    """Precompiled bundle for a resume style and text direction (all styles for unknown ones)"""
+    return BUNDLES.get((resume_style, rtl)) or BUNDLES[(None, rtl)]
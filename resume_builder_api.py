@@ -1,4 +1,4 @@
-from fastapi import FastAPI, HTTPException, Body, Response
+from fastapi import FastAPI, HTTPException, Body, Response, Request, Depends, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, EmailStr
 from typing import Dict, List, Optional, Any
@@ -6,14 +6,39 @@ import os
 import subprocess
 import json
 import time
+import asyncio
 from main import EnhancedResumeBuilder  # Import existing EnhancedResumeBuilder class
+from session_store import SessionStore, Session, session_id_from_request, SESSION_COOKIE
+import llm_gateway
+from llm_cache import response_cache
+from artifact_store import artifact_store
+from html_postprocessor import postprocess_resume_html
+from text_direction import apply_direction, resolve_locale
+from resume_document import parse_resume_document, resume_json_instructions, ResumeDocument, JsonMemberReader
+from resume_renderer import render_resume
+from resume_assets import RESUME_STYLES
+from section_generation import (
+    generate_resume_document, generate_resume_sections, build_section_tasks, section_system_message,
+    iter_resume_sections, assemble_resume_document, remember_sections
+)
+from followup_engine import rule_based_followup, context_followups
+from job_queue import (
+    job_scheduler, PRIORITY_INTERACTIVE, PRIORITY_GENERATION, PRIORITY_BULK,
+    FINISHED_STATES, JOB_SUCCEEDED, JOB_FAILED
+)
+import resume_translation
+from resume_translation import translate_resume_content, translate_resume_languages
+from urllib.parse import quote
 
 #טיפול בהורדת קבצים בצד לקוח (בדפדפן)
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
 import io
-import tempfile
 
 
+# Server-Sent Event streams send a comment line after this many silent seconds,
+# so proxies and gateways don't time out while the model is still writing
+SSE_KEEPALIVE_SECONDS = float(os.getenv('CARA_SSE_KEEPALIVE_SECONDS', '10'))
+
 app = FastAPI(title="CARA Resume Builder API", description="API for the CARA Resume Builder")
 
 # Configure CORS to allow frontend requests
@@ -34,26 +59,59 @@ class UserInfo(BaseModel):
 class QuestionResponse(BaseModel):
     key: str
     answer: str
+    deferred: bool = False  # Acknowledge right away, feedback and follow-ups via /api/answer/{index}/feedback
+
+class ChannelAnswer(BaseModel):
+    index: int
+    answer: str = ""
 
 class ResumeGenerationRequest(BaseModel):
     format: str  # 'html' or 'text'
     style: str   # 'traditional', 'modern', or 'creative'
     confirmed_skills: Dict[str, List[str]]
+    target_language: Optional[str] = None  # Write the resume directly in this language (default English)
+    generation_mode: Optional[str] = None  # 'sections' - write each section with a separate, concurrent request
+
+class AnswerEditRequest(BaseModel):
+    answers: Dict[str, str]  # question key -> new answer
+
+class RerenderRequest(BaseModel):
+    format: Optional[str] = None  # 'html' or 'text' (default: the current format)
+    style: Optional[str] = None   # 'traditional', 'modern', or 'creative' (default: the current style)
 
 class TranslationRequest(BaseModel):
     filename: str
     target_language: str
 
-# Global variable to store the resume builder instance
-resume_builder_instance = None
+class BatchTranslationRequest(BaseModel):
+    filename: str = None
+    target_languages: List[str]
+
+# Registry of all live resume builder sessions (one EnhancedResumeBuilder per user)
+session_store = SessionStore()
+
+def lookup_session(request: Request):
+    """
+    Resolve the caller's session from the X-Session-ID header, cookie or session_id query param
+    """
+    session = session_store.get(session_id_from_request(request))
+    if session is None:
+        raise HTTPException(status_code=400, detail="Session not initialized")
+    return session
+
+async def get_session(session: Session = Depends(lookup_session)):
+    """
+    Resolve the caller's session and hold its lock for the request
+    """
+    # Requests of the same session are handled one at a time
+    async with session.lock:
+        yield session
 
 @app.post("/api/initialize")
-async def initialize_session(user_info: UserInfo):
+async def initialize_session(user_info: UserInfo, response: Response):
     """
     Initialize a new resume building session with user info
     """
-    global resume_builder_instance
-    
     try:
         # Create a new instance of your EnhancedResumeBuilder
         resume_builder_instance = EnhancedResumeBuilder()
@@ -69,120 +127,49 @@ async def initialize_session(user_info: UserInfo):
         # Initialize questions based on user profile
         resume_builder_instance.questions = resume_builder_instance._initialize_questions()
         
+        # Register the new session
+        session = session_store.create(resume_builder_instance)
+        response.set_cookie(SESSION_COOKIE, session.session_id, httponly=True, samesite="lax")
+        
         return {
             "status": "success",
             "message": "Resume builder session initialized",
+            "session_id": session.session_id,
             "total_questions": len(resume_builder_instance.questions)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to initialize: {str(e)}")
 
-@app.post("/api/follow-up/linkedin_profiles")
-async def linkedin_followup(data: dict):
+@app.post("/api/follow-up/{followup_type}")
+async def followup_answer(followup_type: str, data: dict, session: Session = Depends(get_session)):
     """
-    Handle follow-up response for LinkedIn profiles
+    Handle the answer to a follow-up question (linkedin_profiles, work_arrangement,
+    job_details, professional_context). The answer is added to the original answer
+    and the next follow-up of the same question, if any, is returned with it
     """
-    global resume_builder_instance
-    
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
-    
     try:
-        answer = data.get("answer", "").strip()
-        if answer:
-            # Update LinkedIn entry with additional profiles
-            original_answer = resume_builder_instance.user_data.get("linkedin", "")
-            resume_builder_instance.user_data["linkedin"] = f"{original_answer}\nOther profiles: {answer}"
-            resume_builder_instance.user_data["linkedin_followup_asked"] = True
-        
-        return {
-            "status": "success",
-            "message": "LinkedIn follow-up response saved"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing follow-up: {str(e)}")
-
-@app.post("/api/follow-up/location")
-async def location_followup(data: dict):
-    """
-    Handle follow-up response for work arrangement preference
-    """
-    global resume_builder_instance
-    
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
-    
-    try:
-        work_arrangement = data.get("answer", "").strip()
-        if work_arrangement:
-            # Update location with work arrangement preference
-            location = resume_builder_instance.user_data.get("location", "")
-            resume_builder_instance.user_data["location"] = f"Location: {location}\nWork Arrangement: {work_arrangement}"
-        
-        return {
-            "status": "success",
-            "message": "Work arrangement preference saved"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing follow-up: {str(e)}")
-
-@app.post("/api/follow-up/job_details")
-async def job_details_followup(data: dict):
-    """
-    Handle follow-up response for missing job details
-    """
-    global resume_builder_instance
-    
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
-    
-    try:
-        additional_details = data.get("answer", "").strip()
-        if additional_details:
-            # Append additional details to job history
-            job_history = resume_builder_instance.user_data.get("job_history", "")
-            resume_builder_instance.user_data["job_history"] = f"{job_history}\n{additional_details}"
-        
-        return {
-            "status": "success",
-            "message": "Job details saved"
-        }
+        message, next_followup = session.followups.respond(
+            session.builder.user_data, followup_type, str(data.get("answer") or ""), data.get("original_key"),
+            question_keys={question["key"] for question in session.builder.questions}
+        )
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f"Unknown follow-up type: {followup_type}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing follow-up: {str(e)}")
-
-@app.post("/api/follow-up/work_arrangement")
-async def work_arrangement_followup(data: dict):
-    """
-    Handle follow-up response for work arrangement preference
-    """
-    global resume_builder_instance
     
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
-    
-    try:
-        work_arrangement = data.get("answer", "").strip()
-        if work_arrangement:
-            # Update location with work arrangement preference
-            location = resume_builder_instance.user_data.get("location", "")
-            resume_builder_instance.user_data["location"] = f"Location: {location}\nWork Arrangement: {work_arrangement}"
-        
-        return {
-            "status": "success",
-            "message": "Work arrangement preference saved"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing follow-up: {str(e)}")
+    return {
+        "status": "success",
+        "message": message,
+        "followup": next_followup,
+        "next_question": next_followup["message"] if next_followup else None
+    }
     
 @app.get("/api/questions")
-async def get_questions():
+async def get_questions(session: Session = Depends(get_session)):
     """
     Get the list of questions based on the initialized profile
     """
-    global resume_builder_instance
-    
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized. Call /api/initialize first")
+    resume_builder_instance = session.builder
     
     try:
         questions = resume_builder_instance.questions
@@ -201,14 +188,11 @@ async def get_questions():
         raise HTTPException(status_code=500, detail=f"Error retrieving questions: {str(e)}")
 
 @app.get("/api/question/{index}")
-async def get_question(index: int):
+async def get_question(index: int, session: Session = Depends(get_session)):
     """
     Get a specific question by its index
     """
-    global resume_builder_instance
-    
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
+    resume_builder_instance = session.builder
     
     try:
         questions = resume_builder_instance.questions
@@ -225,180 +209,286 @@ async def get_question(index: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving question: {str(e)}")
 
-@app.post("/api/answer/{index}")
-async def save_answer(index: int, response: QuestionResponse):
+async def _professional_context_followup(resume_builder_instance, question, answer):
     """
-    Save an answer for a specific question
+    Generate context-based follow-up prompts using the original _analyze_professional_context method
     """
-    global resume_builder_instance
-    
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
+    try:
+        professional_questions = await llm_gateway.run_blocking(
+            resume_builder_instance._analyze_professional_context,
+            answer, question["question"], question["key"], question["section"]
+        )
+        
+        if professional_questions:
+            return context_followups(professional_questions)
+    except Exception as context_error:
+        # Silently fail if the context analysis doesn't work
+        pass
+    return []
+
+async def _answer_feedback(resume_builder_instance, key, answer, on_token=None):
+    """
+    Get a short coaching tip for important sections (None for all other keys).
+    With `on_token`, the tip is streamed and each text delta is passed to it as it arrives
+    """
+    if key not in ['summary', 'job_history', 'achievements', 'technical_skills']:
+        return None
     
     try:
-        questions = resume_builder_instance.questions
-        if 0 <= index < len(questions):
-            question = questions[index]
-            key = question["key"]
-            answer = response.answer.strip()
-            
-            # Validate email if that's the current question
-            if key == 'email' and answer:
-                from main import validate_email
-                if not validate_email(answer):
-                    raise HTTPException(status_code=400, detail="Invalid email format")
-            
-            # Save the answer
-            resume_builder_instance.user_data[key] = answer
-            
-            # Add to conversation history (used by some methods in the original backend)
-            resume_builder_instance.conversation_history.append({"role": "user", "content": answer})
-            
-            # Now we call the original follow-up methods
-            followup_data = None
-            try:
-                # Call _check_for_follow_up method directly
-                # This method in the original code doesn't return anything,
-                # but updates the conversation and asks follow-up questions in-line
-                
-                # For LinkedIn follow-ups
-                if key == 'linkedin':
-                    if answer.lower() in ['no', 'n', 'none', '', 'dont have one', "don't have one", 'dont have', "don't have", 'i dont have one', 'i dont', 'skip']:
-                        followup_data = {
-                            "type": "linkedin_profiles",
-                            "message": "Do you have any other professional social media profiles you'd like to include? (e.g., GitHub, portfolio website)"
-                        }
-                
-                # For location follow-ups
-                elif key == 'location':
-                    followup_data = {
-                        "type": "work_arrangement",
-                        "message": "What is your preferred work arrangement? (Remote, Hybrid, On-site, or No preference)"
-                    }
-                
-                # For job history follow-ups (check for missing dates, etc.)
-                elif key == 'job_history':
-                    # Run an analysis to check for missing details
-                    if not any(word in answer.lower() for word in ['2025','2024','2023', '2022', '2021', '2020', '2019', '2018', '2017', '2016', '2015', '2014', '2013', '2012', '2011', '2010', '2009', '2008', '2007', '2006', '2005', '2004', '2003', '2002', '2001', '2000', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec', 'january', 'february', 'march', 'april', 'june', 'july', 'august', 'september', 'october', 'november', 'december']):
-                        followup_data = {
-                            "type": "job_details",
-                            "message": "If you accidentally left out any of the details regarding the date range, job title, or company name, it's recommended to add them now for maximum clarity"
-                        }
-                
-                # Generate additional context-based follow-up questions using the original method
-                if not followup_data:  # Only for substantial answers
-                    try:
-
-                        # Use the original _analyze_professional_context method to generate follow-up questions
-                        original_question = questions[index]["question"]  # Get the original question
-                        question_key = questions[index]["key"]
-                        question_section = questions[index]["section"]
-                        professional_questions = resume_builder_instance._analyze_professional_context(answer, original_question, question_key, question_section)
-
-                        if professional_questions and len(professional_questions) > 0:
-                            followup_data = {
-                                "type": "professional_context",
-                                "message": professional_questions[0],  # Take the first question
-                                "additional_questions": professional_questions[1:] if len(professional_questions) > 1 else []
-                            }
-                    except Exception as context_error:
-                        # Silently fail if the context analysis doesn't work
-                        pass
-            except Exception as followup_error:
-                # If follow-up detection fails, we continue without it
-                pass
-            
-            # Get feedback for important sections
-            feedback = None
-            if key in ['summary', 'job_history', 'achievements', 'technical_skills']:
-                try:
-                    # Call the original feedback method
-                    resume_builder_instance._provide_feedback(key, answer)
-                    
-                    # Since the original method doesn't return anything (it just prints to console),
-                    # we'll simulate a similar feedback here for the frontend
-                    if key == "summary":
-                        prompt = f"Based on this professional summary for a {resume_builder_instance.job_role} position, give ONE brief, specific, encouraging suggestion for improvement or ONE positive point worth emphasizing. Keep it under 50 words and conversational: '{answer}'"
-                    elif key == "job_history":
-                        prompt = f"Based on this work experience for a {resume_builder_instance.job_role} resume, give ONE brief, specific tip for better highlighting achievements or impact. Keep it under 50 words and conversational: '{answer}'"
-                    elif key == "achievements":
-                        prompt = f"Based on these achievements for a {resume_builder_instance.job_role} position, suggest ONE way to quantify or strengthen the impact. Keep it under 50 words and conversational: '{answer}'"
-                    elif key == "technical_skills":
-                        prompt = f"Based on these technical skills for a {resume_builder_instance.job_role} position, give ONE brief suggestion for better organization or presentation. Keep it under 50 words and conversational: '{answer}'"
-                    
-                    # Use OpenAI API
-                    import openai
-                    feedback_response = openai.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[
-                            {"role": "system", "content": "You are a helpful resume coach giving brief, friendly, specific advice."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        temperature=0.7,
-                        max_tokens=100,
-                    )
-                    
-                    feedback_message = feedback_response.choices[0].message.content.strip()
-                    feedback = {"message": f"💡 {feedback_message}"}
-                except Exception as feedback_error:
-                    # If feedback generation fails, continue without it
-                    pass
-            
-            # Create a response that includes both the answer status and any follow-up info
-            response_data = {
-                "status": "success",
-                "message": "Answer saved",
-                "feedback": feedback
-            }
-            
-            # Add follow-up info if available
-            if followup_data:
-                response_data["followup"] = followup_data
-            
-            return response_data
+        if key == "summary":
+            prompt = f"Based on this professional summary for a {resume_builder_instance.job_role} position, give ONE brief, specific, encouraging suggestion for improvement or ONE positive point worth emphasizing. Keep it under 50 words and conversational: '{answer}'"
+        elif key == "job_history":
+            prompt = f"Based on this work experience for a {resume_builder_instance.job_role} resume, give ONE brief, specific tip for better highlighting achievements or impact. Keep it under 50 words and conversational: '{answer}'"
+        elif key == "achievements":
+            prompt = f"Based on these achievements for a {resume_builder_instance.job_role} position, suggest ONE way to quantify or strengthen the impact. Keep it under 50 words and conversational: '{answer}'"
+        elif key == "technical_skills":
+            prompt = f"Based on these technical skills for a {resume_builder_instance.job_role} position, give ONE brief suggestion for better organization or presentation. Keep it under 50 words and conversational: '{answer}'"
+        
+        # Use OpenAI API
+        feedback_request = dict(
+            cache_site="answer_feedback",
+            model="gpt-3.5-turbo",
+            messages=[
+                {"role": "system", "content": "You are a helpful resume coach giving brief, friendly, specific advice."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.7,
+            max_tokens=100,
+        )
+        if on_token is None:
+            feedback_response = await llm_gateway.achat_completion(**feedback_request)
+            feedback_message = feedback_response.choices[0].message.content.strip()
         else:
-            raise HTTPException(status_code=404, detail="Question index out of range")
+            chunks = []
+            async for token in llm_gateway.astream_chat_completion(**feedback_request):
+                chunks.append(token)
+                on_token(token)
+            feedback_message = "".join(chunks).strip()
+        return {"message": f"💡 {feedback_message}"}
+    except Exception as feedback_error:
+        # If feedback generation fails, continue without it
+        return None
+
+def _needs_llm_followups(key, queue):
+    """Whether an answer gets LLM work - context follow-ups (when no rule applies) or coaching feedback"""
+    return not queue.prompts or key in ['summary', 'job_history', 'achievements', 'technical_skills']
+
+async def _llm_followups(resume_builder_instance, question, answer, queue, on_token=None):
+    """
+    The context-based follow-up prompts (only when no rule-based follow-up applies)
+    and the coaching feedback - independent LLM calls, run concurrently.
+    Returns (follow-up prompts, feedback)
+    """
+    context_prompts, feedback = await asyncio.gather(
+        _professional_context_followup(resume_builder_instance, question, answer) if not queue.prompts else asyncio.sleep(0, result=[]),
+        _answer_feedback(resume_builder_instance, question["key"], answer, on_token),
+    )
+    return context_prompts, feedback
+
+@app.post("/api/answer/{index}")
+async def save_answer(index: int, response: QuestionResponse, session: Session = Depends(get_session)):
+    """
+    Save an answer for a specific question.
+    With deferred=true the answer is acknowledged right away and the feedback and
+    follow-ups are computed in the background - fetched from /api/answer/{index}/feedback
+    (or pushed by /api/answer/{index}/feedback/events)
+    """
+    resume_builder_instance = session.builder
+    
+    try:
+        question, answer, queue = _store_answer(session, index, response.answer)
+        
+        if response.deferred:
+            return _defer_answer_followups(session, index, question, answer, queue)
+        
+        context_prompts, feedback = await _llm_followups(resume_builder_instance, question, answer, queue)
+        followup_data = session.followups.extend(queue, context_prompts)
+        
+        # Create a response that includes both the answer status and any follow-up info
+        response_data = {
+            "status": "success",
+            "message": "Answer saved",
+            "feedback": feedback
+        }
+        
+        # Add follow-up info if available
+        if followup_data:
+            response_data["followup"] = followup_data
+        
+        return response_data
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error saving answer: {str(e)}")
-       
-@app.post("/api/follow-up/professional_context")
-async def professional_context_followup(data: dict):
+
+def _validate_answer(key, answer):
     """
-    Handle follow-up response for professional context questions
+    Cleaned answer to the question `key` - raises HTTPException 400 for invalid
+    answers (used for new answers and for edits of earlier ones)
     """
-    global resume_builder_instance
+    answer = answer.strip()
     
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
+    # Validate email if that's the current question
+    if key == 'email' and answer:
+        from main import validate_email
+        if not validate_email(answer):
+            raise HTTPException(status_code=400, detail="Invalid email format")
+    return answer
+
+def _store_answer(session, index, answer):
+    """
+    Validate and save an answer and start its follow-up queue (with the rule-based
+    follow-up, if one applies) - returns (question, answer, follow-up queue)
+    """
+    resume_builder_instance = session.builder
+    questions = resume_builder_instance.questions
+    if not 0 <= index < len(questions):
+        raise HTTPException(status_code=404, detail="Question index out of range")
+    question = questions[index]
+    key = question["key"]
+    answer = _validate_answer(key, answer)
     
+    # Save the answer
+    resume_builder_instance.user_data[key] = answer
+    
+    # Add to conversation history (used by some methods in the original backend)
+    resume_builder_instance.conversation_history.append({"role": "user", "content": answer})
+    
+    # Now we call the original follow-up methods
+    followup = None
     try:
-        context_answer = data.get("answer", "").strip()
-        original_key = data.get("original_key", "")
-        
-        if context_answer and original_key and original_key in resume_builder_instance.user_data:
-            # Append the additional context to the original answer
-            original_answer = resume_builder_instance.user_data[original_key]
-            resume_builder_instance.user_data[original_key] = f"{original_answer}\n\nAdditional context: {context_answer}"
-        
-        return {
+        followup = rule_based_followup(key, answer)
+    except Exception as followup_error:
+        # If follow-up detection fails, we continue without it
+        pass
+    return question, answer, session.followups.start(key, [followup] if followup else [])
+
+def _defer_answer_followups(session, index, question, answer, queue):
+    """
+    Acknowledge a saved answer and compute its feedback and follow-ups as an
+    interactive background job, keyed by the question index
+    """
+    resume_builder_instance = session.builder
+    feedback_url = f"/api/answer/{index}/feedback"
+    response_data = {
+        "status": "success",
+        "message": "Answer saved",
+        "feedback": None,
+        "feedback_pending": False,
+    }
+    
+    # A rule-based follow-up needs no LLM call - it is sent right away (and again with the feedback)
+    if queue.prompt():
+        response_data["followup"] = queue.prompt()
+    
+    if not _needs_llm_followups(question["key"], queue):
+        session.answer_feedback_jobs.pop(index, None)
+        return response_data
+    
+    async def run(job):
+        # בלי נעילת הסשן - התשובה הבאה נשמרת בזמן שהמשוב מחושב
+        context_prompts, feedback = await _llm_followups(resume_builder_instance, question, answer, queue)
+        return {"feedback": feedback, "followup": session.followups.extend(queue, context_prompts)}
+    
+    job = job_scheduler.submit(run, "answer-feedback", priority=PRIORITY_INTERACTIVE, session_id=session.session_id)
+    # A newer answer to the same question replaces the pending feedback
+    session.answer_feedback_jobs[index] = job.job_id
+    
+    response_data.update({
+        "feedback_pending": True,
+        "feedback_url": feedback_url,
+        "events_url": f"{feedback_url}/events"
+    })
+    return response_data
+
+def _answer_feedback_job(index, session):
+    """Id of the job computing the feedback of an answer saved in the deferred mode"""
+    job_id = session.answer_feedback_jobs.get(index)
+    if job_id is None:
+        raise HTTPException(status_code=404, detail="No pending feedback for this question")
+    return job_id
+
+def _answer_feedback_view(index, state):
+    """
+    Feedback of a deferred answer from its job state: status 'pending', 'ready' or 'failed'
+    """
+    result = state["result"] or {}
+    return {
+        "index": index,
+        "status": {JOB_SUCCEEDED: "ready", JOB_FAILED: "failed"}.get(state["status"], "pending"),
+        "feedback": result.get("feedback"),
+        "followup": result.get("followup"),
+        "error": state["error"]
+    }
+
+@app.get("/api/answer/{index}/feedback")
+async def get_answer_feedback(index: int, session: Session = Depends(lookup_session)):
+    """
+    Feedback and follow-up of an answer saved with deferred=true (poll until the status isn't 'pending')
+    """
+    return _answer_feedback_view(index, _job_state(_answer_feedback_job(index, session), session))
+
+@app.get("/api/answer/{index}/feedback/events")
+async def answer_feedback_events(index: int, session: Session = Depends(lookup_session)):
+    """
+    Push the feedback of an answer saved with deferred=true as Server-Sent Events:
+    a feedback event with status 'pending', then one with the final state
+    """
+    job_id = _answer_feedback_job(index, session)
+    _job_state(job_id, session)
+    return _sse_response(_job_event_stream(job_id, session, "feedback", lambda state: _answer_feedback_view(index, state)))
+       
+@app.post("/api/answer/{index}/stream")
+async def save_answer_stream(index: int, response: QuestionResponse, session: Session = Depends(lookup_session)):
+    """
+    Save an answer and stream its coaching feedback as Server-Sent Events while the model writes it.
+    Events: saved (rule-based follow-up and progress, sent right away) -> token (repeated) ->
+    done (feedback and follow-up, same as in /api/answer/{index})
+    """
+    # Validation errors are returned as normal HTTP errors, before the stream starts
+    async with session.lock:
+        question, answer, queue = _store_answer(session, index, response.answer)
+        progress = _interview_progress(session.builder)
+    
+    async def event_stream():
+        yield _sse_event("saved", {
             "status": "success",
-            "message": "Additional context saved",
-            "next_question": data.get("next_question", None)  # Return the next follow-up question if available
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error processing follow-up: {str(e)}")
+            "message": "Answer saved",
+            "index": index,
+            "followup": queue.prompt(),
+            "feedback_pending": _needs_llm_followups(question["key"], queue),
+            "progress": progress
+        })
+        if not _needs_llm_followups(question["key"], queue):
+            yield _sse_event("done", {"feedback": None, "followup": queue.prompt()})
+            return
+        
+        # בלי נעילת הסשן - הטוקנים עוברים ללקוח דרך תור ברגע שהם מגיעים
+        tokens = asyncio.Queue()
+        work = asyncio.ensure_future(_llm_followups(session.builder, question, answer, queue, on_token=tokens.put_nowait))
+        work.add_done_callback(lambda done: tokens.put_nowait(None))
+        try:
+            while True:
+                token = await tokens.get()
+                if token is None:
+                    break
+                yield _sse_event("token", {"text": token})
+            context_prompts, feedback = work.result()
+            yield _sse_event("done", {"feedback": feedback, "followup": session.followups.extend(queue, context_prompts)})
+        except Exception as e:
+            yield _sse_event("error", {"detail": f"Error saving answer: {str(e)}"})
+        finally:
+            # The client went away - stop writing the feedback
+            work.cancel()
     
+    return _sse_response(event_stream())
+
 @app.get("/api/answers")
-async def get_all_answers():
+async def get_all_answers(session: Session = Depends(get_session)):
     """
     Get all answers provided so far
     """
-    global resume_builder_instance
-    
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
+    resume_builder_instance = session.builder
     
     try:
         return {
@@ -408,18 +498,15 @@ async def get_all_answers():
         raise HTTPException(status_code=500, detail=f"Error retrieving answers: {str(e)}")
 
 @app.post("/api/analyze-skills")
-async def analyze_skills():
+async def analyze_skills(session: Session = Depends(get_session)):
     """
     Analyze user responses to identify implied skills
     """
-    global resume_builder_instance
-    
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
+    resume_builder_instance = session.builder
     
     try:
         # Call the actual _analyze_and_enhance_skills method
-        implied_skills = resume_builder_instance._analyze_and_enhance_skills()
+        implied_skills = await llm_gateway.run_blocking(resume_builder_instance._analyze_and_enhance_skills)
         
         if not implied_skills or not any(implied_skills.values()):
             # Return empty skills if analysis failed or found nothing
@@ -450,491 +537,911 @@ async def analyze_skills():
             }
         }
 
-@app.post("/api/generate-resume")
-async def generate_resume(request: ResumeGenerationRequest):
+async def _channel_followup(session, message):
+    return await followup_answer(str(message.get("followup_type")), message, session=session)
+
+# Request / response actions of the interview channel (same results as the HTTP endpoints)
+_CHANNEL_ACTIONS = {
+    "questions": lambda session, message: get_questions(session=session),
+    "question": lambda session, message: get_question(int(message.get("index", -1)), session=session),
+    "followup": _channel_followup,
+    "answers": lambda session, message: get_all_answers(session=session),
+    "analyze_skills": lambda session, message: analyze_skills(session=session),
+}
+
+def _interview_progress(resume_builder_instance):
+    """How many of the interview questions have an answer"""
+    questions = resume_builder_instance.questions
+    answered = sum(1 for question in questions if resume_builder_instance.user_data.get(question["key"]))
+    return {"answered": answered, "total": len(questions)}
+
+@app.websocket("/api/interview/ws")
+async def interview_channel(websocket: WebSocket):
     """
-    Generate the resume based on user answers and format preferences
+    The whole interview over one WebSocket, instead of an HTTP request per question,
+    answer and follow-up. The session is identified like in the HTTP endpoints
+    (session_id query param, X-Session-ID header or cookie).
+    
+    Client -> server: {"type": action, "request_id": ..., ...} with the actions
+    questions, question (index), answer (index, answer), followup (followup_type,
+    answer, original_key), answers and analyze_skills.
+    Server -> client: a result (action, request_id, data) or error (action,
+    request_id, status_code, detail) for every request - the result of an
+    answer is sent right away, with the rule-based follow-up and the interview
+    progress (answered, total) - and pushes: feedback_token (index, text) while
+    the coaching feedback of an answer is written, and feedback (index,
+    feedback, followup) when the feedback and follow-ups are complete.
     """
-    global resume_builder_instance
+    session = session_store.get(session_id_from_request(websocket))
+    if session is None:
+        await websocket.close(code=1008, reason="Session not initialized")
+        return
+    await websocket.accept()
     
-    if not resume_builder_instance:
-        raise HTTPException(status_code=400, detail="Session not initialized")
+    # All messages go out through one writer, in order
+    outgoing = asyncio.Queue()
+    feedback_tasks = {}  # question index -> task computing its feedback
     
-    try:
-        # Store confirmed skills
-        resume_builder_instance.confirmed_skills = request.confirmed_skills
-        
-        # Get format and style
-        resume_format = request.format  # 'html' or 'text'
-        resume_style = request.style    # 'traditional', 'modern', or 'creative'
+    async def writer():
+        try:
+            while True:
+                await websocket.send_json(await outgoing.get())
+        except (WebSocketDisconnect, RuntimeError):
+            # The client went away - the reader loop ends the channel
+            pass
+    
+    def send(message_type, **payload):
+        outgoing.put_nowait({"type": message_type, **payload})
+    
+    async def push_answer_followups(index, question, answer, queue):
+        # בלי נעילת הסשן - התשובה הבאה נשמרת בזמן שהמשוב נכתב
+        context_prompts, feedback = await _llm_followups(
+            session.builder, question, answer, queue,
+            on_token=lambda token: send("feedback_token", index=index, text=token)
+        )
+        send("feedback", index=index, feedback=feedback, followup=session.followups.extend(queue, context_prompts))
+    
+    async def save(message):
+        # Raises ValidationError (a ValueError) for a missing index or an answer that isn't text
+        request = ChannelAnswer.model_validate(message)
+        index = request.index
+        async with session.lock:
+            question, answer, queue = _store_answer(session, index, request.answer)
+            progress = _interview_progress(session.builder)
         
-        # Generate filename
-        name_part = resume_builder_instance.user_data.get('full_name', 'resume').replace(' ', '_').lower()
-        job_part = resume_builder_instance.job_role.replace(' ', '_').lower()
-        file_extension = "html" if resume_format == 'html' else "txt"
+        pending = _needs_llm_followups(question["key"], queue)
+        if index in feedback_tasks:
+            # A newer answer to the same question replaces the feedback being written
+            feedback_tasks.pop(index).cancel()
+        if pending:
+            task = asyncio.ensure_future(push_answer_followups(index, question, answer, queue))
+            feedback_tasks[index] = task
+            
+            def forget(done):
+                if feedback_tasks.get(index) is done:
+                    del feedback_tasks[index]
+            task.add_done_callback(forget)
+        return {
+            "status": "success",
+            "message": "Answer saved",
+            "index": index,
+            "followup": queue.prompt(),
+            "feedback_pending": pending,
+            "progress": progress
+        }
+    
+    writer_task = asyncio.ensure_future(writer())
+    try:
+        while True:
+            text = await websocket.receive_text()
+            # Messages on the channel count as use of the session (idle expiry)
+            session_store.get(session.session_id)
+            action = request_id = None
+            try:
+                message = json.loads(text)
+                if not isinstance(message, dict):
+                    raise ValueError("Messages must be JSON objects")
+                action = message.get("type")
+                request_id = message.get("request_id")
+                if action == "answer":
+                    data = await save(message)
+                elif action in _CHANNEL_ACTIONS:
+                    async with session.lock:
+                        data = await _CHANNEL_ACTIONS[action](session, message)
+                else:
+                    raise HTTPException(status_code=400, detail=f"Unknown action: {action}")
+                send("result", action=action, request_id=request_id, data=data)
+            except HTTPException as e:
+                send("error", action=action, request_id=request_id, status_code=e.status_code, detail=e.detail)
+            except (TypeError, ValueError) as e:
+                send("error", action=action, request_id=request_id, status_code=400, detail=str(e))
+            except Exception as e:
+                # One failed message doesn't end the channel (or the feedback still being written)
+                send("error", action=action, request_id=request_id, status_code=500, detail=f"Error processing {action}: {str(e)}")
+    except WebSocketDisconnect:
+        pass
+    finally:
+        for task in list(feedback_tasks.values()):
+            task.cancel()
+        writer_task.cancel()
+
+def _generation_language(target_language):
+    """
+    Language the resume is written in - "" for English (the default)
+    """
+    target_language = (target_language or "").strip()
+    if target_language and resolve_locale(target_language).code != "en":
+        return target_language
+    return ""
+
+def _prepare_resume_generation(resume_builder_instance, request):
+    """
+    Build the file name and the OpenAI prompts for a resume generation request
+    """
+    # Store confirmed skills
+    resume_builder_instance.confirmed_skills = request.confirmed_skills
+    
+    # Get format and style
+    resume_format = request.format  # 'html' or 'text'
+    resume_style = request.style    # 'traditional', 'modern', or 'creative'
+    
+    # Generate filename
+    name_part = resume_builder_instance.user_data.get('full_name', 'resume').replace(' ', '_').lower()
+    job_part = resume_builder_instance.job_role.replace(' ', '_').lower()
+    file_extension = "html" if resume_format == 'html' else "txt"
+    target_language = _generation_language(request.target_language)
+    if target_language:
+        language_suffix = _language_suffix(target_language)
+        filename = f"{name_part}_{job_part}_resume_{language_suffix}.{file_extension}"
+    else:
         filename = f"{name_part}_{job_part}_resume.{file_extension}"
+    
+    # Build the system message for OpenAI
+    system_message = f"""
+    You are an expert resume writer specializing in creating {resume_style} resumes for {resume_builder_instance.resume_level} level {resume_builder_instance.job_role} positions.
+    
+    Create a highly professional, ATS-friendly resume that showcases the candidate's qualifications effectively.
+    
+    For a {resume_builder_instance.resume_level} level position:
+    - {resume_builder_instance.resume_level} level priorities: {"leadership impact and strategic vision" if resume_builder_instance.resume_level == "executive" else "professional achievements and growth" if resume_builder_instance.resume_level == "mid-level" else "education, skills, and potential"}
+    - Language style: {"authoritative and strategic" if resume_builder_instance.resume_level == "executive" else "confident and accomplished" if resume_builder_instance.resume_level == "mid-level" else "enthusiastic and promising"}
+    - Focus areas: {"leadership, transformation, and business results" if resume_builder_instance.resume_level == "executive" else "achievements, expertise, and career progression" if resume_builder_instance.resume_level == "mid-level" else "education, skills, and relevant experience"}
+    
+    Content style for a {resume_style} resume:
+    - {"Formal and structured content with traditional terminology" if resume_style == "traditional" else "Concise and impactful descriptions with modern industry terms" if resume_style == "modern" else "Engaging and distinctive content that showcases personality while remaining professional"}
+    
+    IMPORTANT FORMATTING GUIDELINES:
+    - Create a coherent, polished, and error-free document
+    - Use action verbs and quantifiable achievements
+    - Ensure perfect spelling, grammar, and consistent formatting
+    - Focus on results and accomplishments, not just responsibilities
+    - Tailor content specifically to a {resume_builder_instance.job_role} position
+
+    IMPORTANT - ENHANCE JOB DESCRIPTIONS:
+    For each job or project in the candidate's experience:
+    1. Identify key responsibilities that may be understated
+    2. Add specific, relevant accomplishments that align with their described duties
+    3. Use industry-standard terminology to elevate their descriptions
+    4. Ensure quantifiable achievements where possible (%, numbers, metrics)
+    5. Highlight leadership, initiative, and problem-solving when evident
+
+    Do this naturally and authentically, staying true to their actual experience.
+
+    IMPORTANT ABOUT SKILLS AND CAPABILITIES:
+    In addition to explicitly mentioned skills, incorporate these implied skills that are evident from the candidate's experiences (but only if relevant and authentic to their background):
+
+    Technical Skills: {', '.join(request.confirmed_skills.get('technical_skills', []))}
+    Soft Skills: {', '.join(request.confirmed_skills.get('soft_skills', []))}
+    Domain Knowledge: {', '.join(request.confirmed_skills.get('domain_knowledge', []))}
+    Tools & Platforms: {', '.join(request.confirmed_skills.get('tools_and_platforms', []))}
+
+    These should be integrated naturally into the resume where appropriate - either in a dedicated Skills section or incorporated into experience descriptions.
+    Only use these if they genuinely fit with the candidate's background.
+
+    IMPORTANT ABOUT LANGUAGES:
+    If the candidate has provided information about languages they speak:
+    1. Create a dedicated "Languages" section
+    2. List each language with its proficiency level (e.g., "English - Native", "Spanish - Fluent")
+    3. Format it consistently with other sections
+    4. Place it after the Skills section and before any Additional Information
+    """
+    
+    # כתיבה ישירה בשפת היעד - במקום יצירה באנגלית ותרגום נוסף
+    if target_language:
+        system_message += f"""
+    IMPORTANT ABOUT THE OUTPUT LANGUAGE:
+    Write the entire resume - section headings, summary, job descriptions and skills - in {target_language}.
+    The candidate's answers may be in another language; write the content natively in {target_language}, not as a literal translation.
+    Keep the following in their original form: email addresses, phone numbers, URLs, company and product names,
+    programming languages, tools and technical terms, academic degrees (BSc, MBA...) and personal names.
+    For technical terms in {target_language}, use the standard industry terminology.
+    Keep the JSON keys in English - only the values are written in {target_language}.
+    """
+    
+    # Build the user message
+    user_message = f"Please create a {resume_style} resume for a {resume_builder_instance.resume_level} level {resume_builder_instance.job_role} position based on the following information:\n\n"
+    
+    # Add the user information in a structured way
+    user_message += f"NAME: {resume_builder_instance.user_data.get('full_name', '')}\n"
+    user_message += f"TARGET POSITION: {resume_builder_instance.job_role}\n\n"
+    
+    # Add all other user data
+    for question in resume_builder_instance.questions:
+        key = question["key"]
+        if key in resume_builder_instance.user_data and resume_builder_instance.user_data[key] and key != 'full_name':
+            user_message += f"{question['section'].upper()} - {question['question']}\n{resume_builder_instance.user_data[key]}\n\n"
+    
+    # Output format instructions - the model returns only the content as JSON,
+    # the HTML / text resume is rendered locally from it (see resume_renderer)
+    user_message += resume_json_instructions(target_language)
+    
+    return filename, system_message, user_message
+
+def _render_resume_content(resume_builder_instance, resume_document, resume_format, resume_style, target_language=None):
+    """
+    Render a structured resume in a format and style, enhanced and in the
+    direction of its language - local work only, no model call
+    """
+    resume_content = render_resume(resume_document, resume_format, resume_style)
+    
+    # Enhance HTML if needed (in memory - the result is kept in the artifact store)
+    if resume_format == 'html':
+        # Enhance the HTML (wrapper, styles and editing features in a single pass)
+        try:
+            resume_content = postprocess_resume_html(
+                resume_content,
+                resume_style=resume_style,
+                full_name=resume_builder_instance.user_data.get('full_name', 'Resume'),
+                job_role=resume_builder_instance.job_role
+            )
+        except Exception:
+            # The rendered HTML should still be functional
+            pass
+    
+    # קורות חיים שנכתבו ישירות בשפת היעד מקבלים את אותו כיוון ושפה כמו תרגום
+    return apply_direction(resume_content, target_language, is_html=resume_format == 'html', resume_style=resume_style)
+
+def _store_resume(resume_builder_instance, session, resume_document, resume_format, resume_style, target_language, filename):
+    """
+    Render and store a structured resume as the session's current resume, returns the download URL
+    """
+    resume_content = _render_resume_content(resume_builder_instance, resume_document, resume_format, resume_style, target_language)
         
-        # Build the system message for OpenAI
-        system_message = f"""
-        You are an expert resume writer specializing in creating {resume_style} resumes for {resume_builder_instance.resume_level} level {resume_builder_instance.job_role} positions.
-        
-        Create a highly professional, ATS-friendly resume that showcases the candidate's qualifications effectively.
-        
-        For a {resume_builder_instance.resume_level} level position:
-        - {resume_builder_instance.resume_level} level priorities: {"leadership impact and strategic vision" if resume_builder_instance.resume_level == "executive" else "professional achievements and growth" if resume_builder_instance.resume_level == "mid-level" else "education, skills, and potential"}
-        - Language style: {"authoritative and strategic" if resume_builder_instance.resume_level == "executive" else "confident and accomplished" if resume_builder_instance.resume_level == "mid-level" else "enthusiastic and promising"}
-        - Focus areas: {"leadership, transformation, and business results" if resume_builder_instance.resume_level == "executive" else "achievements, expertise, and career progression" if resume_builder_instance.resume_level == "mid-level" else "education, skills, and relevant experience"}
-        
-        Content style for a {resume_style} resume:
-        - {"Formal and structured content with traditional terminology" if resume_style == "traditional" else "Concise and impactful descriptions with modern industry terms" if resume_style == "modern" else "Engaging and distinctive content that showcases personality while remaining professional"}
-        
-        IMPORTANT FORMATTING GUIDELINES:
-        - Create a coherent, polished, and error-free document
-        - Use action verbs and quantifiable achievements
-        - Ensure perfect spelling, grammar, and consistent formatting
-        - Focus on results and accomplishments, not just responsibilities
-        - Tailor content specifically to a {resume_builder_instance.job_role} position
-
-        IMPORTANT - ENHANCE JOB DESCRIPTIONS:
-        For each job or project in the candidate's experience:
-        1. Identify key responsibilities that may be understated
-        2. Add specific, relevant accomplishments that align with their described duties
-        3. Use industry-standard terminology to elevate their descriptions
-        4. Ensure quantifiable achievements where possible (%, numbers, metrics)
-        5. Highlight leadership, initiative, and problem-solving when evident
-
-        Do this naturally and authentically, staying true to their actual experience.
-
-        IMPORTANT ABOUT SKILLS AND CAPABILITIES:
-        In addition to explicitly mentioned skills, incorporate these implied skills that are evident from the candidate's experiences (but only if relevant and authentic to their background):
-
-        Technical Skills: {', '.join(request.confirmed_skills.get('technical_skills', []))}
-        Soft Skills: {', '.join(request.confirmed_skills.get('soft_skills', []))}
-        Domain Knowledge: {', '.join(request.confirmed_skills.get('domain_knowledge', []))}
-        Tools & Platforms: {', '.join(request.confirmed_skills.get('tools_and_platforms', []))}
-
-        These should be integrated naturally into the resume where appropriate - either in a dedicated Skills section or incorporated into experience descriptions.
-        Only use these if they genuinely fit with the candidate's background.
-
-        IMPORTANT ABOUT LANGUAGES:
-        If the candidate has provided information about languages they speak:
-        1. Create a dedicated "Languages" section
-        2. List each language with its proficiency level (e.g., "English - Native", "Spanish - Fluent")
-        3. Format it consistently with other sections
-        4. Place it after the Skills section and before any Additional Information
-        """
-        
-        # Build the user message
-        user_message = f"Please create a {resume_style} resume for a {resume_builder_instance.resume_level} level {resume_builder_instance.job_role} position based on the following information:\n\n"
-        
-        # Add the user information in a structured way
-        user_message += f"NAME: {resume_builder_instance.user_data.get('full_name', '')}\n"
-        user_message += f"TARGET POSITION: {resume_builder_instance.job_role}\n\n"
-        
-        # Add all other user data
-        for question in resume_builder_instance.questions:
-            key = question["key"]
-            if key in resume_builder_instance.user_data and resume_builder_instance.user_data[key] and key != 'full_name':
-                user_message += f"{question['section'].upper()} - {question['question']}\n{resume_builder_instance.user_data[key]}\n\n"
-        
-        # Output format instructions
-        if resume_format == 'html':
-            user_message += f"""
-            Please create the resume in HTML format that reflects a {resume_style} style and suitable for a {resume_builder_instance.resume_level} level position.
-            Do not include any CSS in the HTML style tags, Keep the empty style tags, the CSS it will be added by other enhancement function.
-
-            fill in the following HTML template with the candidate's information.
-            DO NOT modify the structure or class names, only fill in the content based on the information provided:
-
-            <!DOCTYPE html>
-            <html lang="en">
-            <head>
-                <meta charset="UTF-8">
-                <meta name="viewport" content="width=device-width, initial-scale=1.0">
-                <title>[CANDIDATE_NAME] - Resume</title>
-                <style>
-                    /* CSS will be added by enhancement function */
-                </style>
-            </head>
-            <body class="[RESUME_STYLE]">
-                <div class="resume-container">
-                    <!-- Header Section -->
-                    <div class="resume-header">
-                        <h1>[CANDIDATE_NAME]</h1>
-                        <p class="job-title">[JOB_ROLE]</p>
-                    </div>
-                    
-                    <!-- Contact Information -->
-                    <div class="contact-info">
-                        <p>[EMAIL] [PHONE] [LOCATION] - Use appropriate separators like | between items if multiple exist</p>
-                        <p>[LINKEDIN] [PORTFOLIO] - Include only if provided</p>
-                    </div>
-                    
-                    <!-- Summary Section - Include only if professional summary is provided -->
-                    <div class="section" id="summary">
-                        <h2>Professional Summary</h2>
-                        <div class="summary">
-                            <p>[PROFESSIONAL_SUMMARY]</p>
-                        </div>
-                    </div>
-                    
-                    <!-- Experience Section - Include only if work experience is provided -->
-                    <div class="section" id="experience">
-                        <h2>Professional Experience</h2>
-                        
-                        <!-- For each job position, create a separate experience-item div -->
-                        <div class="experience-item">
-                            <h3 class="job-position">[POSITION_TITLE] <span class="job-date">[EMPLOYMENT_DATES]</span></h3>
-                            <p class="job-company">[COMPANY_NAME], <span class="job-location">[JOB_LOCATION]</span></p>
-                            <ul>
-                                <li>[RESPONSIBILITY/ACHIEVEMENT 1]</li>
-                                <li>[RESPONSIBILITY/ACHIEVEMENT 2]</li>
-                                <!-- Add more list items as needed based on the information provided -->
-                            </ul>
-                        </div>
-                        <!-- Repeat experience-item div for each additional job -->
-                    </div>
-                    
-                    <!-- Education Section - Include only if education information is provided -->
-                    <div class="section" id="education">
-                        <h2>Education</h2>
-                        
-                        <!-- For each educational qualification, create a separate education-item div -->
-                        <div class="education-item">
-                            <h3 class="education-degree">[DEGREE_NAME] <span class="education-date">[EDUCATION_DATES]</span></h3>
-                            <p class="education-institution">[INSTITUTION_NAME], <span class="education-location">[EDUCATION_LOCATION]</span></p>
-                            <!-- Include the following ul only if there are specific education details to mention -->
-                            <ul>
-                                <li>[EDUCATION_DETAIL_1]</li>
-                                <li>[EDUCATION_DETAIL_2]</li>
-                            </ul>
-                        </div>
-                        <!-- Repeat education-item div for each additional education entry -->
-                    </div>
+    # שמירת התוכן במופע (לפונקצית התרגום ולהורדה)
+    resume_builder_instance.resume_document = resume_document
+    resume_builder_instance.resume_mime_type = "text/html" if resume_format == 'html' else "text/plain"
+    resume_builder_instance.resume_artifact = artifact_store.put(
+        resume_content, filename, resume_builder_instance.resume_mime_type
+    )
+
+    # שמירת שם הקובץ לשימוש מאוחר יותר
+    resume_builder_instance.resume_filename = filename
+    resume_builder_instance.resume_style = resume_style
+    resume_builder_instance.resume_format = resume_format
+    resume_builder_instance.resume_language = target_language
+    
+    # כאן ישירות נחזיר קישור להורדה
+    return f"/download-resume?filename={filename}&session_id={session.session_id}"
+
+def _finalize_resume(resume_builder_instance, session, resume_text, request, filename):
+    """
+    Validate the generated JSON resume, render it in the requested format
+    and store it, returns the download URL
+    """
+    # The structured resume is kept for re-rendering without the model
+    resume_document = parse_resume_document(resume_text)
+    return _store_resume(
+        resume_builder_instance, session, resume_document,
+        request.format, request.style, request.target_language, filename
+    )
+
+def _rerender_options(resume_builder_instance, resume_format, resume_style):
+    """
+    Format and style of a re-render (the current ones by default), validated
+    """
+    if getattr(resume_builder_instance, 'resume_document', None) is None:
+        raise HTTPException(status_code=400, detail="No resume has been generated yet")
+    
+    resume_format = resume_format or resume_builder_instance.resume_format
+    resume_style = resume_style or resume_builder_instance.resume_style
+    if resume_format not in ('html', 'text'):
+        raise HTTPException(status_code=400, detail=f"Unknown resume format: {resume_format}")
+    if resume_style not in RESUME_STYLES:
+        raise HTTPException(status_code=400, detail=f"Unknown resume style: {resume_style}")
+    return resume_format, resume_style
+
+def _career_tips(resume_builder_instance):
+    """
+    Generic career tips returned together with a generated resume
+    """
+    return [
+        f"Tailor your resume for each job application by highlighting the most relevant skills for the position.",
+        f"For {resume_builder_instance.job_role} roles, emphasize your measurable achievements with specific metrics and outcomes.",
+        f"As a {resume_builder_instance.resume_level} candidate, focus on showcasing your {'leadership and vision' if resume_builder_instance.resume_level == 'executive' else 'growth and progression' if resume_builder_instance.resume_level == 'mid-level' else 'potential and learning ability'}."
+    ]
+
+def _accept_job(session, kind, run, priority=PRIORITY_GENERATION):
+    """
+    Queue `run(job)` as a background job of the session and answer 202 Accepted
+    with the job id and where to follow it
+    """
+    job = job_scheduler.submit(run, kind, priority=priority, session_id=session.session_id)
+    status_url = f"/api/jobs/{job.job_id}"
+    return JSONResponse(
+        status_code=202,
+        headers={"Location": status_url},
+        content={
+            "status": "accepted",
+            "job_id": job.job_id,
+            "status_url": status_url,
+            "events_url": f"{status_url}/events"
+        }
+    )
+
+@app.post("/api/generate-resume", status_code=202)
+async def generate_resume(request: ResumeGenerationRequest, session: Session = Depends(lookup_session)):
+    """
+    Generate the resume based on user answers and format preferences.
+    Runs as a background job - the result (filename, download_url, career_tips)
+    is fetched from /api/jobs/{job_id}
+    """
+    async def run(job):
+        # The session lock is held by the job until the resume is stored
+        async with session.lock:
+            resume_builder_instance = session.builder
+            try:
+                filename, system_message, user_message = _prepare_resume_generation(resume_builder_instance, request)
+                
+                if request.generation_mode == 'sections':
+                    # Summary, roles, education and skills written concurrently, assembled locally
+                    job.report(message="Writing resume sections")
+                    resume_document = await generate_resume_document(
+                        resume_builder_instance, request.style, request.confirmed_skills,
+                        _generation_language(request.target_language),
+                        on_section=lambda task, completed, total: job.report(completed / (total + 1), f"Wrote {task.name}")
+                    )
+                    download_url = _store_resume(
+                        resume_builder_instance, session, resume_document,
+                        request.format, request.style, request.target_language, filename
+                    )
+                else:
+                    # Generate the resume with OpenAI
+                    job.report(message="Writing resume")
+                    response = await llm_gateway.achat_completion(
+                        cache_site="resume_generation",
+                        model="gpt-4-turbo-preview",
+                        messages=[
+                            {"role": "system", "content": system_message},
+                            {"role": "user", "content": user_message}
+                        ],
+                        response_format={"type": "json_object"},
+                        temperature=0.7,
+                        max_tokens=4000,
+                    )
                     
-                    <!-- Skills Section - Include only if skills are provided -->
-                    <div class="section" id="skills">
-                        <h2>Skills</h2>
-                        <ul class="skills-list">
-                            <li>[SKILL_1]</li>
-                            <li>[SKILL_2]</li>
-                            <!-- Add more skills as provided -->
-                        </ul>
-                    </div>
+                    # Get the resume text
+                    resume_text = response.choices[0].message.content
                     
-                    <!-- Languages Section - Include only if language information is provided -->
-                    <div class="section" id="languages">
-                        <h2>Languages</h2>
-                        <ul>
-                            <li>[LANGUAGE_1] - [PROFICIENCY_LEVEL_1]</li>
-                            <li>[LANGUAGE_2] - [PROFICIENCY_LEVEL_2]</li>
-                            <!-- Add more languages as provided -->
-                        </ul>
-                    </div>
+                    # Clean, enhance and store the resume
+                    job.report(0.9, "Rendering resume")
+                    download_url = _finalize_resume(resume_builder_instance, session, resume_text, request, filename)
+                
+                return {
+                    "status": "success",
+                    "message": "Resume generated successfully",
+                    "filename": filename,
+                    "download_url": download_url,  # הוספת URL להורדה
+                    "career_tips": _career_tips(resume_builder_instance)
+                }
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Error generating resume: {str(e)}")
+    
+    return _accept_job(session, "generate-resume", run)
+    
+def _sse_event(event, data):
+    """
+    Format a single Server-Sent Event with a JSON payload
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+async def _sse_keepalive(events, interval=SSE_KEEPALIVE_SECONDS):
+    """
+    Pass the events of a stream through, with a ": ping" comment (ignored by
+    SSE clients) whenever the stream has been silent for `interval` seconds
+    """
+    iterator = events.__aiter__()
+    next_event = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({next_event}, timeout=interval)
+            if not done:
+                yield ": ping\n\n"
+                continue
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                return
+            yield event
+            next_event = asyncio.ensure_future(iterator.__anext__())
+    finally:
+        # Also runs when the client went away - stops the stream, which releases what it holds (e.g. the session lock)
+        next_event.cancel()
+        await asyncio.gather(next_event, return_exceptions=True)
+        await iterator.aclose()
+
+def _sse_response(events):
+    """StreamingResponse of Server-Sent Events, kept alive while the stream is silent"""
+    return StreamingResponse(
+        _sse_keepalive(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _section_event(resume_builder_instance, name, content, resume_document, request):
+    """
+    section event of the generation stream - a completed section and the resume
+    rendered (in the requested format and style) from the sections so far
+    """
+    return _sse_event("section", {
+        "name": name,
+        "content": content,
+        "preview": _render_resume_content(
+            resume_builder_instance, resume_document, request.format, request.style, request.target_language
+        )
+    })
+
+@app.post("/api/generate-resume/stream")
+async def generate_resume_stream(request: ResumeGenerationRequest, session: Session = Depends(lookup_session)):
+    """
+    Generate the resume and stream it to the client as Server-Sent Events while the model writes it.
+    Events: start -> section (repeated) -> done (same payload as /api/generate-resume) or error.
+    A section event is sent as soon as a section of the resume is complete (each section request in
+    the 'sections' generation mode, each top-level member of the JSON reply otherwise) with its
+    content and a preview - the resume rendered from the sections written so far
+    """
+    async def event_stream():
+        # The session lock is taken inside the stream so it is held until the resume is stored
+        async with session.lock:
+            resume_builder_instance = session.builder
+            try:
+                filename, system_message, user_message = _prepare_resume_generation(resume_builder_instance, request)
+                yield _sse_event("start", {"filename": filename})
+                
+                if request.generation_mode == 'sections':
+                    # Each section is sent to the client as soon as its request completes
+                    target_language = _generation_language(request.target_language)
+                    tasks = build_section_tasks(resume_builder_instance, request.confirmed_skills, target_language)
+                    results = {}
+                    async for task, data in iter_resume_sections(
+                        tasks, section_system_message(resume_builder_instance, request.style, target_language)
+                    ):
+                        results[task.name] = data
+                        yield _section_event(
+                            resume_builder_instance, task.name, data,
+                            assemble_resume_document(resume_builder_instance, tasks, results), request
+                        )
+                    remember_sections(
+                        resume_builder_instance, tasks,
+                        section_system_message(resume_builder_instance, request.style, target_language), results
+                    )
                     
-                    <!-- Additional Information - Include only if additional information is provided -->
-                    <div class="section" id="additional">
-                        <h2>Additional Information</h2>
-                        <p>[ADDITIONAL_INFO]</p>
-                    </div>
-                </div>
-            </body>
-            </html>
-
-            ...
-            IMPORTANT INSTRUCTIONS:
-            1. Replace all placeholder text in [SQUARE_BRACKETS] with actual content from the candidate's information.
-            2. COMPLETELY REMOVE any section (including its heading) if no information is provided for that section.
-            3. COMPLETELY REMOVE any list items or paragraphs where no information is available.
-            4. Do not include placeholder text or section headings for missing information.
-            5. Ensure the HTML structure remains valid and properly nested after removing empty sections.
-            6. Replace [RESUME_STYLE] with the actual style name: "{resume_style}".
-            7. Output only the HTML code exactly as per the template provided. Do not include any additional commentary, explanations, or extra text outside of the HTML structure.
-            ...
-            
-            DO NOT include any placeholders or lorem ipsum text - use only the information provided.
-            """
-        else:
-            user_message += f"""
-            Please create the resume in plain text format, formatted to be easily readable. 
-            Use markdown-style formatting where helpful (bold, italics, etc.).
-            Organize the content with clear section headings and consistent structure.
-            """
-        
-        # Generate the resume with OpenAI
-        import openai
-        response = openai.chat.completions.create(
-            model="gpt-4-turbo-preview",
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_message}
-            ],
-            temperature=0.7,
-            max_tokens=4000,
+                    download_url = _store_resume(
+                        resume_builder_instance, session, assemble_resume_document(resume_builder_instance, tasks, results),
+                        request.format, request.style, request.target_language, filename
+                    )
+                    yield _sse_event("done", {
+                        "status": "success",
+                        "message": "Resume generated successfully",
+                        "filename": filename,
+                        "download_url": download_url,
+                        "career_tips": _career_tips(resume_builder_instance)
+                    })
+                    return
+                
+                # The JSON reply is read as it arrives - each completed section is sent right away
+                chunks = []
+                reader = JsonMemberReader()
+                completed = {}
+                async for token in llm_gateway.astream_chat_completion(
+                    cache_site="resume_generation",
+                    model="gpt-4-turbo-preview",
+                    messages=[
+                        {"role": "system", "content": system_message},
+                        {"role": "user", "content": user_message}
+                    ],
+                    response_format={"type": "json_object"},
+                    temperature=0.7,
+                    max_tokens=4000,
+                ):
+                    chunks.append(token)
+                    for name, content in reader.feed(token):
+                        completed[name] = content
+                        yield _section_event(
+                            resume_builder_instance, name, content, ResumeDocument.model_validate(completed), request
+                        )
+                
+                # Clean, enhance and store the full resume
+                download_url = _finalize_resume(resume_builder_instance, session, "".join(chunks), request, filename)
+                
+                yield _sse_event("done", {
+                    "status": "success",
+                    "message": "Resume generated successfully",
+                    "filename": filename,
+                    "download_url": download_url,
+                    "career_tips": _career_tips(resume_builder_instance)
+                })
+            except Exception as e:
+                yield _sse_event("error", {"detail": f"Error generating resume: {str(e)}"})
+    
+    return _sse_response(event_stream())
+
+@app.post("/api/edit-answers/regenerate")
+async def edit_answers_and_regenerate(request: AnswerEditRequest, session: Session = Depends(get_session)):
+    """
+    Change answers and regenerate the resume incrementally - only the sections
+    whose answers changed are written again, the others are reused
+    """
+    resume_builder_instance = session.builder
+    
+    if getattr(resume_builder_instance, 'resume_document', None) is None:
+        raise HTTPException(status_code=400, detail="No resume has been generated yet")
+    
+    known_keys = {question["key"] for question in resume_builder_instance.questions} | {"full_name"}
+    unknown_keys = [key for key in request.answers if key not in known_keys]
+    if unknown_keys:
+        raise HTTPException(status_code=400, detail=f"Unknown answer keys: {', '.join(unknown_keys)}")
+    
+    # All edits are validated (like /api/answer) before any of them is applied
+    answers = {key: _validate_answer(key, answer) for key, answer in request.answers.items()}
+    
+    # עדכון התשובות - רק חלקי קורות החיים שתלויים בהן ייכתבו מחדש
+    user_data = resume_builder_instance.user_data
+    previous = {key: user_data[key] for key in answers if key in user_data}
+    user_data.update(answers)
+    
+    try:
+        resume_style = resume_builder_instance.resume_style
+        target_language = getattr(resume_builder_instance, 'resume_language', None)
+        resume_document, regenerated, reused = await generate_resume_sections(
+            resume_builder_instance, resume_style,
+            getattr(resume_builder_instance, 'confirmed_skills', None),
+            _generation_language(target_language),
+            reuse=True
         )
-        
-        # Get the resume text
-        resume_text = response.choices[0].message.content
-
-        # ניקוי תגיות markdown של html אם קיימות
-        if resume_format == 'html':
-            # הסרת ```html מתחילת הקובץ אם קיים
-            if resume_text.strip().startswith("```html"):
-                resume_text = resume_text.replace("```html", "", 1).strip()
-            
-            # הסרת ``` מסוף הקובץ אם קיים
-            if resume_text.strip().endswith("```"):
-                resume_text = resume_text[:resume_text.rfind("```")].strip()
+        download_url = _store_resume(
+            resume_builder_instance, session, resume_document,
+            resume_builder_instance.resume_format, resume_style, target_language,
+            resume_builder_instance.resume_filename
+        )
+    except Exception as e:
+        # The answers stay as they were when the resume can't be regenerated
+        for key in answers:
+            if key in previous:
+                user_data[key] = previous[key]
+            else:
+                user_data.pop(key, None)
+        raise HTTPException(status_code=500, detail=f"Error regenerating resume: {str(e)}")
+    
+    return {
+        "status": "success",
+        "message": f"Resume updated - {len(regenerated)} section(s) rewritten, {len(reused)} reused",
+        "filename": resume_builder_instance.resume_filename,
+        "download_url": download_url,
+        "regenerated_sections": regenerated,
+        "reused_sections": reused
+    }
 
-        
-        # במקום לשמור על הדסקטופ, נשמור בקובץ זמני
-        temp_dir = tempfile.gettempdir()
-        full_path = os.path.join(temp_dir, filename)
+@app.post("/api/rerender-resume")
+async def rerender_resume(request: RerenderRequest, session: Session = Depends(get_session)):
+    """
+    Switch the style and / or format of the generated resume - rendered
+    locally from the structured resume, without another model call
+    """
+    resume_builder_instance = session.builder
+    resume_format, resume_style = _rerender_options(resume_builder_instance, request.format, request.style)
     
-        # שמירת הקובץ
-        with open(full_path, "w", encoding="utf-8") as file:
-            file.write(resume_text)
-        
-        # Enhance HTML if needed
-        if resume_format == 'html':
-            # Import the required functions
-            from main import EnhancedResumeBuilder
-            # Create a temporary instance to access the enhancement methods
-            temp_builder = EnhancedResumeBuilder()
-            # Copy required attributes
-            temp_builder.user_data = resume_builder_instance.user_data
-            temp_builder.job_role = resume_builder_instance.job_role
-            temp_builder.resume_level = resume_builder_instance.resume_level
-            # Set the resume style
-            temp_builder.resume_style = resume_style
-            # Enhance the HTML file
-            temp_builder._enhance_html_resume(full_path)
-
-            # שמירת הקובץ לפונקצית התרגום
-            with open(full_path, "r", encoding="utf-8") as file:
-                resume_content = file.read()
-                
-            # שמירת התוכן במופע
-            resume_builder_instance.resume_content = resume_content
-            resume_builder_instance.resume_mime_type = "text/html" if resume_format == 'html' else "text/plain"
+    # אותו שם קובץ, עם הסיומת של הפורמט החדש
+    base_filename = os.path.splitext(resume_builder_instance.resume_filename)[0]
+    filename = f"{base_filename}.{'html' if resume_format == 'html' else 'txt'}"
+    
+    download_url = _store_resume(
+        resume_builder_instance, session, resume_builder_instance.resume_document,
+        resume_format, resume_style, getattr(resume_builder_instance, 'resume_language', None), filename
+    )
+    
+    return {
+        "status": "success",
+        "message": f"Resume rendered as a {resume_style} {resume_format} resume",
+        "filename": filename,
+        "format": resume_format,
+        "style": resume_style,
+        "download_url": download_url
+    }
 
+@app.get("/api/resume-preview")
+async def resume_preview(style: str = None, resume_format: str = Query(None, alias="format"), session: Session = Depends(get_session)):
+    """
+    The generated resume rendered in another style / format, shown inline
+    (for previews) - the session's current resume is not changed
+    """
+    resume_builder_instance = session.builder
+    resume_format, resume_style = _rerender_options(resume_builder_instance, resume_format, style)
+    
+    content = _render_resume_content(
+        resume_builder_instance, resume_builder_instance.resume_document,
+        resume_format, resume_style, getattr(resume_builder_instance, 'resume_language', None)
+    )
+    media_type = "text/html" if resume_format == 'html' else "text/plain"
+    return Response(content=content, media_type=f"{media_type}; charset=utf-8", headers={"Cache-Control": "no-store"})
 
-            # שמירת שם הקובץ לשימוש מאוחר יותר
-            resume_builder_instance.resume_filename = filename
-            resume_builder_instance.resume_path = full_path
-            resume_builder_instance.resume_format = resume_format
-            
-            # כאן ישירות נחזיר קישור להורדה
-            download_url = f"/download-resume?filename={filename}"
-        
-        # Generate career tips
-        career_tips = [
-            f"Tailor your resume for each job application by highlighting the most relevant skills for the position.",
-            f"For {resume_builder_instance.job_role} roles, emphasize your measurable achievements with specific metrics and outcomes.",
-            f"As a {resume_builder_instance.resume_level} candidate, focus on showcasing your {'leadership and vision' if resume_builder_instance.resume_level == 'executive' else 'growth and progression' if resume_builder_instance.resume_level == 'mid-level' else 'potential and learning ability'}."
-        ]
-        
-        return {
-            "status": "success",
-            "message": "Resume generated successfully",
-            "filename": filename,
-            "download_url": download_url,  # הוספת URL להורדה
-            "career_tips": career_tips
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating resume: {str(e)}")
+async def _artifact_response(artifact, missing_detail):
+    """
+    Send a stored document to the client as a download, straight from the artifact store
+    (spilled documents are read from disk on a worker thread)
+    """
+    data = await llm_gateway.run_blocking(artifact_store.get_bytes, artifact.key)
+    if data is None:
+        raise HTTPException(status_code=404, detail=missing_detail)
+    
+    # Same Content-Disposition handling as FileResponse (non-ASCII names are RFC 5987 encoded)
+    quoted_filename = quote(artifact.filename)
+    if quoted_filename != artifact.filename:
+        content_disposition = f"attachment; filename*=utf-8''{quoted_filename}"
+    else:
+        content_disposition = f'attachment; filename="{artifact.filename}"'
     
-    # 2. הוספת נקודת קצה חדשה להורדת הקובץ
+    return Response(
+        content=data,
+        media_type=artifact.media_type,
+        headers={"Content-Disposition": content_disposition, "ETag": artifact.etag}
+    )
+
+# 2. הוספת נקודת קצה חדשה להורדת הקובץ
 
 @app.get("/api/download-resume")
-async def download_resume(filename: str = None):
+async def download_resume(filename: str = None, session: Session = Depends(get_session)):
     """
     Download the generated resume file
     """
-    global resume_builder_instance
+    resume_builder_instance = session.builder
     
-    if not resume_builder_instance or not hasattr(resume_builder_instance, 'resume_path'):
+    if not hasattr(resume_builder_instance, 'resume_artifact'):
         raise HTTPException(status_code=400, detail="No resume has been generated yet")
     
-    # קבלת נתיב הקובץ
-    resume_path = resume_builder_instance.resume_path
+    # שליחת הקובץ ללקוח כהורדה (מהזיכרון, ללא קובץ זמני)
+    return await _artifact_response(resume_builder_instance.resume_artifact, "Resume file not found")
     
-    # בדיקה שהקובץ קיים
-    if not os.path.exists(resume_path):
-        raise HTTPException(status_code=404, detail="Resume file not found")
+
+def _language_suffix(language):
+    """Key of a translation (filename suffix and translated_artifacts key), e.g. "Brazilian Portuguese" -> "brazilianportuguese" """
+    return language.lower().replace(' ', '')
+
+def _store_translation(resume_builder_instance, session, target_language, translated_content):
+    """
+    Apply the language direction, store a translated resume as an artifact
+    and return (translated filename, download URL)
+    """
+    base_filename = os.path.splitext(resume_builder_instance.resume_filename)[0]
+    extension = os.path.splitext(resume_builder_instance.resume_filename)[1]
+    language_suffix = _language_suffix(target_language)
+    translated_filename = f"{base_filename}_{language_suffix}{extension}"
     
-    # קביעת סוג התוכן לפי סוג הקובץ
-    content_type = "text/html" if resume_path.endswith('.html') else "text/plain"
+    translated_content = apply_direction(
+        translated_content,
+        target_language,
+        is_html=extension.lower() == '.html',
+        resume_style=getattr(resume_builder_instance, 'resume_style', None)
+    )
     
-    # שליחת הקובץ ללקוח כהורדה
-    return FileResponse(
-        path=resume_path,
-        filename=resume_builder_instance.resume_filename,
-        media_type=content_type,
-        content_disposition_type="attachment"  # מבטיח שהקובץ יורד במקום להיפתח בדפדפן
+    # שמירת הגרסה המתורגמת לשימוש מאוחר יותר (האחרונה, ולפי שפה)
+    artifact = artifact_store.put(
+        translated_content,
+        translated_filename,
+        resume_builder_instance.resume_mime_type  # אותו סוג כמו המקורי
     )
+    resume_builder_instance.translated_artifact = artifact
+    if not hasattr(resume_builder_instance, 'translated_artifacts'):
+        resume_builder_instance.translated_artifacts = {}
+    resume_builder_instance.translated_artifacts[language_suffix] = artifact
     
+    # ייצור כתובת להורדת הקובץ המתורגם
+    download_url = (
+        f"/download-translated-resume?filename={quote(translated_filename)}"
+        f"&language={quote(language_suffix)}&session_id={session.session_id}"
+    )
+    return translated_filename, download_url
 
 # באקאנד - עדכון הפונקציה translate_resume בקובץ resume_builder_api.py
-@app.post("/api/translate-resume")  # בלי /api בתחילה
-async def translate_resume(request: TranslationRequest):
+@app.post("/api/translate-resume", status_code=202)  # בלי /api בתחילה
+async def translate_resume(request: TranslationRequest, session: Session = Depends(lookup_session)):
     """
-    Translate the resume to another language
+    Translate the resume to another language.
+    Runs as a background job - the result (translated_filename, download_url)
+    is fetched from /api/jobs/{job_id}
     """
-    global resume_builder_instance
-    
-    if not resume_builder_instance or not hasattr(resume_builder_instance, 'resume_content'):
+    if not hasattr(session.builder, 'resume_artifact'):
         raise HTTPException(status_code=400, detail="No resume has been generated yet")
     
-    try:
-        # התוכן המקורי של קורות החיים
-        original_content = resume_builder_instance.resume_content
-        
-        # ייצור שם הקובץ המתורגם
-        base_filename = os.path.splitext(resume_builder_instance.resume_filename)[0]
-        extension = os.path.splitext(resume_builder_instance.resume_filename)[1]
-        language_suffix = request.target_language.lower().replace(' ', '')
-        translated_filename = f"{base_filename}_{language_suffix}{extension}"
-        
-        # יצירת הוראות תרגום
-        instructions = f"""
-        Translate the following resume content to {request.target_language}.
-        
-        IMPORTANT TRANSLATION RULES:
-        1. Maintain the exact same formatting and structure as the original
-        2. Preserve all HTML tags exactly as they are (if present)
-        3. DO NOT translate the following elements (keep them in their original form):
-        - Email addresses and phone numbers
-        - Website URLs and social media handles
-        - Company names and product names
-        - Programming languages, tools, and technical terms
-        - Academic degrees (like BSc, BA, MBA, PhD) - only translate their descriptions
-        - Personal names
-        
-        For technical terms in {request.target_language}, use the standard industry terminology.
-        """
-        
-        # קריאה ל-OpenAI API לתרגום
-        import openai
-        translate_response = openai.chat.completions.create(
-            model="gpt-4-turbo-preview",
-            messages=[
-                {"role": "system", "content": instructions},
-                {"role": "user", "content": original_content}
-            ],
-            temperature=0.3,
-            max_tokens=4000,
-        )
-        
-        # קבלת התוכן המתורגם
-        translated_content = translate_response.choices[0].message.content
-        
-        # טיפול בשפות RTL אם צריך
-        rtl_languages = ['hebrew', 'עברית', 'arabic', 'ערבית', 'farsi', 'פרסית', 'urdu', 'אורדו']
-        if any(lang in request.target_language.lower() for lang in rtl_languages):
-            if extension.lower() == '.html':
-                # Add RTL attributes for HTML files
-                if '<html' in translated_content:
-                    translated_content = translated_content.replace('<html', '<html dir="rtl"', 1)
-                
-                if '<body' in translated_content:
-                    translated_content = translated_content.replace('<body', '<body style="text-align: right; direction: rtl;"', 1)
-                
-                # If no HTML tags, wrap in RTL HTML
-                if '<html' not in translated_content:
-                    translated_content = f"""<!DOCTYPE html>
-<html dir="rtl" lang="he">
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{
-            direction: rtl;
-            text-align: right;
-            font-family: 'Arial', 'David', sans-serif;
-        }}
-        p, div, table, ul, ol {{
-            direction: rtl;
-            text-align: right;
-        }}
-    </style>
-</head>
-<body>
-{translated_content}
-</body>
-</html>"""
+    async def run(job):
+        async with session.lock:
+            resume_builder_instance = session.builder
+            
+            # התוכן המקורי של קורות החיים
+            original_content = await llm_gateway.run_blocking(artifact_store.get_text, resume_builder_instance.resume_artifact)
+            if original_content is None:
+                raise HTTPException(status_code=404, detail="Resume file not found")
+            
+            is_html = os.path.splitext(resume_builder_instance.resume_filename)[1].lower() == '.html'
+            try:
+                # תרגום קורות החיים - רק הטקסט נשלח למודל, במקטעים מקבילים
+                job.report(message=f"Translating to {request.target_language}")
+                translated_content = await translate_resume_content(
+                    original_content,
+                    request.target_language,
+                    is_html=is_html
+                )
+                translated_filename, download_url = _store_translation(
+                    resume_builder_instance, session, request.target_language, translated_content
+                )
                 
-                # Add RTL CSS
-                if '</head>' in translated_content:
-                    rtl_css = """
-    <style>
-        /* RTL specific styles */
-        body, p, div, table, ul, ol {
-            direction: rtl;
-            text-align: right;
-        }
-        /* Hebrew optimized fonts */
-        body {
-            font-family: 'Arial', 'David', 'Times New Roman', sans-serif;
-        }
-    </style>"""
-                    translated_content = translated_content.replace('</head>', f'{rtl_css}\n</head>', 1)
-            else:
-                # For text files, add RTL note
-                translated_content = f"<כיוון טקסט מימין לשמאל>\n\n{translated_content}"
-        
-        # שמירת הגרסה המתורגמת לשימוש מאוחר יותר
-        resume_builder_instance.translated_content = translated_content
-        resume_builder_instance.translated_filename = translated_filename
-        resume_builder_instance.translated_mime_type = resume_builder_instance.resume_mime_type  # אותו סוג כמו המקורי
-        
-        # ייצור כתובת להורדת הקובץ המתורגם
-        download_url = f"/download-translated-resume?filename={translated_filename}"
-        
-        return {
-            "status": "success",
-            "message": f"Resume translated to {request.target_language}",
-            "translated_filename": translated_filename,
-            "download_url": download_url  # הוספת כתובת URL להורדה
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error translating resume: {str(e)}")
+                return {
+                    "status": "success",
+                    "message": f"Resume translated to {request.target_language}",
+                    "translated_filename": translated_filename,
+                    "download_url": download_url  # הוספת כתובת URL להורדה
+                }
+            except Exception as e:
+                raise HTTPException(status_code=500, detail=f"Error translating resume: {str(e)}")
+    
+    return _accept_job(session, "translate-resume", run)
+
+@app.post("/api/translate-resume/batch", status_code=202)
+async def translate_resume_batch(request: BatchTranslationRequest, session: Session = Depends(lookup_session)):
+    """
+    Translate the resume to several languages at once. The resume is stripped and
+    segmented once, the languages are translated concurrently and every result
+    is stored as a separate downloadable file.
+    Runs as a low priority (bulk) background job - the per-language results
+    are fetched from /api/jobs/{job_id}
+    """
+    if not hasattr(session.builder, 'resume_artifact'):
+        raise HTTPException(status_code=400, detail="No resume has been generated yet")
+    
+    # שפות ייחודיות בסדר שבו התבקשו - "French" ו-"french" הן אותו קובץ, ולכן תרגום אחד
+    unique_languages = {}
+    for language in request.target_languages:
+        if language and language.strip():
+            unique_languages.setdefault(_language_suffix(language.strip()), language.strip())
+    target_languages = list(unique_languages.values())
+    if not target_languages:
+        raise HTTPException(status_code=400, detail="No target languages were given")
+    
+    async def run(job):
+        async with session.lock:
+            resume_builder_instance = session.builder
+            
+            original_content = await llm_gateway.run_blocking(artifact_store.get_text, resume_builder_instance.resume_artifact)
+            if original_content is None:
+                raise HTTPException(status_code=404, detail="Resume file not found")
+            
+            is_html = os.path.splitext(resume_builder_instance.resume_filename)[1].lower() == '.html'
+            job.report(message=f"Translating to {len(target_languages)} languages")
+            results = await translate_resume_languages(original_content, target_languages, is_html=is_html)
+            
+            # כישלון בשפה אחת לא מבטל את השאר
+            translations = []
+            for language in target_languages:
+                translated_content = results[language]
+                if isinstance(translated_content, Exception):
+                    translations.append({
+                        "target_language": language,
+                        "status": "error",
+                        "message": f"Error translating resume: {str(translated_content)}"
+                    })
+                    continue
+                translated_filename, download_url = _store_translation(
+                    resume_builder_instance, session, language, translated_content
+                )
+                translations.append({
+                    "target_language": language,
+                    "status": "success",
+                    "translated_filename": translated_filename,
+                    "download_url": download_url
+                })
+            
+            succeeded = sum(1 for item in translations if item["status"] == "success")
+            return {
+                "status": "success" if succeeded == len(translations) else ("partial" if succeeded else "error"),
+                "message": f"Resume translated to {succeeded} of {len(translations)} languages",
+                "translations": translations
+            }
+    
+    return _accept_job(session, "translate-resume-batch", run, priority=PRIORITY_BULK)
+
+def _job_state(job_id, session):
+    """State of a job of the caller's session (404 for unknown jobs and jobs of other sessions)"""
+    state = job_scheduler.state(job_id)
+    if state is None or state.get("session_id") != session.session_id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return {key: value for key, value in state.items() if key != "session_id"}
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, session: Session = Depends(lookup_session)):
+    """
+    Status, progress and (once finished) result or error of a background job.
+    Doesn't wait for the session lock, so it can be polled while the job runs
+    """
+    return _job_state(job_id, session)
+
+async def _job_event_stream(job_id, session, event, view):
+    """
+    Server-Sent Events of a job: `view(state)` on every change, until the job succeeds or fails
+    """
+    current = view(_job_state(job_id, session))
+    yield _sse_event(event, current)
+    while True:
+        # Read the state right before waiting - a change while the generator was
+        # suspended at a yield has already fired (and replaced) the job's event
+        job = job_scheduler.get(job_id)
+        state = _job_state(job_id, session)
+        latest = view(state)
+        if latest != current:
+            current = latest
+            yield _sse_event(event, current)
+            continue
+        if state["status"] in FINISHED_STATES or job is None:
+            break
+        await job.wait_for_change(timeout=15)
+
+@app.get("/api/jobs/{job_id}/events")
+async def job_events(job_id: str, session: Session = Depends(lookup_session)):
+    """
+    Follow a background job as Server-Sent Events: a job event with the full
+    state on every change, until the job succeeds or fails
+    """
+    _job_state(job_id, session)
+    return _sse_response(_job_event_stream(job_id, session, "job", lambda state: state))
 
 # הוספת נקודת קצה להורדת הקובץ המתורגם
 @app.get("/api/download-translated-resume")  # בלי /api בתחילה
-async def download_translated_resume(filename: str = None):
+async def download_translated_resume(filename: str = None, language: str = None, session: Session = Depends(get_session)):
     """
-    Download the translated resume
+    Download the translated resume (the latest one, or the one in the given language)
     """
-    global resume_builder_instance
+    resume_builder_instance = session.builder
     
-    if not resume_builder_instance or not hasattr(resume_builder_instance, 'translated_content'):
+    if not hasattr(resume_builder_instance, 'translated_artifact'):
         raise HTTPException(status_code=400, detail="No translated resume is available")
     
-    try:
-        # יצירת תגובה עם התוכן המתורגם
-        content = resume_builder_instance.translated_content
-        filename = resume_builder_instance.translated_filename
-        mime_type = resume_builder_instance.translated_mime_type
-        
-        # יצירת קובץ זמני
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, filename)
-        
-        # שמירת התוכן לקובץ זמני
-        with open(temp_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        # שליחת הקובץ להורדה
-        return FileResponse(
-            path=temp_path,
-            filename=filename,
-            media_type=mime_type,
-            content_disposition_type="attachment"
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error downloading translated resume: {str(e)}")
+    artifact = resume_builder_instance.translated_artifact
+    if language:
+        artifact = getattr(resume_builder_instance, 'translated_artifacts', {}).get(_language_suffix(language))
+        if artifact is None:
+            raise HTTPException(status_code=404, detail=f"No resume translated to {language}")
+    
+    # שליחת הקובץ המתורגם להורדה ישירות מהזיכרון
+    return await _artifact_response(artifact, "Translated resume file not found")
     
 
+@app.get("/api/llm-cache/stats")
+async def llm_cache_stats():
+    """
+    Hit/miss counters of the LLM response cache (and size of the persistent store)
+    """
+    stats = response_cache.stats()
+    if llm_gateway.disk_cache is not None:
+        stats["disk"] = await llm_gateway.run_blocking(llm_gateway.disk_cache.stats)
+    return stats
+
+@app.get("/api/translation-memory/stats")
+async def translation_memory_stats():
+    """
+    Hit rate of the shared translation memory (segments served without an LLM call)
+    """
+    if resume_translation.translation_memory is None:
+        return {"enabled": False}
+    return {"enabled": True, **(await llm_gateway.run_blocking(resume_translation.translation_memory.stats))}
+
 @app.get("/")
 async def root():
     """
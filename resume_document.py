@@ -0,0 +1,168 @@
+"""
+Structured resume documents.
+
+The model returns the content of a resume as a compact JSON document
+(header, summary, experience, education, skills, languages) instead of a
+filled-in HTML skeleton. The document is validated here and rendered
+locally to HTML or text by resume_renderer, so the model writes only the
+content - a fraction of the output tokens - and the markup is always
+well-formed.
+"""
+import re
+import json
+from typing import Dict, List
+from pydantic import BaseModel, model_validator
+
+_CODE_FENCE_PATTERN = re.compile(r'^\s*```[a-zA-Z]*\s*\n?|\n?\s*```\s*$')
+
+
+class _ResumePart(BaseModel):
+    """Missing values may come back as null - they fall back to the field defaults"""
+    @model_validator(mode="before")
+    @classmethod
+    def _drop_nulls(cls, data):
+        if isinstance(data, dict):
+            return {key: value for key, value in data.items() if value is not None}
+        return data
+
+
+class ResumeHeader(_ResumePart):
+    full_name: str = ""
+    job_title: str = ""
+    email: str = ""
+    phone: str = ""
+    location: str = ""
+    linkedin: str = ""
+    portfolio: str = ""
+
+
+class ExperienceItem(_ResumePart):
+    position: str = ""
+    company: str = ""
+    location: str = ""
+    dates: str = ""
+    achievements: List[str] = []
+
+
+class EducationItem(_ResumePart):
+    degree: str = ""
+    institution: str = ""
+    location: str = ""
+    dates: str = ""
+    details: List[str] = []
+
+
+class LanguageItem(_ResumePart):
+    language: str = ""
+    proficiency: str = ""
+
+
+class ResumeDocument(_ResumePart):
+    header: ResumeHeader = ResumeHeader()
+    summary: str = ""
+    experience: List[ExperienceItem] = []
+    education: List[EducationItem] = []
+    skills: List[str] = []
+    languages: List[LanguageItem] = []
+    additional: str = ""
+    # Section headings in the language of the resume (English defaults are used for missing ones)
+    headings: Dict[str, str] = {}
+
+
+# Shape of the document, shown to the model
+RESUME_JSON_SCHEMA = json.dumps({
+    "header": {"full_name": "", "job_title": "", "email": "", "phone": "", "location": "", "linkedin": "", "portfolio": ""},
+    "summary": "",
+    "experience": [{"position": "", "company": "", "location": "", "dates": "", "achievements": [""]}],
+    "education": [{"degree": "", "institution": "", "location": "", "dates": "", "details": [""]}],
+    "skills": [""],
+    "languages": [{"language": "", "proficiency": ""}],
+    "additional": "",
+})
+
+# Heading keys the model fills in for resumes written in other languages
+HEADING_KEYS = ("summary", "experience", "education", "skills", "languages", "additional")
+
+
+def resume_json_instructions(target_language=None):
+    """Output format part of the generation prompt"""
+    instructions = f"""
+    Return the resume content as a single JSON object with exactly this structure (no HTML, no markdown):
+    {RESUME_JSON_SCHEMA}
+
+    IMPORTANT INSTRUCTIONS:
+    1. Use only the information provided - never invent placeholders or lorem ipsum text.
+    2. Leave a field as "" (or a list empty) when there is no information for it; empty sections are left out of the resume.
+    3. Add one object to "experience" / "education" per job / degree, most recent first.
+    4. Write each achievement, education detail and skill as a separate list item, without bullet characters.
+    5. Dates are free text, e.g. "2019 - Present".
+    """
+    if target_language:
+        instructions += f"""
+    6. Add a "headings" object with the section headings written in {target_language}, with the keys: {", ".join(HEADING_KEYS)}.
+    """
+    return instructions
+
+
+def parse_resume_document(text):
+    """
+    Validate the model's JSON reply - raises ValueError (invalid JSON or a
+    document that doesn't match the schema)
+    """
+    data = json.loads(_CODE_FENCE_PATTERN.sub("", text))
+    return ResumeDocument.model_validate(data)
+
+
+class JsonMemberReader:
+    """
+    Incremental reader of a JSON object while the model streams it - feed()
+    the text as it arrives and get the top-level members (e.g. "summary",
+    "experience") completed by it, so finished sections can be shown before
+    the rest of the resume is written
+    """
+    def __init__(self):
+        self._text = ""
+        self._position = 0       # Next character to scan
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._member_start = None
+
+    def feed(self, chunk):
+        """Add streamed text, returns [(key, value)] of the members it completed"""
+        self._text += chunk
+        members = []
+        for index in range(self._position, len(self._text)):
+            char = self._text[index]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._member_start = index + 1
+            elif char in "}]":
+                if self._depth == 1:
+                    members.extend(self._complete(index))
+                self._depth -= 1
+            elif char == "," and self._depth == 1:
+                members.extend(self._complete(index))
+                self._member_start = index + 1
+        self._position = len(self._text)
+        return members
+
+    def _complete(self, end):
+        member = self._text[self._member_start:end].strip() if self._member_start is not None else ""
+        if not member:
+            return []
+        try:
+            return list(json.loads("{" + member + "}").items())
+        except ValueError:
+            # Not a member of a top-level object - the full reply is validated at the end
+            return []
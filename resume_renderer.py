@@ -0,0 +1,247 @@
+"""
+Local rendering of structured resume documents (see resume_document).
+
+The HTML templates are the skeleton the model used to fill in - same
+classes and ids, so the post-processor, the stylesheet bundles and the
+in-browser editing work unchanged. Sections without content are left out.
+All template strings are built once at import time; rendering is string
+formatting of escaped values.
+"""
+from html import escape
+
+# English section headings (resumes in other languages bring their own)
+DEFAULT_HEADINGS = {
+    "summary": "Professional Summary",
+    "experience": "Professional Experience",
+    "education": "Education",
+    "skills": "Skills",
+    "languages": "Languages",
+    "additional": "Additional Information",
+}
+
+_HTML_DOCUMENT = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+    </style>
+</head>
+<body class="{resume_style}">
+    <div class="resume-container">
+{sections}
+    </div>
+</body>
+</html>"""
+
+_HTML_HEADER = """        <div class="resume-header">
+            <h1>{full_name}</h1>{job_title}
+        </div>"""
+_HTML_JOB_TITLE = """
+            <p class="job-title">{}</p>"""
+
+_HTML_CONTACT = """        <div class="contact-info">
+{lines}
+        </div>"""
+_HTML_CONTACT_LINE = """            <p>{}</p>"""
+
+_HTML_SECTION = """        <div class="section" id="{key}">
+            <h2>{heading}</h2>
+{body}
+        </div>"""
+
+_HTML_SUMMARY = """            <div class="summary">
+                <p>{}</p>
+            </div>"""
+
+_HTML_EXPERIENCE_ITEM = """            <div class="experience-item">
+                <h3 class="job-position">{position}{dates}</h3>{company}{items}
+            </div>"""
+_HTML_JOB_DATE = """ <span class="job-date">{}</span>"""
+_HTML_JOB_COMPANY = """
+                <p class="job-company">{}</p>"""
+_HTML_JOB_LOCATION = """<span class="job-location">{}</span>"""
+
+_HTML_EDUCATION_ITEM = """            <div class="education-item">
+                <h3 class="education-degree">{degree}{dates}</h3>{institution}{items}
+            </div>"""
+_HTML_EDUCATION_DATE = """ <span class="education-date">{}</span>"""
+_HTML_EDUCATION_INSTITUTION = """
+                <p class="education-institution">{}</p>"""
+_HTML_EDUCATION_LOCATION = """<span class="education-location">{}</span>"""
+
+_HTML_ITEM_LIST = """
+                <ul>
+{}
+                </ul>"""
+_HTML_LIST = """            <ul{css_class}>
+{items}
+            </ul>"""
+_HTML_LIST_ITEM = """                    <li>{}</li>"""
+_HTML_PARAGRAPH = """            <p>{}</p>"""
+
+
+def _headings(document):
+    return {**DEFAULT_HEADINGS, **{key: value for key, value in document.headings.items() if value}}
+
+
+def _clean(items):
+    return [item.strip() for item in items if item and item.strip()]
+
+
+def _html_list_items(items):
+    return "\n".join(_HTML_LIST_ITEM.format(escape(item)) for item in items)
+
+
+def _html_place(name, location, location_template):
+    """ "Company, <span>Location</span>" - either part may be missing"""
+    parts = [escape(name)] if name else []
+    if location:
+        parts.append(location_template.format(escape(location)))
+    return ", ".join(parts)
+
+
+def render_html(document, resume_style="traditional"):
+    """HTML resume (before post-processing) from a ResumeDocument"""
+    header = document.header
+    headings = _headings(document)
+    sections = [_HTML_HEADER.format(
+        full_name=escape(header.full_name),
+        job_title=_HTML_JOB_TITLE.format(escape(header.job_title)) if header.job_title else ""
+    )]
+
+    contact_lines = [" | ".join(escape(value) for value in values if value) for values in (
+        (header.email, header.phone, header.location),
+        (header.linkedin, header.portfolio),
+    )]
+    contact_lines = [line for line in contact_lines if line]
+    if contact_lines:
+        sections.append(_HTML_CONTACT.format(lines="\n".join(_HTML_CONTACT_LINE.format(line) for line in contact_lines)))
+
+    def add_section(key, body):
+        sections.append(_HTML_SECTION.format(key=key, heading=escape(headings[key]), body=body))
+
+    if document.summary.strip():
+        add_section("summary", _HTML_SUMMARY.format(escape(document.summary.strip())))
+
+    jobs = [item for item in document.experience if item.position or item.company]
+    if jobs:
+        add_section("experience", "\n".join(
+            _HTML_EXPERIENCE_ITEM.format(
+                position=escape(item.position),
+                dates=_HTML_JOB_DATE.format(escape(item.dates)) if item.dates else "",
+                company=_HTML_JOB_COMPANY.format(_html_place(item.company, item.location, _HTML_JOB_LOCATION))
+                if item.company or item.location else "",
+                items=_HTML_ITEM_LIST.format(_html_list_items(_clean(item.achievements)))
+                if _clean(item.achievements) else "",
+            )
+            for item in jobs
+        ))
+
+    degrees = [item for item in document.education if item.degree or item.institution]
+    if degrees:
+        add_section("education", "\n".join(
+            _HTML_EDUCATION_ITEM.format(
+                degree=escape(item.degree),
+                dates=_HTML_EDUCATION_DATE.format(escape(item.dates)) if item.dates else "",
+                institution=_HTML_EDUCATION_INSTITUTION.format(_html_place(item.institution, item.location, _HTML_EDUCATION_LOCATION))
+                if item.institution or item.location else "",
+                items=_HTML_ITEM_LIST.format(_html_list_items(_clean(item.details)))
+                if _clean(item.details) else "",
+            )
+            for item in degrees
+        ))
+
+    skills = _clean(document.skills)
+    if skills:
+        add_section("skills", _HTML_LIST.format(css_class=' class="skills-list"', items=_html_list_items(skills)))
+
+    languages = [item for item in document.languages if item.language.strip()]
+    if languages:
+        add_section("languages", _HTML_LIST.format(css_class="", items=_html_list_items(
+            f"{item.language.strip()} - {item.proficiency.strip()}" if item.proficiency.strip() else item.language.strip()
+            for item in languages
+        )))
+
+    if document.additional.strip():
+        add_section("additional", _HTML_PARAGRAPH.format(escape(document.additional.strip())))
+
+    return _HTML_DOCUMENT.format(
+        title=escape(f"{header.full_name} - Resume" if header.full_name else "Resume"),
+        resume_style=escape(resume_style or "traditional"),
+        sections="\n\n".join(sections),
+    )
+
+
+def _text_place(name, location):
+    return ", ".join(part for part in (name, location) if part)
+
+
+def render_text(document):
+    """Plain text resume (markdown-style emphasis) from a ResumeDocument"""
+    header = document.header
+    headings = _headings(document)
+    lines = []
+    if header.full_name:
+        lines.append(header.full_name.upper())
+    if header.job_title:
+        lines.append(header.job_title)
+    for values in ((header.email, header.phone, header.location), (header.linkedin, header.portfolio)):
+        line = " | ".join(value for value in values if value)
+        if line:
+            lines.append(line)
+
+    def add_section(key, body_lines):
+        lines.extend(["", headings[key].upper(), "-" * len(headings[key])])
+        lines.extend(body_lines)
+
+    if document.summary.strip():
+        add_section("summary", [document.summary.strip()])
+
+    jobs = [item for item in document.experience if item.position or item.company]
+    if jobs:
+        body = []
+        for item in jobs:
+            if body:
+                body.append("")
+            title = f"**{item.position}**" if item.position else ""
+            place = _text_place(item.company, item.location)
+            body.append(" - ".join(part for part in (title, place) if part) + (f" ({item.dates})" if item.dates else ""))
+            body.extend(f"- {achievement}" for achievement in _clean(item.achievements))
+        add_section("experience", body)
+
+    degrees = [item for item in document.education if item.degree or item.institution]
+    if degrees:
+        body = []
+        for item in degrees:
+            if body:
+                body.append("")
+            title = f"**{item.degree}**" if item.degree else ""
+            place = _text_place(item.institution, item.location)
+            body.append(" - ".join(part for part in (title, place) if part) + (f" ({item.dates})" if item.dates else ""))
+            body.extend(f"- {detail}" for detail in _clean(item.details))
+        add_section("education", body)
+
+    skills = _clean(document.skills)
+    if skills:
+        add_section("skills", [", ".join(skills)])
+
+    languages = [item for item in document.languages if item.language.strip()]
+    if languages:
+        add_section("languages", [
+            f"- {item.language.strip()}" + (f" - {item.proficiency.strip()}" if item.proficiency.strip() else "")
+            for item in languages
+        ])
+
+    if document.additional.strip():
+        add_section("additional", [document.additional.strip()])
+
+    return "\n".join(lines) + "\n"
+
+
+def render_resume(document, resume_format="html", resume_style="traditional"):
+    """Render a ResumeDocument in the requested format ('html' or 'text')"""
+    if resume_format == "html":
+        return render_html(document, resume_style)
+    return render_text(document)
@@ -0,0 +1,289 @@
+"""
+Translation of generated resumes.
+
+Only the text-bearing part of a resume is sent to the translation model.
+The document head, <style> / <script> blocks, comments and tag attributes
+(classes, contenteditable, links...) are taken out and replaced with short
+placeholders, and the translated text is put back into the original
+document locally.
+
+The remaining text is cut into segments at block level tags (each summary
+paragraph, job bullet, heading...). Segments already in the shared
+translation memory are reused; the rest are translated in batches that run
+concurrently, so long resumes are not truncated by max_tokens and the
+wall-clock time follows the largest batch instead of the whole document.
+"""
+import os
+import re
+import json
+import asyncio
+from collections import namedtuple
+import llm_gateway
+from translation_memory import open_translation_memory, normalize_segment
+from sqlite_store import HIT_FLUSH_BATCH
+
+# Maximum characters / segments sent to the model in one translation request
+TRANSLATION_BATCH_CHARS = int(os.getenv('CARA_TRANSLATION_BATCH_CHARS', '3000'))
+TRANSLATION_BATCH_SEGMENTS = int(os.getenv('CARA_TRANSLATION_BATCH_SEGMENTS', '40'))
+
+TRANSLATION_MODEL = "gpt-4-turbo-preview"
+
+# Segments translated before (by any user) are served from here (None when disabled)
+translation_memory = open_translation_memory()
+
+# <style> / <script> blocks and comments - replaced with <x-N> placeholders
+_PROTECTED_BLOCK_PATTERN = re.compile(r'<(style|script)\b[^>]*>.*?</\1\s*>|<!--.*?-->', re.S | re.I)
+
+# Opening tags with attributes - replaced with <tag i=N>
+_ATTRIBUTE_TAG_PATTERN = re.compile(r'<([a-zA-Z][\w-]*)(\s[^<>]*?)(/?)>')
+
+_BODY_OPEN_PATTERN = re.compile(r'<body\b[^>]*>', re.I)
+_BLOCK_PLACEHOLDER_PATTERN = re.compile(r'<x-(\d+)\s*/?>(?:</x-\1>)?')
+_TAG_PLACEHOLDER_PATTERN = re.compile(r'<([a-zA-Z][\w-]*) i=["\']?(\d+)["\']?\s*(/?)>')
+_CODE_FENCE_PATTERN = re.compile(r'^\s*```[a-zA-Z]*\s*\n?|\n?\s*```\s*$')
+
+# Block level tags (and <x-N> placeholders) - segments never cross them
+_BLOCK_TAG_PATTERN = re.compile(
+    r'(</?(?:div|p|li|ul|ol|h[1-6]|section|header|footer|main|article|aside|nav|'
+    r'table|thead|tbody|tr|td|th|dl|dt|dd|blockquote|br|hr)\b[^>]*>|<x-\d+>)',
+    re.I
+)
+_TAG_PATTERN = re.compile(r'<[^<>]+>')
+# A segment is worth translating only if it has letters outside its tags
+_LETTER_PATTERN = re.compile(r'[^\W\d_]')
+
+# Instructions added to the translation prompt for prepared documents
+PLACEHOLDER_INSTRUCTIONS = (
+    "The HTML uses placeholders: keep every <x-N> tag and every i=N attribute exactly "
+    "as written and in the same position - they stand for content that is restored later."
+)
+
+
+def translation_instructions(target_language):
+    """System prompt for translating resume segments"""
+    return f"""
+        Translate the following resume content to {target_language}.
+        
+        IMPORTANT TRANSLATION RULES:
+        1. Maintain the exact same formatting and structure as the original
+        2. Preserve all HTML tags exactly as they are (if present)
+        3. DO NOT translate the following elements (keep them in their original form):
+        - Email addresses and phone numbers
+        - Website URLs and social media handles
+        - Company names and product names
+        - Programming languages, tools, and technical terms
+        - Academic degrees (like BSc, BA, MBA, PhD) - only translate their descriptions
+        - Personal names
+        
+        For technical terms in {target_language}, use the standard industry terminology.
+        {PLACEHOLDER_INSTRUCTIONS}
+        
+        You receive a JSON object {{"segments": [...]}} with consecutive pieces of one resume.
+        Reply with a JSON object {{"segments": [...]}} containing the translation of every
+        segment, with exactly the same number of segments in the same order.
+        """
+
+PreparedDocument = namedtuple("PreparedDocument", [
+    "text",    # Text-bearing HTML sent to the model
+    "head",    # Everything up to and including the <body> tag (kept locally)
+    "tail",    # </body> and everything after it (kept locally)
+    "blocks",  # Original <style> / <script> / comment blocks by placeholder number
+    "tags",    # Original opening tags by placeholder number
+])
+
+
+def prepare_for_translation(html_content):
+    """Split an HTML resume into the text to translate and the parts kept locally"""
+    body_open = _BODY_OPEN_PATTERN.search(html_content)
+    body_close = html_content.lower().rfind('</body>')
+    if body_open and body_close >= body_open.end():
+        head = html_content[:body_open.end()]
+        body = html_content[body_open.end():body_close]
+        tail = html_content[body_close:]
+    else:
+        head, body, tail = "", html_content, ""
+
+    blocks = []
+
+    def keep_block(match):
+        blocks.append(match.group())
+        return f"<x-{len(blocks) - 1}>"
+
+    tags = []
+
+    def keep_tag(match):
+        tags.append(match.group())
+        return f"<{match.group(1)} i={len(tags) - 1}{match.group(3)}>"
+
+    body = _PROTECTED_BLOCK_PATTERN.sub(keep_block, body)
+    body = _ATTRIBUTE_TAG_PATTERN.sub(keep_tag, body)
+    return PreparedDocument(body, head, tail, blocks, tags)
+
+
+def restore_translation(prepared, translated_text):
+    """Put the translated text back into the original document"""
+    text = _CODE_FENCE_PATTERN.sub("", translated_text)
+    restored_blocks = set()
+
+    def restore_block(match):
+        index = int(match.group(1))
+        if index >= len(prepared.blocks):
+            return ""
+        restored_blocks.add(index)
+        return prepared.blocks[index]
+
+    def restore_tag(match):
+        index = int(match.group(2))
+        if index < len(prepared.tags) and prepared.tags[index].startswith(f"<{match.group(1)}"):
+            return prepared.tags[index]
+        # Unknown placeholder - keep the bare tag
+        return f"<{match.group(1)}{match.group(3)}>"
+
+    text = _TAG_PLACEHOLDER_PATTERN.sub(restore_tag, text)
+    text = _BLOCK_PLACEHOLDER_PATTERN.sub(restore_block, text)
+
+    # Styles and scripts the model dropped are added back at the end of the body
+    missing = [block for index, block in enumerate(prepared.blocks) if index not in restored_blocks]
+    if missing:
+        text = text + "\n" + "\n".join(missing) + "\n"
+
+    return prepared.head + text + prepared.tail
+
+
+def split_segments(text, is_html=True):
+    """
+    Cut text into pieces at block boundaries. Returns the list of pieces and
+    the indexes of the pieces that need translation
+    """
+    if is_html:
+        pieces = _BLOCK_TAG_PATTERN.split(text)
+    else:
+        # Plain text resumes - one segment per paragraph
+        pieces = re.split(r'(\n\s*\n)', text)
+    translatable = [
+        index for index, piece in enumerate(pieces)
+        if (not is_html or index % 2 == 0) and _LETTER_PATTERN.search(_TAG_PATTERN.sub("", piece) if is_html else piece)
+    ]
+    return pieces, translatable
+
+
+def _batches(segments):
+    """Group segments into batches of at most TRANSLATION_BATCH_CHARS characters"""
+    batch, size = [], 0
+    for segment in segments:
+        if batch and (size + len(segment) > TRANSLATION_BATCH_CHARS or len(batch) >= TRANSLATION_BATCH_SEGMENTS):
+            yield batch
+            batch, size = [], 0
+        batch.append(segment)
+        size += len(segment)
+    if batch:
+        yield batch
+
+
+async def _translate_batch(batch, target_language):
+    """
+    Translate one batch of segments - falls back to one request per segment if
+    the reply doesn't line up. Segments that could not be translated are None
+    """
+    response = await llm_gateway.achat_completion(
+        cache_site="translation",
+        model=TRANSLATION_MODEL,
+        messages=[
+            {"role": "system", "content": translation_instructions(target_language)},
+            {"role": "user", "content": json.dumps({"segments": batch}, ensure_ascii=False)}
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.3,
+        max_tokens=4000,
+    )
+    try:
+        translated = json.loads(response.choices[0].message.content)["segments"]
+        if isinstance(translated, list) and len(translated) == len(batch) and all(isinstance(item, str) for item in translated):
+            return translated
+    except (ValueError, KeyError, TypeError):
+        pass
+
+    if len(batch) == 1:
+        # Nothing to split any more
+        return [None]
+    results = await asyncio.gather(*[_translate_batch([segment], target_language) for segment in batch])
+    return [result[0] for result in results]
+
+
+async def translate_segments(segments, target_language):
+    """
+    Translate a list of segments and keep their order. Segments found in the
+    translation memory are not sent to the model, the others are translated
+    with concurrent batched requests and added to the memory
+    """
+    # Whitespace around a segment is kept locally
+    stripped = [segment.strip() for segment in segments]
+    translations = {}
+    if translation_memory is not None:
+        # The memory is read on a worker thread and written in the background - never on the event loop
+        translations = await llm_gateway.run_blocking(translation_memory.lookup, stripped, target_language)
+        if translation_memory.pending_hits >= HIT_FLUSH_BATCH:
+            llm_gateway.run_in_background(translation_memory.flush_hits)
+
+    # Each distinct missing segment is translated once
+    pending = list(dict.fromkeys(segment for segment in stripped if normalize_segment(segment) not in translations))
+    if pending:
+        results = await asyncio.gather(*[_translate_batch(batch, target_language) for batch in _batches(pending)])
+        translated = {
+            segment: text
+            for segment, text in zip(pending, (text for result in results for text in result))
+            if text is not None
+        }
+        if translation_memory is not None:
+            llm_gateway.run_in_background(translation_memory.store, translated, target_language)
+        translations.update((normalize_segment(segment), text) for segment, text in translated.items())
+
+    return [
+        original[:len(original) - len(original.lstrip())]
+        + translations.get(normalize_segment(text), text)
+        + original[len(original.rstrip()):]
+        for original, text in zip(segments, stripped)
+    ]
+
+
+SegmentedResume = namedtuple("SegmentedResume", [
+    "prepared",      # PreparedDocument for HTML resumes, None for plain text
+    "pieces",        # The text cut at block boundaries
+    "translatable",  # Indexes of the pieces to translate
+])
+
+
+def segment_resume(content, is_html=True):
+    """Strip and segment a resume once - the result can be translated to any number of languages"""
+    prepared = prepare_for_translation(content) if is_html else None
+    pieces, translatable = split_segments(prepared.text if is_html else content, is_html)
+    return SegmentedResume(prepared, pieces, translatable)
+
+
+async def translate_segmented(segmented, target_language):
+    """Translate a segmented resume and return the translated document"""
+    pieces = list(segmented.pieces)
+    translated = await translate_segments([pieces[index] for index in segmented.translatable], target_language)
+    for index, text in zip(segmented.translatable, translated):
+        pieces[index] = text
+
+    text = "".join(pieces)
+    return restore_translation(segmented.prepared, text) if segmented.prepared is not None else text
+
+
+async def translate_resume_content(content, target_language, is_html=True):
+    """Translate a whole resume (HTML or plain text) and return the translated document"""
+    return await translate_segmented(segment_resume(content, is_html), target_language)
+
+
+async def translate_resume_languages(content, target_languages, is_html=True):
+    """
+    Translate a resume to several languages concurrently, sharing the
+    stripping and segmentation. Returns {language: translated document or exception}
+    """
+    segmented = segment_resume(content, is_html)
+    results = await asyncio.gather(
+        *[translate_segmented(segmented, language) for language in target_languages],
+        return_exceptions=True
+    )
+    return dict(zip(target_languages, results))
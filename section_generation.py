@@ -0,0 +1,263 @@
+"""
+Section-parallel resume generation.
+
+Instead of one completion that writes the whole resume, the summary, each
+role of the job history, the education and the skills are written by
+separate, concurrent requests that only see the answers of their own
+section. The latency then follows the longest section instead of the total
+output length. The header is filled in locally from the contact answers,
+and the parts are assembled into one ResumeDocument (see resume_document)
+that is rendered and post-processed like a single-call resume.
+
+Each section's output is kept with a hash of its inputs (the answers it
+sees and its prompt), so after an answer is edited only the sections that
+depend on it are written again.
+"""
+import re
+import json
+import asyncio
+import hashlib
+from collections import namedtuple
+import llm_gateway
+from resume_document import ResumeDocument, HEADING_KEYS
+
+SECTION_MODEL = "gpt-4-turbo-preview"
+
+# Answers that go straight into the resume header
+_HEADER_KEYS = ("email", "phone", "location", "linkedin")
+
+# One independent request - its instructions, the answers it sees and the JSON keys it returns
+SectionTask = namedtuple("SectionTask", ["name", "instructions", "answers", "keys", "max_tokens"])
+
+
+def section_answers(resume_builder):
+    """{question section: [(key, question, answer), ...]} of the answered questions"""
+    sections = {}
+    for question in resume_builder.questions:
+        answer = resume_builder.user_data.get(question["key"])
+        if answer and question["key"] != "full_name":
+            sections.setdefault(question["section"], []).append((question["key"], question["question"], answer))
+    return sections
+
+
+def split_roles(job_history):
+    """Cut a job history answer into one block per role (blank line separated paragraphs)"""
+    roles = [block.strip() for block in re.split(r"\n\s*\n", job_history) if block.strip()]
+    return roles or [job_history.strip()]
+
+
+def _format_answers(answers):
+    return "\n\n".join(f"{question}\n{answer}" for _, question, answer in answers)
+
+
+def build_section_tasks(resume_builder, confirmed_skills=None, target_language=None):
+    """The independent generation requests of one resume"""
+    sections = section_answers(resume_builder)
+    confirmed_skills = confirmed_skills or {}
+    tasks = []
+
+    summary_instructions = (
+        'Return {"job_title": "", "summary": ""} - the job title the candidate targets '
+        'and a 3-4 sentence professional summary.'
+    )
+    if target_language:
+        summary_instructions += (
+            f' Also add "headings": the section headings written in {target_language}, '
+            f'with the keys {", ".join(HEADING_KEYS)}.'
+        )
+    tasks.append(SectionTask(
+        "summary", summary_instructions,
+        sections.get("Summary", []) + sections.get("Experience", [])[:1],
+        ("job_title", "summary", "headings"), 400
+    ))
+
+    experience = sections.get("Experience", [])
+    job_history = next((answer for key, _, answer in experience if key == "job_history"), "")
+    other_experience = [item for item in experience if item[0] != "job_history"]
+    for index, role in enumerate(split_roles(job_history) if job_history else []):
+        tasks.append(SectionTask(
+            f"experience-{index}",
+            'Return {"experience": [{"position": "", "company": "", "location": "", "dates": "", "achievements": [""]}]} '
+            "for the role described below (one item, or more only if the text clearly describes several roles). "
+            "Use the other answers only for achievements that belong to this role.",
+            [("job_history", "Role", role)] + other_experience,
+            ("experience",), 700
+        ))
+
+    if sections.get("Education"):
+        tasks.append(SectionTask(
+            "education",
+            'Return {"education": [{"degree": "", "institution": "", "location": "", "dates": "", "details": [""]}]} '
+            "with one item per degree, certification or training, most recent first.",
+            sections["Education"], ("education",), 500
+        ))
+
+    skills = [item for item in sections.get("Skills", []) if item[0] != "languages"]
+    languages = [item for item in sections.get("Skills", []) if item[0] == "languages"]
+    implied = "\n".join(
+        f"{name.replace('_', ' ').title()}: {', '.join(values)}"
+        for name, values in confirmed_skills.items() if values
+    )
+    if skills or languages or implied:
+        answers = skills + languages
+        if implied:
+            answers.append(("implied_skills", "Implied skills confirmed by the candidate", implied))
+        tasks.append(SectionTask(
+            "skills",
+            'Return {"skills": [""], "languages": [{"language": "", "proficiency": ""}]} - '
+            "the most relevant skills (at most 15) and the spoken languages with their proficiency.",
+            answers, ("skills", "languages"), 400
+        ))
+
+    if sections.get("Additional"):
+        tasks.append(SectionTask(
+            "additional",
+            'Return {"additional": ""} - a short paragraph with the projects, activities and other '
+            "information worth adding to the resume.",
+            sections["Additional"], ("additional",), 400
+        ))
+
+    return tasks
+
+
+def section_system_message(resume_builder, resume_style, target_language=None):
+    """Shared system prompt of the section requests"""
+    message = f"""
+    You are an expert resume writer writing one section of a {resume_style} resume
+    for a {resume_builder.resume_level} level {resume_builder.job_role} position.
+    Use action verbs and quantifiable achievements, stay true to the candidate's answers
+    and never invent placeholders. Reply with a JSON object only, with the keys you are asked for.
+    """
+    if target_language:
+        message += f"""
+    Write all values in {target_language} (keep the JSON keys in English). Keep email addresses, URLs,
+    company and product names, technical terms, degrees and personal names in their original form.
+    """
+    return message
+
+
+async def generate_section(task, system_message):
+    """Run one section request, returns (task, {key: value}) with only the task's keys"""
+    response = await llm_gateway.achat_completion(
+        cache_site="resume_section",
+        model=SECTION_MODEL,
+        messages=[
+            {"role": "system", "content": system_message},
+            {"role": "user", "content": f"{task.instructions}\n\n{_format_answers(task.answers)}"}
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.7,
+        max_tokens=task.max_tokens,
+    )
+    data = json.loads(response.choices[0].message.content)
+    if not isinstance(data, dict):
+        raise ValueError(f"Section {task.name} is not a JSON object")
+    return task, {key: data[key] for key in task.keys if data.get(key) is not None}
+
+
+async def iter_resume_sections(tasks, system_message, reused=None):
+    """
+    Run the section requests concurrently and yield (task, data) as each one
+    completes. Sections in `reused` ({task name: data}) are yielded first,
+    without a request
+    """
+    reused = reused or {}
+    for task in tasks:
+        if task.name in reused:
+            yield task, reused[task.name]
+
+    futures = [
+        asyncio.ensure_future(generate_section(task, system_message))
+        for task in tasks if task.name not in reused
+    ]
+    try:
+        for future in asyncio.as_completed(futures):
+            yield await future
+    finally:
+        # A failed section (or a client that went away) stops the others
+        for future in futures:
+            future.cancel()
+
+
+def section_input_hash(task, system_message):
+    """Hash of everything a section request depends on - its answers, instructions and prompt"""
+    payload = json.dumps(
+        [SECTION_MODEL, system_message, task.instructions, task.answers, task.keys, task.max_tokens],
+        ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def reusable_sections(resume_builder, tasks, system_message):
+    """{task name: data} of the sections whose inputs did not change since they were generated"""
+    previous = getattr(resume_builder, "section_outputs", {})
+    reused = {}
+    for task in tasks:
+        entry = previous.get(task.name)
+        if entry is not None and entry[0] == section_input_hash(task, system_message):
+            reused[task.name] = entry[1]
+    return reused
+
+
+def remember_sections(resume_builder, tasks, system_message, results):
+    """Keep each section's output with the hash of its inputs, for incremental regeneration"""
+    resume_builder.section_outputs = {
+        task.name: (section_input_hash(task, system_message), results[task.name])
+        for task in tasks if task.name in results
+    }
+
+
+def resume_header(resume_builder):
+    """Header of the resume, straight from the contact answers"""
+    header = {"full_name": resume_builder.user_data.get("full_name", ""), "job_title": resume_builder.job_role}
+    for key in _HEADER_KEYS:
+        value = resume_builder.user_data.get(key)
+        if value and value.strip().lower() not in ("no", "none", "n/a", "-"):
+            header[key] = value.strip()
+    return header
+
+
+def assemble_resume_document(resume_builder, tasks, results):
+    """Merge the section results ({task name: data}) into one validated ResumeDocument"""
+    document = {"header": resume_header(resume_builder), "experience": []}
+    for task in tasks:
+        data = dict(results.get(task.name, {}))
+        job_title = data.pop("job_title", None)
+        if job_title:
+            document["header"]["job_title"] = job_title
+        experience = data.pop("experience", None)
+        if isinstance(experience, list):
+            document["experience"].extend(experience)
+        document.update(data)
+    return ResumeDocument.model_validate(document)
+
+
+async def generate_resume_sections(resume_builder, resume_style, confirmed_skills=None, target_language=None, reuse=False,
+                                   on_section=None):
+    """
+    Write a whole resume with concurrent section requests. With `reuse`, only
+    the sections whose inputs changed since the last generation (e.g. after
+    an answer was edited) are written again. `on_section(task, completed,
+    total)` is called as each section completes. Returns (ResumeDocument,
+    names of the regenerated sections, names of the reused sections)
+    """
+    tasks = build_section_tasks(resume_builder, confirmed_skills, target_language)
+    system_message = section_system_message(resume_builder, resume_style, target_language)
+    reused = reusable_sections(resume_builder, tasks, system_message) if reuse else {}
+    results = {}
+    async for task, data in iter_resume_sections(tasks, system_message, reused):
+        results[task.name] = data
+        if on_section is not None:
+            on_section(task, len(results), len(tasks))
+    remember_sections(resume_builder, tasks, system_message, results)
+
+    regenerated = [task.name for task in tasks if task.name not in reused]
+    return assemble_resume_document(resume_builder, tasks, results), regenerated, list(reused)
+
+
+async def generate_resume_document(resume_builder, resume_style, confirmed_skills=None, target_language=None, on_section=None):
+    """Write a whole resume with concurrent section requests"""
+    document, _, _ = await generate_resume_sections(
+        resume_builder, resume_style, confirmed_skills, target_language, on_section=on_section
+    )
+    return document
@@ -0,0 +1,108 @@
+import os
+import uuid
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from followup_engine import FollowupEngine
+
+# Maximum number of live interview sessions kept in memory per process
+MAX_SESSIONS = int(os.getenv('CARA_MAX_SESSIONS', '500'))
+
+# Sessions not used for this many seconds expire
+SESSION_IDLE_TTL = int(os.getenv('CARA_SESSION_IDLE_TTL', str(2 * 3600)))
+
+# Where the client may send its session id
+SESSION_HEADER = "X-Session-ID"
+SESSION_COOKIE = "cara_session_id"
+SESSION_QUERY_PARAM = "session_id"
+
+
+class Session:
+    """A single user's interview session and its lock"""
+    def __init__(self, session_id, builder):
+        self.session_id = session_id
+        self.builder = builder
+        self.lock = asyncio.Lock()
+        # Question index -> id of the background job computing its feedback (deferred answers)
+        self.answer_feedback_jobs = {}
+        # Pending follow-up prompts of each answered question
+        self.followups = FollowupEngine()
+        self.created_at = time.time()
+        self.last_access = self.created_at
+
+
+class SessionStore:
+    """
+    Registry of live resume builder sessions keyed by session id.
+
+    Lookups are O(1) (dict backed). Sessions unused for `idle_ttl` seconds
+    expire. The store keeps at most `max_sessions` sessions - a new session
+    first drops the expired ones, and only when it would still exceed the
+    cap is the least recently used live session evicted.
+    """
+    def __init__(self, max_sessions=MAX_SESSIONS, idle_ttl=SESSION_IDLE_TTL):
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.max_sessions = max_sessions
+        self.idle_ttl = idle_ttl
+        self._sessions = OrderedDict()
+        self._registry_lock = threading.Lock()
+
+    def _expired(self, session, now):
+        return now - session.last_access > self.idle_ttl
+
+    def _purge_expired(self, now):
+        """Drop the expired sessions (lock held) - they are the least recently used, at the front"""
+        while self._sessions:
+            session = next(iter(self._sessions.values()))
+            if not self._expired(session, now):
+                break
+            self._sessions.popitem(last=False)
+
+    def create(self, builder) -> Session:
+        """Register a new builder instance and return its session"""
+        session = Session(uuid.uuid4().hex, builder)
+        with self._registry_lock:
+            self._purge_expired(session.created_at)
+            self._sessions[session.session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                # Evict the least recently used session
+                self._sessions.popitem(last=False)
+        return session
+
+    def get(self, session_id) -> Optional[Session]:
+        """Return the session for the given id (or None, also once it expired) and mark it as recently used"""
+        if not session_id:
+            return None
+        now = time.time()
+        with self._registry_lock:
+            session = self._sessions.get(session_id)
+            if session is not None:
+                if self._expired(session, now):
+                    del self._sessions[session_id]
+                    return None
+                self._sessions.move_to_end(session_id)
+                session.last_access = now
+            return session
+
+    def remove(self, session_id):
+        """Drop a session from the registry"""
+        with self._registry_lock:
+            self._sessions.pop(session_id, None)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self._sessions
+
+
+def session_id_from_request(request):
+    """Extract the session id from the header, cookie or query string (in that order)"""
+    return (
+        request.headers.get(SESSION_HEADER)
+        or request.cookies.get(SESSION_COOKIE)
+        or request.query_params.get(SESSION_QUERY_PARAM)
+    )
@@ -0,0 +1,31 @@
+"""
+Connection helper of the SQLite files shared by all uvicorn workers and
+the CLI (the persistent LLM response cache and the translation memory).
+"""
+import os
+import sqlite3
+
+# How long a statement waits for another process holding the write lock (seconds)
+SQLITE_BUSY_TIMEOUT = 10
+
+# Reads count their hits in memory - written in one batch once this many entries were read
+HIT_FLUSH_BATCH = 100
+
+
+def thread_connection(local, path, schema):
+    """
+    The calling thread's connection to a SQLite file in WAL mode, opened (and
+    the schema created) on first use and kept in the threading.local `local`.
+    One connection per thread - sqlite3 connections can't be shared between threads
+    """
+    conn = getattr(local, 'conn', None)
+    if conn is None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(schema)
+        local.conn = conn
+    return conn
@@ -0,0 +1,175 @@
+"""
+Text direction and locale of the languages resumes are written in.
+
+Languages are resolved once through a table of names, native names and
+ISO 639-1 codes (instead of substring matching a list of RTL names), and a
+document is switched to its language in a single pass over the <html>,
+<body> and </head> tags. Right-to-left documents get the precompiled RTL
+stylesheet of their resume style - added once, however many times a
+document goes through here - and left-to-right documents lose it again
+(e.g. a Hebrew resume translated to French).
+"""
+import re
+from functools import lru_cache
+from collections import namedtuple
+from resume_assets import get_bundle
+
+Locale = namedtuple("Locale", ["code", "direction"])
+
+# Languages missing from the table (Dutch, Korean...) are written left to right, without a lang code
+DEFAULT_LOCALE = Locale(None, "ltr")
+
+# (ISO 639-1 code, direction, names the language is requested by)
+_LANGUAGES = (
+    ("he", "rtl", ("hebrew", "עברית", "ivrit", "iw")),
+    ("ar", "rtl", ("arabic", "ערבית", "العربية")),
+    ("fa", "rtl", ("farsi", "persian", "פרסית", "فارسی")),
+    ("ur", "rtl", ("urdu", "אורדו", "اردو")),
+    ("yi", "rtl", ("yiddish", "יידיש", "ייִדיש")),
+    ("ps", "rtl", ("pashto", "پښتو")),
+    ("en", "ltr", ("english", "אנגלית")),
+    ("es", "ltr", ("spanish", "español", "espanol", "ספרדית")),
+    ("fr", "ltr", ("french", "français", "francais", "צרפתית")),
+    ("de", "ltr", ("german", "deutsch", "גרמנית")),
+    ("it", "ltr", ("italian", "italiano", "איטלקית")),
+    ("pt", "ltr", ("portuguese", "português", "portugues", "פורטוגזית")),
+    ("ru", "ltr", ("russian", "русский", "רוסית")),
+    ("zh", "ltr", ("chinese", "mandarin", "中文", "סינית")),
+    ("ja", "ltr", ("japanese", "日本語", "יפנית")),
+    ("hi", "ltr", ("hindi", "हिन्दी", "הינדית")),
+)
+
+# Language name or code -> Locale
+LANGUAGE_TABLE = {
+    name: Locale(code, direction)
+    for code, direction, names in _LANGUAGES
+    for name in names + (code,)
+}
+
+# Note at the top of plain text resumes in RTL languages
+RTL_TEXT_NOTE = "<כיוון טקסט מימין לשמאל>\n\n"
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+_DIRECTION_TAG_PATTERN = re.compile(r"<(html|body)\b([^<>]*)>|</head\s*>", re.I)
+_RTL_BUNDLE_PATTERN = re.compile(r"<style data-bundle=\"([^\"]*)-rtl-[0-9a-f]+\">.*?</style>\n?", re.S)
+_LTR_BUNDLE_MARKER_PATTERN = re.compile(r"<style data-bundle=\"[^\"]*-ltr-[0-9a-f]+\">")
+_HEAD_END_PATTERN = re.compile(r"</head\s*>", re.I)
+_DIR_LANG_ATTRIBUTE_PATTERN = re.compile(r"\s+(?:dir|lang)\s*=\s*(?:\"[^\"]*\"|'[^']*'|[^\s>]*)", re.I)
+
+
+@lru_cache(maxsize=512)
+def resolve_locale(language):
+    """
+    Locale of a requested language - "Hebrew", "עברית", "he", "he-IL" and
+    "Hebrew (beta)" all resolve to Locale("he", "rtl")
+    """
+    if not language:
+        return DEFAULT_LOCALE
+    key = language.strip().lower()
+    locale = LANGUAGE_TABLE.get(key) or LANGUAGE_TABLE.get(re.split(r"[-_]", key, 1)[0])
+    if locale:
+        return locale
+    for word in _WORD_PATTERN.findall(key):
+        locale = LANGUAGE_TABLE.get(word)
+        if locale:
+            return locale
+    return DEFAULT_LOCALE
+
+
+def is_rtl(language):
+    return resolve_locale(language).direction == "rtl"
+
+
+def _rewrite_tag(name, attributes, locale):
+    """Opening tag with the dir / lang attributes of the locale (replacing the old ones)"""
+    attributes = _DIR_LANG_ATTRIBUTE_PATTERN.sub("", attributes)
+    direction = ' dir="rtl"' if locale.direction == "rtl" else ""
+    lang = f' lang="{locale.code}"' if name.lower() == "html" and locale.code else ""
+    return f"<{name}{direction}{lang}{attributes}>"
+
+
+def _rtl_document(html_fragment, locale, style_block):
+    """Complete RTL document around a bare HTML fragment"""
+    return (
+        "<!DOCTYPE html>\n"
+        f'<html dir="rtl" lang="{locale.code}">\n'
+        "<head>\n"
+        '    <meta charset="UTF-8">\n'
+        f"    {style_block}\n"
+        "</head>\n"
+        '<body dir="rtl">\n'
+        f"{html_fragment}\n"
+        "</body>\n"
+        "</html>"
+    )
+
+
+def _strip_rtl_bundle(content, resume_style=None):
+    """
+    Replace the RTL stylesheet of an earlier RTL pass in the <head> with the
+    LTR one (just remove it when the document has the LTR stylesheet already)
+    """
+    head_end = _HEAD_END_PATTERN.search(content)
+    if head_end is None:
+        return content
+    head = content[:head_end.start()]
+    rtl_bundle = _RTL_BUNDLE_PATTERN.search(head)
+    if rtl_bundle is None:
+        return content
+    replacement = ""
+    if not _LTR_BUNDLE_MARKER_PATTERN.search(head):
+        # Documents wrapped as RTL documents only had the RTL stylesheet
+        style = resume_style or (rtl_bundle.group(1) if rtl_bundle.group(1) != "all" else None)
+        replacement = get_bundle(style).style_block + "\n"
+    head = head[:rtl_bundle.start()] + replacement + _RTL_BUNDLE_PATTERN.sub("", head[rtl_bundle.end():])
+    return head + content[head_end.start():]
+
+
+def apply_direction(content, language, is_html=True, resume_style=None):
+    """
+    Switch a resume to the locale of `language`: lang / dir attributes on
+    <html> and <body> and the RTL stylesheet before </head> (removed again
+    for left-to-right languages - also for languages missing from the table,
+    which only lose the old lang attribute). Plain text resumes in RTL
+    languages get a direction note. Documents without a language or without
+    tags to rewrite are returned as is
+    """
+    if not language or not language.strip():
+        return content
+    locale = resolve_locale(language)
+
+    rtl = locale.direction == "rtl"
+    if not is_html:
+        if rtl and not content.startswith(RTL_TEXT_NOTE):
+            return RTL_TEXT_NOTE + content
+        return content
+
+    if not rtl:
+        content = _strip_rtl_bundle(content, resume_style)
+    bundle = get_bundle(resume_style, rtl=True) if rtl else None
+    # <html>, </head> and <body> come before the resume content - the scan stops after them
+    needed = {"html", "head", "body"} if rtl else {"html", "body"}
+    parts = []
+    position = 0
+    for match in _DIRECTION_TAG_PATTERN.finditer(content):
+        key = (match.group(1) or "head").lower()
+        if key not in needed:
+            continue
+        needed.discard(key)
+        parts.append(content[position:match.start()])
+        position = match.end()
+        if key == "head":
+            # The stylesheet is added once - documents that already have it are left alone
+            if f'data-bundle="{bundle.name}-{bundle.css_hash}"' not in content[:match.start()]:
+                parts.append(bundle.style_block + "\n")
+            parts.append(match.group())
+        else:
+            parts.append(_rewrite_tag(match.group(1), match.group(2), locale))
+        if not needed or key == "body":
+            break
+
+    if rtl and "html" in needed:
+        # A bare fragment - wrapped in a complete RTL document
+        return _rtl_document(content, locale, bundle.style_block)
+    parts.append(content[position:])
+    return "".join(parts)
@@ -0,0 +1,258 @@
+import os
+import re
+import sys
+import time
+import sqlite3
+import argparse
+import threading
+from sqlite_store import thread_connection
+from text_direction import LANGUAGE_TABLE
+
+# SQLite file shared by all uvicorn workers and the CLI (set CARA_TRANSLATION_MEMORY_PATH="" to disable)
+TRANSLATION_MEMORY_PATH = os.getenv(
+    'CARA_TRANSLATION_MEMORY_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'translation_memory.sqlite3')
+)
+
+# Entries not used for this many days are dropped
+TRANSLATION_MEMORY_TTL_DAYS = float(os.getenv('CARA_TRANSLATION_MEMORY_TTL_DAYS', '30'))
+
+# Number of entries kept before the least recently used ones are compacted away
+TRANSLATION_MEMORY_MAX_ENTRIES = int(os.getenv('CARA_TRANSLATION_MEMORY_MAX_ENTRIES', '200000'))
+
+# Run a compaction every N stored segments
+COMPACT_EVERY_SEGMENTS = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translation_memory (
+    source      TEXT NOT NULL,
+    language    TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    last_used   REAL NOT NULL,
+    hits        INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (source, language)
+);
+CREATE INDEX IF NOT EXISTS idx_translation_memory_last_used ON translation_memory (last_used);
+"""
+
+# SQLite's default limit on host parameters is 999
+_LOOKUP_CHUNK = 500
+
+
+def normalize_segment(text):
+    """Key form of a source segment - whitespace collapsed"""
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def normalize_language(language):
+    """
+    Key form of a target language - the ISO 639-1 code of a plain language name
+    ("Hebrew", "he" and "עברית" -> "he"), else the name itself, so variants
+    ("Simplified Chinese", "Brazilian Portuguese") keep their own entries
+    """
+    name = re.sub(r"\s+", " ", language).strip().lower()
+    locale = LANGUAGE_TABLE.get(name)
+    return locale.code if locale else name
+
+
+class TranslationMemory:
+    """
+    Durable store of translated segments keyed by (normalized source segment,
+    target language), shared by every user, worker process and the CLI.
+
+    Entries unused for `ttl_days` expire, and past `max_entries` the least
+    recently used ones are deleted. Lookups never write: hits are collected
+    in memory and written with the next store().
+
+    Lookup counters (per process) show how many segments - and characters -
+    were served without an LLM call.
+    """
+    def __init__(self, path=TRANSLATION_MEMORY_PATH, ttl_days=TRANSLATION_MEMORY_TTL_DAYS,
+                 max_entries=TRANSLATION_MEMORY_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl_days * 24 * 3600
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self.lookups = 0
+        self.hits = 0
+        self.chars_saved = 0
+        self._stored = 0
+        self._pending_hits = {}  # (source, language) -> (last used, hits) not written yet
+        self._connect()
+
+    def _connect(self):
+        return thread_connection(self._local, self.path, _SCHEMA)
+
+    def lookup(self, segments, language):
+        """Return {normalized segment: translation} for the segments already in the memory"""
+        language = normalize_language(language)
+        sources = list(dict.fromkeys(normalize_segment(segment) for segment in segments))
+        found = {}
+        try:
+            conn = self._connect()
+            for start in range(0, len(sources), _LOOKUP_CHUNK):
+                chunk = sources[start:start + _LOOKUP_CHUNK]
+                rows = conn.execute(
+                    f"SELECT source, translation FROM translation_memory WHERE language = ? AND last_used > ? "
+                    f"AND source IN ({','.join('?' * len(chunk))})",
+                    [language, time.time() - self.ttl] + chunk
+                ).fetchall()
+                found.update(rows)
+        except sqlite3.Error:
+            # The memory is an optimization - translate everything on errors
+            found = {}
+
+        now = time.time()
+        with self._stats_lock:
+            self.lookups += len(sources)
+            self.hits += len(found)
+            self.chars_saved += sum(len(source) for source in found)
+            for source in found:
+                hits = self._pending_hits.get((source, language), (now, 0))[1]
+                self._pending_hits[(source, language)] = (now, hits + 1)
+        return found
+
+    @property
+    def pending_hits(self):
+        """Number of entries read since the last flush_hits()"""
+        return len(self._pending_hits)
+
+    def flush_hits(self):
+        """Write the collected hits (last use time and hit counters) in one batch"""
+        with self._stats_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        if pending:
+            self._connect().executemany(
+                "UPDATE translation_memory SET hits = hits + ?, last_used = ? WHERE source = ? AND language = ?",
+                [(hits, last_used, source, language) for (source, language), (last_used, hits) in pending.items()]
+            )
+
+    def store(self, translations, language):
+        """
+        Add {source segment: translation} pairs to the memory. Writes the
+        collected hits too and every COMPACT_EVERY_SEGMENTS segments compacts
+        the memory - call it off the request path
+        """
+        if not translations:
+            return
+        language = normalize_language(language)
+        now = time.time()
+        try:
+            self._connect().executemany(
+                "INSERT OR REPLACE INTO translation_memory (source, language, translation, created_at, last_used, hits) "
+                "VALUES (?, ?, ?, ?, ?, 0)",
+                [(normalize_segment(source), language, translation, now, now) for source, translation in translations.items()]
+            )
+            self.flush_hits()
+        except sqlite3.Error:
+            return
+
+        with self._stats_lock:
+            should_compact = self._stored // COMPACT_EVERY_SEGMENTS != (self._stored + len(translations)) // COMPACT_EVERY_SEGMENTS
+            self._stored += len(translations)
+        if should_compact:
+            try:
+                self.compact()
+            except sqlite3.Error:
+                pass
+
+    def compact(self):
+        """Delete expired entries, then the least recently used ones until the memory fits max_entries"""
+        self.flush_hits()
+        conn = self._connect()
+        self._rekey_languages(conn)
+        removed = conn.execute("DELETE FROM translation_memory WHERE last_used <= ?", (time.time() - self.ttl,)).rowcount
+
+        total = conn.execute("SELECT COUNT(*) FROM translation_memory").fetchone()[0]
+        if total > self.max_entries:
+            # Shrink to 90% of the limit so we don't compact on every store
+            removed += conn.execute(
+                "DELETE FROM translation_memory WHERE rowid IN "
+                "(SELECT rowid FROM translation_memory ORDER BY last_used ASC LIMIT ?)",
+                (total - int(self.max_entries * 0.9),)
+            ).rowcount
+
+        if removed:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return removed
+
+    def _rekey_languages(self, conn):
+        """Move entries stored under a language name (before languages were keyed by code) to the code"""
+        for (language,) in conn.execute("SELECT DISTINCT language FROM translation_memory").fetchall():
+            key = normalize_language(language)
+            if key != language:
+                conn.execute("UPDATE OR IGNORE translation_memory SET language = ? WHERE language = ?", (key, language))
+                conn.execute("DELETE FROM translation_memory WHERE language = ?", (language,))
+
+    def purge(self, language=None):
+        """Delete entries (optionally only one target language), returns the number removed"""
+        self.flush_hits()
+        conn = self._connect()
+        if language:
+            return conn.execute("DELETE FROM translation_memory WHERE language = ?", (normalize_language(language),)).rowcount
+        return conn.execute("DELETE FROM translation_memory").rowcount
+
+    def stats(self):
+        """Hit rate of this process and size of the shared memory per language"""
+        self.flush_hits()
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT language, COUNT(*), COALESCE(SUM(hits), 0) FROM translation_memory GROUP BY language"
+        ).fetchall()
+        with self._stats_lock:
+            return {
+                "path": self.path,
+                "lookups": self.lookups,
+                "hits": self.hits,
+                "misses": self.lookups - self.hits,
+                "hit_rate": round(self.hits / self.lookups, 4) if self.lookups else 0.0,
+                "chars_saved": self.chars_saved,
+                "max_entries": self.max_entries,
+                "ttl_days": self.ttl / (24 * 3600),
+                "entries": sum(row[1] for row in rows),
+                "languages": {row[0]: {"entries": row[1], "hits": row[2]} for row in rows},
+            }
+
+
+def open_translation_memory():
+    """Open the configured translation memory, or return None if it is disabled or unavailable"""
+    if not TRANSLATION_MEMORY_PATH:
+        return None
+    try:
+        return TranslationMemory()
+    except sqlite3.Error:
+        return None
+
+
+def main(argv=None):
+    """Command line tool to inspect and purge the translation memory"""
+    parser = argparse.ArgumentParser(description="Inspect and purge the CARA translation memory")
+    parser.add_argument("--path", default=TRANSLATION_MEMORY_PATH, help="SQLite translation memory file")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="Show entry counts and hits per language")
+
+    purge_parser = subparsers.add_parser("purge", help="Delete entries")
+    purge_parser.add_argument("--language", help="Only this target language")
+
+    subparsers.add_parser("compact", help="Remove expired entries and shrink the memory to its entry limit")
+
+    args = parser.parse_args(argv)
+    memory = TranslationMemory(path=args.path)
+
+    if args.command == "stats":
+        stats = memory.stats()
+        print(f"{stats['path']}: {stats['entries']} entries (limit {stats['max_entries']}, unused entries expire after {stats['ttl_days']:g} days)")
+        for language, language_stats in sorted(stats["languages"].items()):
+            print(f"  {language}: {language_stats['entries']} entries, {language_stats['hits']} hits")
+    elif args.command == "purge":
+        print(f"Removed {memory.purge(language=args.language)} entries")
+    elif args.command == "compact":
+        print(f"Removed {memory.compact()} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())